@@ -0,0 +1,87 @@
+"""
+Benchmark for `brutils.batch.validate`.
+
+A list of random CPFs, mostly valid, is validated with `is_valid_cpf` in a
+loop and with `brutils.batch.validate` with a growing number of worker
+processes, and the number of CPFs checked per second is reported. The same
+CPFs are then validated from a memory-mapped file of fixed-width records,
+which the workers read directly.
+
+Usage:
+    python -m benchmarks.batch_validation [--size N] [--chunk-size N]
+                                          [--workers N ...]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import numpy
+
+from brutils import batch
+from brutils.cpf import generate, is_valid
+
+
+def build_corpus(size, seed=0):
+    random.seed(seed)
+    corpus = [generate() for _ in range(size)]
+    for index in range(0, size, 10):
+        corpus[index] = corpus[index][::-1]
+    return corpus
+
+
+def throughput(function, size):
+    start = time.perf_counter()
+    function()
+    return size / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, 4, os.cpu_count() or 1}),
+    )
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.size)
+    print(f"{args.size:,} CPFs, chunks of {args.chunk_size:,}")
+
+    ops = throughput(lambda: list(map(is_valid, corpus)), args.size)
+    print(f"{'is_valid_cpf loop':<32}{ops:>14,.0f}/s")
+
+    for workers in args.workers:
+        ops = throughput(
+            lambda: sum(
+                batch.validate("cpf", corpus, workers, args.chunk_size)
+            ),
+            args.size,
+        )
+        print(f"{f'batch.validate, {workers} workers':<32}{ops:>14,.0f}/s")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "cpfs.bin")
+        records = numpy.memmap(path, dtype="S11", mode="w+", shape=(args.size,))
+        records[:] = corpus
+        records.flush()
+        records = numpy.memmap(path, dtype="S11", mode="r")
+
+        for workers in args.workers:
+            ops = throughput(
+                lambda: sum(
+                    batch.validate("cpf", records, workers, args.chunk_size)
+                ),
+                args.size,
+            )
+            label = f"memmap, {workers} workers"
+            print(f"{label:<32}{ops:>14,.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
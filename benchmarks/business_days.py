@@ -0,0 +1,94 @@
+"""
+Throughput benchmark for the holiday and business day functions of
+`brutils.date_utils`.
+
+A corpus of random dates between 2000 and 2035, with random UFs, is checked
+with `is_holiday` and `is_business_day`, and moved with `add_business_days`
+and `business_days_between`. The number of calls per second of each
+function is reported, with warm caches, as well as the number of dates per
+second checked by `is_holiday_many` and `is_business_day_many` when NumPy
+is installed.
+
+Usage:
+    python -m benchmarks.business_days [--dates N] [--repeat N]
+"""
+
+import argparse
+import datetime
+import random
+import timeit
+
+from brutils.date_utils import (
+    add_business_days,
+    business_days_between,
+    is_business_day,
+    is_business_day_many,
+    is_holiday,
+    is_holiday_many,
+)
+
+UFS = (None, "SP", "RJ", "MG", "BA", "RS")
+
+
+def build_corpus(size, seed=0):
+    rng = random.Random(seed)
+    start = datetime.date(2000, 1, 1).toordinal()
+    end = datetime.date(2035, 12, 31).toordinal()
+    return [
+        (
+            datetime.datetime.fromordinal(rng.randint(start, end)),
+            rng.randint(-30, 30),
+            rng.choice(UFS),
+        )
+        for _ in range(size)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--dates", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.dates)
+    end = datetime.datetime(2036, 1, 1)
+    print(f"dates: {len(corpus)}")
+
+    for name, function in (
+        ("is_holiday", lambda: [is_holiday(d, uf) for d, _, uf in corpus]),
+        (
+            "is_business_day",
+            lambda: [is_business_day(d, uf) for d, _, uf in corpus],
+        ),
+        (
+            "add_business_days",
+            lambda: [add_business_days(d, n, uf) for d, n, uf in corpus],
+        ),
+        (
+            "business_days_between",
+            lambda: [business_days_between(d, end, uf) for d, _, uf in corpus],
+        ),
+    ):
+        # The first run fills the caches of holidays and business days
+        function()
+        best = min(timeit.repeat(function, number=1, repeat=args.repeat))
+        print(f"{name + ':':<23}{len(corpus) / best:>12,.0f} calls/s")
+
+    try:
+        import numpy
+    except ImportError:
+        return
+
+    dates = numpy.array([d for d, _, _ in corpus], dtype="datetime64[D]")
+    dates = numpy.tile(dates, 50)
+    for name, function in (
+        ("is_holiday_many", lambda: is_holiday_many(dates, "SP")),
+        ("is_business_day_many", lambda: is_business_day_many(dates, "SP")),
+    ):
+        function()
+        best = min(timeit.repeat(function, number=1, repeat=args.repeat))
+        print(f"{name + ':':<23}{len(dates) / best:>12,.0f} dates/s")
+
+
+if __name__ == "__main__":
+    main()
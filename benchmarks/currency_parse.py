@@ -0,0 +1,58 @@
+"""
+Throughput benchmark for `brutils.currency.parse_currency_many`.
+
+A corpus of amounts formatted as Brazilian currency, in every negative
+style of `CurrencyFormatter` and without the symbol, is parsed in strict and
+lenient modes, and the number of values parsed per second is reported.
+
+Usage:
+    python -m benchmarks.currency_parse [--values N] [--repeat N]
+"""
+
+import argparse
+import random
+import timeit
+
+from brutils.currency import CurrencyFormatter, parse_currency_many
+
+FORMATTERS = (
+    CurrencyFormatter(integer_cents=True),
+    CurrencyFormatter(integer_cents=True, negative_style="before_symbol"),
+    CurrencyFormatter(integer_cents=True, negative_style="parentheses"),
+    CurrencyFormatter(symbol="", integer_cents=True),
+)
+
+
+def build_corpus(size, seed=0):
+    rng = random.Random(seed)
+    return [
+        rng.choice(FORMATTERS).format(
+            rng.randrange(-(10 ** rng.randint(1, 11)), 10**11)
+        )
+        for _ in range(size)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--values", type=int, default=500_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.values)
+    print(f"values:  {len(corpus)}")
+
+    for strict in (True, False):
+        best = min(
+            timeit.repeat(
+                lambda: parse_currency_many(corpus, strict=strict),
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        mode = "strict:" if strict else "lenient:"
+        print(f"{mode:<9}{best:.3f}s ({len(corpus) / best:,.0f} values/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark for the pandas and Polars integrations of `brutils`.
+
+A column of documents, mostly valid and with some mistakes, is validated
+and formatted with the `br` accessor of pandas and the `br` namespace of
+Polars, and with the scalar functions called per row (`Series.apply` and
+`Expr.map_elements`), and the number of rows processed per second is
+reported. Polars is skipped if it is not installed.
+
+Usage:
+    python -m benchmarks.dataframe_accessors [--rows N] [--repeat N]
+"""
+
+import argparse
+import random
+import timeit
+
+import pandas
+
+import brutils
+import brutils.integrations.pandas  # noqa: F401
+from brutils.integrations.polars import polars
+
+# Column, the scalar function and the name of the accessor method
+CASES = (
+    ("cpf", brutils.is_valid_cpf, "is_valid_cpf"),
+    ("cpf", brutils.format_cpf, "format_cpf"),
+    ("cnpj", brutils.is_valid_cnpj, "is_valid_cnpj"),
+    ("cnpj", brutils.format_cnpj, "format_cnpj"),
+    ("pis", brutils.is_valid_pis, "is_valid_pis"),
+    ("phone", brutils.is_valid_phone, "is_valid_phone"),
+    ("phone", brutils.remove_symbols_phone, "remove_symbols_phone"),
+)
+
+
+def build_corpus(size, seed=0):
+    random.seed(seed)
+    rng = random.Random(seed)
+
+    def column(generate):
+        values = [generate() for _ in range(size)]
+        for index in range(0, size, 10):
+            values[index] = values[index][::-1]
+        return values
+
+    return {
+        "cpf": column(brutils.generate_cpf),
+        "cnpj": column(brutils.generate_cnpj),
+        "pis": column(brutils.generate_pis),
+        "phone": [
+            brutils.format_phone(brutils.generate_phone())
+            if rng.random() < 0.5
+            else brutils.generate_phone()
+            for _ in range(size)
+        ],
+    }
+
+
+def rate(function, rows, repeat):
+    return rows / min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.rows)
+    frame = pandas.DataFrame(corpus)
+    polars_frame = polars.DataFrame(corpus) if polars is not None else None
+
+    print(
+        f"{'function':<24}{'apply':>12}{'.br':>12}{'speedup':>9}"
+        + (f"{'map_elements':>14}{'.br':>12}{'speedup':>9}" if polars else "")
+    )
+
+    for column, function, method in CASES:
+        series = frame[column]
+        apply = rate(lambda: series.apply(function), args.rows, args.repeat)
+        accessor = rate(
+            lambda: getattr(series.br, method)(), args.rows, args.repeat
+        )
+        line = f"{method:<24}{apply:>12,.0f}{accessor:>12,.0f}"
+        line += f"{accessor / apply:>8.1f}x"
+
+        if polars_frame is not None:
+            expression = polars.col(column)
+            elements = rate(
+                lambda: polars_frame.select(
+                    expression.map_elements(function, skip_nulls=False)
+                ),
+                args.rows,
+                args.repeat,
+            )
+            namespace = rate(
+                lambda: polars_frame.select(getattr(expression.br, method)()),
+                args.rows,
+                args.repeat,
+            )
+            line += f"{elements:>14,.0f}{namespace:>12,.0f}"
+            line += f"{namespace / elements:>8.1f}x"
+
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
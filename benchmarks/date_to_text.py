@@ -0,0 +1,54 @@
+"""
+Throughput benchmark for `brutils.date.convert_date_to_text` and
+`brutils.date.convert_dates_to_text`.
+
+A corpus of dates in every supported format, with the years concentrated in
+a few decades as in real documents, is converted to text one date at a
+time and in batch, and the number of dates converted per second is
+reported.
+
+Usage:
+    python -m benchmarks.date_to_text [--dates N] [--repeat N]
+"""
+
+import argparse
+import datetime
+import random
+import timeit
+
+from brutils.date import convert_date_to_text, convert_dates_to_text
+
+FORMATS = ("%d/%m/%Y", "%d.%m.%Y", "%d-%m-%Y", "%Y-%m-%d")
+
+
+def build_corpus(size, seed=0):
+    rng = random.Random(seed)
+    start = datetime.date(1960, 1, 1).toordinal()
+    end = datetime.date(2030, 12, 31).toordinal()
+    return [
+        datetime.date.fromordinal(rng.randint(start, end)).strftime(
+            rng.choice(FORMATS)
+        )
+        for _ in range(size)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--dates", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.dates)
+    print(f"dates:   {len(corpus)}")
+
+    for name, function in (
+        ("single:", lambda: [convert_date_to_text(date) for date in corpus]),
+        ("batch:", lambda: convert_dates_to_text(corpus)),
+    ):
+        best = min(timeit.repeat(function, number=1, repeat=args.repeat))
+        print(f"{name:<9}{best:.3f}s ({len(corpus) / best:,.0f} dates/s)")
+
+
+if __name__ == "__main__":
+    main()
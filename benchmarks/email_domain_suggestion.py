@@ -0,0 +1,77 @@
+"""
+Throughput benchmark for `brutils.email.suggest_domain`.
+
+A corpus of domains is built from the bundled common domains, most of them
+with one or two random typos (a deletion, an insertion, a substitution or
+a transposition of adjacent characters), and the number of domains looked
+up per second is reported, with and without the batch form, which only
+looks up each distinct domain once.
+
+Usage:
+    python -m benchmarks.email_domain_suggestion [--domains N] [--repeat N]
+"""
+
+import argparse
+import random
+import string
+import timeit
+
+from brutils.data.email_domains import EMAIL_DOMAINS
+from brutils.email import suggest_domain, suggest_domain_many
+
+LETTERS = string.ascii_lowercase
+
+
+def add_typo(domain, rng):
+    position = rng.randrange(len(domain) - 1)
+    kind = rng.randrange(4)
+    if kind == 0:
+        return domain[:position] + domain[position + 1 :]
+    if kind == 1:
+        return domain[:position] + rng.choice(LETTERS) + domain[position:]
+    if kind == 2:
+        return domain[:position] + rng.choice(LETTERS) + domain[position + 1 :]
+    return (
+        domain[:position]
+        + domain[position + 1]
+        + domain[position]
+        + domain[position + 2 :]
+    )
+
+
+def build_corpus(size, seed=0):
+    rng = random.Random(seed)
+    corpus = []
+
+    for _ in range(size):
+        domain = rng.choice(EMAIL_DOMAINS)
+        for _ in range(rng.choice((0, 1, 1, 2))):
+            domain = add_typo(domain, rng)
+        corpus.append(f"user@{domain}")
+
+    return corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--domains", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.domains)
+    suggested = sum(1 for domain in suggest_domain_many(corpus) if domain)
+    print(f"domains:   {len(corpus)} ({len(set(corpus))} distinct)")
+    print(f"suggested: {suggested} ({suggested / len(corpus):.1%})")
+
+    for name, function in (
+        ("single", lambda: [suggest_domain(email) for email in corpus]),
+        ("batch", lambda: suggest_domain_many(corpus)),
+    ):
+        best = min(timeit.repeat(function, number=1, repeat=args.repeat))
+        print(
+            f"{name + ':':<11}{best:.3f}s ({len(corpus) / best:,.0f} domains/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
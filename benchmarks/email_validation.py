@@ -0,0 +1,101 @@
+"""
+Benchmark for `brutils.email.is_valid` and `is_valid_many`.
+
+A list of random addresses, mostly valid and with some common mistakes, is
+validated and the number of addresses checked per second is reported. Then
+pathological inputs (long runs of dots and hyphens, and many "@") of
+growing length are validated one by one, to show that the time grows
+linearly with the length. The previous implementation of the validator,
+with a backtracking regular expression, is timed on the same inputs, for
+reference.
+
+Usage:
+    python -m benchmarks.email_validation [--emails N] [--repeat N]
+"""
+
+import argparse
+import random
+import re
+import string
+import timeit
+
+from brutils.email import is_valid, is_valid_many
+
+
+def previous_is_valid(email):
+    pattern = re.compile(
+        r"^(?![.])[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+    )
+    return isinstance(email, str) and re.match(pattern, email) is not None
+
+
+DOMAINS = ("gmail.com", "hotmail.com", "uol.com.br", "empresa.com.br")
+MISTAKES = (
+    lambda email: email.replace("@", ""),
+    lambda email: email.replace("@", "@@"),
+    lambda email: email.replace(".com", ".c"),
+    lambda email: "." + email,
+    lambda email: email.replace("@", " @"),
+)
+PATHOLOGICAL = {
+    "dots": lambda size: "a@" + "." * size + "a",
+    "hyphens": lambda size: "a@" + "-" * size + ".a",
+    "dots and hyphens": lambda size: "a" + ".-" * size + "@a.a-",
+    "at signs": lambda size: "a" + "@a" * size,
+}
+
+
+def build_corpus(size, seed=0):
+    rng = random.Random(seed)
+    corpus = []
+
+    for _ in range(size):
+        local = "".join(
+            rng.choice(string.ascii_lowercase + string.digits + "._")
+            for _ in range(rng.randint(1, 12))
+        ).lstrip(".")
+        email = f"{local or 'a'}@{rng.choice(DOMAINS)}"
+        if rng.random() < 0.1:
+            email = rng.choice(MISTAKES)(email)
+        corpus.append(email)
+
+    return corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--emails", type=int, default=500_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.emails)
+    valid = sum(is_valid_many(corpus))
+    print(f"emails:  {len(corpus)} ({valid / len(corpus):.1%} valid)")
+
+    for name, function in (
+        ("is_valid_many", lambda: is_valid_many(corpus)),
+        ("is_valid", lambda: [is_valid(email) for email in corpus]),
+        ("previous", lambda: [previous_is_valid(email) for email in corpus]),
+    ):
+        best = min(timeit.repeat(function, number=1, repeat=args.repeat))
+        print(
+            f"{name + ':':<15}{best:.3f}s ({len(corpus) / best:,.0f} emails/s)"
+        )
+
+    print()
+    print(f"{'input':<17}{'length':>9}{'is_valid':>12}{'previous':>12}")
+    for name, build in PATHOLOGICAL.items():
+        for size in (1_000, 10_000, 100_000):
+            email = build(size)
+            times = [
+                min(timeit.repeat(lambda: check(email), number=1, repeat=3))
+                for check in (is_valid, previous_is_valid)
+            ]
+            print(
+                f"{name:<17}{len(email):>9}"
+                f"{times[0] * 1000:>10.3f}ms{times[1] * 1000:>10.3f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
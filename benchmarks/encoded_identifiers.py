@@ -0,0 +1,88 @@
+"""
+Benchmark for the uint64 encoding of CPF, CNPJ and PIS.
+
+A list of CPFs, with a share of duplicates and of invalid ones, is encoded
+with `cpf.encode_many`, from a list of strings and from a NumPy array of
+fixed-width strings, and deduplicated with `encoded.unique`, measuring the
+time of each and comparing with `cpf.is_valid` and a `set` of strings. The
+memory of the encoded array is then compared with the memory of the same
+CPFs as a list of strings.
+
+Usage:
+    python -m benchmarks.encoded_identifiers [--size N]
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+
+import numpy
+
+from brutils import cpf, encoded
+
+
+def timed(function, *args):
+    """
+    Runs a function, returning its time and its result.
+    """
+
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def memory(build):
+    """
+    Returns the bytes allocated by `build`, and its result.
+    """
+
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    random.seed(0)
+    distinct = [cpf.generate() for _ in range(args.size // 2)]
+    values = [random.choice(distinct) for _ in range(args.size)]
+    for position in range(0, args.size, 20):
+        values[position] = values[position][:-1] + "x"
+    array = numpy.array(values, dtype="U11")
+    print(f"{args.size:,} CPFs, 5% invalid, about half duplicated")
+
+    print(f"{'':<28}{'time':>10}{'values/s':>14}")
+    for label, function, argument in (
+        ("is_valid", lambda xs: [cpf.is_valid(x) for x in xs], values),
+        ("encode_many (list)", cpf.encode_many, values),
+        ("encode_many (U11 array)", cpf.encode_many, array),
+        (
+            "set of valid strings",
+            lambda xs: {x for x in xs if cpf.is_valid(x)},
+            values,
+        ),
+        (
+            "encode_many + unique",
+            lambda xs: encoded.unique(cpf.encode_many(xs), in_place=True),
+            values,
+        ),
+    ):
+        elapsed, _ = timed(function, argument)
+        print(f"{label:<28}{elapsed:>9.2f}s{args.size / elapsed:>14,.0f}")
+
+    print()
+    print(f"{'':<28}{'bytes per CPF':>14}")
+    size, _ = memory(array.tolist)
+    print(f"{'list of str':<28}{size / args.size:>14.0f}")
+    size, _ = memory(lambda: cpf.encode_many(array))
+    print(f"{'uint64 array':<28}{size / args.size:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
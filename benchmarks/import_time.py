@@ -0,0 +1,107 @@
+"""
+Import time benchmark for `brutils`.
+
+Each statement is run in a fresh interpreter with `python -X importtime`,
+and the time spent importing modules, minus the time spent by an empty
+interpreter (`site` and the modules it imports), is reported, with the
+modules that took the longest. The process exits with status 1 if
+`import brutils` followed by the use of a validator takes longer than the
+budget.
+
+Usage:
+    python -m benchmarks.import_time [--budget MS] [--repeat N]
+"""
+
+import argparse
+import subprocess
+import sys
+
+STATEMENTS = (
+    "import brutils",
+    "from brutils import is_valid_cpf",
+    "from brutils import is_holiday",
+    "from brutils import *",
+)
+
+# The statement that the budget applies to, the usual case of an
+# application that only validates documents
+BUDGET_STATEMENT = "from brutils import is_valid_cpf"
+
+
+def import_times(statement):
+    """
+    Runs a statement with `-X importtime` and returns the self and the
+    cumulative import times, in microseconds, of each module.
+    """
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    times = {}
+
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, cumulative, name = line[len("import time:") :].split("|")
+        # Only the modules imported at the top level are counted in the
+        # total, as their cumulative times include the nested imports
+        times[name.strip()] = (
+            int(self_time),
+            int(cumulative) if not name.startswith("  ") else 0,
+        )
+
+    return times
+
+
+def measure(statement, baseline, repeat):
+    """
+    Returns the best total import time of a statement, in milliseconds,
+    and the import times of the modules it imported in that run.
+    """
+
+    best_total, best_times = None, None
+    for _ in range(repeat):
+        times = import_times(statement)
+        total = sum(cumulative for _, cumulative in times.values()) / 1000
+        if best_total is None or total < best_total:
+            best_total, best_times = total, times
+
+    return best_total - baseline, best_times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--budget", type=float, default=20.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    baseline, baseline_times = measure("pass", 0, args.repeat)
+    exceeded = False
+
+    for statement in STATEMENTS:
+        total, times = measure(statement, baseline, args.repeat)
+        slowest = sorted(
+            (
+                (self_time, name)
+                for name, (self_time, _) in times.items()
+                if name not in baseline_times
+            ),
+            reverse=True,
+        )[:5]
+
+        print(f"{statement}: {total:.1f}ms")
+        for self_time, name in slowest:
+            print(f"    {self_time / 1000:>6.1f}ms  {name}")
+
+        if statement == BUDGET_STATEMENT and total > args.budget:
+            exceeded = True
+            print(f"    over the budget of {args.budget:.1f}ms")
+
+    sys.exit(1 if exceeded else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Overhead benchmark for the instrumentation of `brutils`.
+
+The instrumentation added to each call of the functions that use web
+services (the start time and the emission of its event) is timed on its
+own, with no listener registered, with a listener that does nothing and
+with a `Metrics` instance, and compared with the time of a call against
+the local stub server (see `benchmarks.stub_server`), the fastest those
+calls can be. The process exits with status 1 if the disabled
+instrumentation costs more than the budget, as a fraction of that call.
+
+Usage:
+    python -m benchmarks.instrumentation [--calls N] [--repeat N]
+                                         [--budget F]
+"""
+
+import argparse
+import sys
+import timeit
+from time import perf_counter
+
+from benchmarks.stub_server import stub_server
+from brutils.ibge.municipality import get_municipality_by_code
+from brutils.instrumentation import (
+    Metrics,
+    _emit,
+    add_event_listener,
+    remove_event_listener,
+)
+
+
+def instrumentation():
+    # The same steps as in an instrumented call
+    start = perf_counter()
+    _emit("get_municipality_by_code", "ok", start, code="3550308")
+
+
+def ignore(event):
+    pass
+
+
+def best_time(function, calls, repeat):
+    """
+    Returns the best time of a call of a function, in nanoseconds.
+    """
+
+    return (
+        min(timeit.repeat(function, number=calls, repeat=repeat)) / calls * 1e9
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=0.001)
+    args = parser.parse_args()
+
+    with stub_server():
+        request = best_time(
+            lambda: get_municipality_by_code("3550308"),
+            max(args.calls // 1000, 10),
+            args.repeat,
+        )
+    print(f"get_municipality_by_code (stub): {request / 1000:>10.1f}us")
+
+    disabled = None
+    for label, listener in (
+        ("disabled", None),
+        ("no-op listener", ignore),
+        ("Metrics", Metrics()),
+    ):
+        if listener is not None:
+            add_event_listener(listener)
+        elapsed = best_time(instrumentation, args.calls, args.repeat)
+        if listener is not None:
+            remove_event_listener(listener)
+
+        disabled = elapsed if disabled is None else disabled
+        print(
+            f"instrumentation, {label + ':':<16}{elapsed:>10.0f}ns"
+            f"{elapsed / request:>10.3%} of a call"
+        )
+
+    if disabled / request > args.budget:
+        print(f"disabled instrumentation over the budget of {args.budget:.1%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
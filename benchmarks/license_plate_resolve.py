@@ -0,0 +1,69 @@
+"""
+Throughput benchmark for `brutils.license_plate.resolve`.
+
+A corpus of OCR-like reads is built from randomly generated plates, with up
+to two characters replaced by a commonly confused one (O/0, I/1, B/8, S/5,
+...), and the number of reads resolved per second is reported.
+
+Usage:
+    python -m benchmarks.license_plate_resolve [--reads N] [--repeat N]
+"""
+
+import argparse
+import random
+import timeit
+
+from brutils.license_plate import generate, resolve
+
+CONFUSIONS = {
+    "O": "0",
+    "0": "O",
+    "I": "1",
+    "1": "I",
+    "B": "8",
+    "8": "B",
+    "S": "5",
+    "5": "S",
+    "Z": "2",
+    "2": "Z",
+}
+
+
+def build_corpus(size, seed=0):
+    # `generate` draws from the global random generator
+    random.seed(seed)
+    rng = random
+    corpus = []
+
+    for _ in range(size):
+        plate = list(generate(rng.choice(("LLLNNNN", "LLLNLNN"))))
+        for position in rng.sample(range(7), rng.randint(0, 2)):
+            plate[position] = CONFUSIONS.get(plate[position], plate[position])
+        corpus.append("".join(plate))
+
+    return corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--reads", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.reads)
+    best = min(
+        timeit.repeat(
+            lambda: [resolve(read) for read in corpus],
+            number=1,
+            repeat=args.repeat,
+        )
+    )
+    resolved = sum(1 for read in corpus if resolve(read))
+
+    print(f"reads:    {len(corpus)}")
+    print(f"resolved: {resolved} ({resolved / len(corpus):.1%})")
+    print(f"best:     {best:.3f}s ({len(corpus) / best:,.0f} reads/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark of the pt-BR number-to-words engine against `num2words`.
+
+A corpus of random amounts is converted to words with
+`brutils.number_words._to_words` and with `num2words(n, lang="pt_BR")`,
+and the number of conversions per second of each one is reported. The
+cache of `_to_words` is cleared before every run, so repeated numbers do
+not skew the results.
+
+Usage:
+    python -m benchmarks.number_words [--numbers N] [--repeat N]
+"""
+
+import argparse
+import random
+import timeit
+
+from num2words import num2words
+
+from brutils.number_words import _to_words
+
+
+def build_corpus(size, seed=0):
+    rng = random.Random(seed)
+    return [rng.randrange(10 ** rng.randint(1, 13)) for _ in range(size)]
+
+
+def run_native(corpus):
+    _to_words.cache_clear()
+    return [_to_words(number) for number in corpus]
+
+
+def run_num2words(corpus):
+    return [num2words(number, lang="pt_BR") for number in corpus]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--numbers", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.numbers)
+    assert run_native(corpus) == run_num2words(corpus)
+
+    results = {}
+    for name, function in (
+        ("brutils", run_native),
+        ("num2words", run_num2words),
+    ):
+        results[name] = min(
+            timeit.repeat(
+                lambda: function(corpus), number=1, repeat=args.repeat
+            )
+        )
+        print(
+            f"{name + ':':<11}{results[name]:.3f}s "
+            f"({len(corpus) / results[name]:,.0f} numbers/s)"
+        )
+
+    print(f"speedup:   {results['num2words'] / results['brutils']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
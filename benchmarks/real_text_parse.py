@@ -0,0 +1,55 @@
+"""
+Throughput benchmark for `brutils.currency.parse_real_text_many`.
+
+A corpus of amounts written out by `convert_real_to_text` is parsed back,
+the round trip is checked, and the number of texts parsed per second and
+of characters processed per second are reported.
+
+Usage:
+    python -m benchmarks.real_text_parse [--texts N] [--repeat N]
+"""
+
+import argparse
+import random
+import timeit
+from decimal import Decimal
+
+from brutils.currency import convert_real_to_text, parse_real_text_many
+
+
+def build_corpus(size, seed=0):
+    rng = random.Random(seed)
+    amounts = [
+        Decimal(rng.randrange(-(10 ** rng.randint(1, 8)), 10**14)).scaleb(-2)
+        for _ in range(size)
+    ]
+    return amounts, [convert_real_to_text(amount) for amount in amounts]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--texts", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    amounts, corpus = build_corpus(args.texts)
+    assert parse_real_text_many(corpus) == amounts
+
+    best = min(
+        timeit.repeat(
+            lambda: parse_real_text_many(corpus),
+            number=1,
+            repeat=args.repeat,
+        )
+    )
+    characters = sum(map(len, corpus))
+
+    print(f"texts: {len(corpus)} ({characters:,} characters)")
+    print(
+        f"best:  {best:.3f}s ({len(corpus) / best:,.0f} texts/s, "
+        f"{characters / best / 1e6:.1f}M characters/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Local stand-in for the web services used by `brutils`.
+
+A small HTTP server answers the requests of the ViaCEP and IBGE APIs with
+canned responses in the same format, so that the functions that call them
+can be benchmarked without network access and without hitting the real
+services. While the server runs, the `urlopen` used by `brutils.cep` and
+`brutils.ibge.municipality` is replaced by one that sends the requests to
+it instead.
+
+Usage:
+    with stub_server():
+        get_address_from_cep("01310200")
+"""
+
+import gzip
+import json
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+import brutils.cep
+import brutils.ibge.municipality
+from brutils.ibge.municipality import _load_cities_code
+
+# Hosts of the real services, replaced by the address of the stub server
+HOSTS = ("https://viacep.com.br", "https://servicodados.ibge.gov.br")
+
+# Modules whose `urlopen` is redirected to the stub server
+MODULES = (brutils.cep, brutils.ibge.municipality)
+
+# CEP that ViaCEP answers with an error, as if it did not exist
+MISSING_CEP = "00000000"
+
+# Street that ViaCEP does not find in any city
+MISSING_STREET = "Rua Inexistente"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        parts = [unquote(part) for part in self.path.strip("/").split("/")]
+
+        if parts[0] == "ws" and len(parts) == 3:
+            # ViaCEP: /ws/{cep}/json/
+            cep = parts[1]
+            body = (
+                {"erro": "true"}
+                if cep == MISSING_CEP
+                else address(cep=f"{cep[:5]}-{cep[5:]}")
+            )
+            self.send_json(body)
+        elif parts[0] == "ws" and len(parts) == 5:
+            # ViaCEP: /ws/{uf}/{city}/{street}/json/
+            uf, city, street = parts[1:4]
+            body = (
+                []
+                if street == MISSING_STREET
+                else [address(uf=uf, localidade=city, logradouro=street)]
+            )
+            self.send_json(body)
+        elif parts[:4] == ["api", "v1", "localidades", "municipios"]:
+            # IBGE: /api/v1/localidades/municipios/{code}, gzipped
+            municipality = get_municipalities().get(parts[4])
+            body = (
+                [] if municipality is None else municipality_data(*municipality)
+            )
+            self.send_json(body, compress=True)
+        else:
+            self.send_error(404)
+
+    def send_json(self, body, compress=False):
+        content = json.dumps(body).encode()
+        if compress:
+            content = gzip.compress(content)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if compress:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def address(**fields):
+    data = {
+        "cep": "01310-200",
+        "logradouro": "Avenida Paulista",
+        "complemento": "de 1512 a 2132 - lado par",
+        "bairro": "Bela Vista",
+        "localidade": "São Paulo",
+        "uf": "SP",
+        "ibge": "3550308",
+        "gia": "1004",
+        "ddd": "11",
+        "siafi": "7107",
+    }
+    data.update(fields)
+    return data
+
+
+def municipality_data(name, uf):
+    return {
+        "nome": name,
+        "microrregiao": {"mesorregiao": {"UF": {"sigla": uf}}},
+    }
+
+
+@lru_cache(maxsize=None)
+def get_municipalities():
+    """
+    Returns the (normalized) name and the UF of each municipality, by its
+    IBGE code.
+    """
+
+    return {
+        code: (name, uf)
+        for uf, cities_code in _load_cities_code().items()
+        for name, code in cities_code.items()
+    }
+
+
+@contextmanager
+def stub_server():
+    """
+    Runs the stub server in a background thread and redirects the requests
+    of `brutils` to it, until the context is exited.
+    """
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    originals = {module: module.urlopen for module in MODULES}
+
+    def redirect(urlopen):
+        def redirected_urlopen(url, *args, **kwargs):
+            for host in HOSTS:
+                url = url.replace(host, base_url)
+            return urlopen(url, *args, **kwargs)
+
+        return redirected_urlopen
+
+    try:
+        for module, urlopen in originals.items():
+            module.urlopen = redirect(urlopen)
+        yield base_url
+    finally:
+        for module, urlopen in originals.items():
+            module.urlopen = urlopen
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,543 @@
+"""
+Benchmark suite for every public function of `brutils`.
+
+Each function in `brutils.__all__` is called over a generated corpus of
+realistic inputs (valid, invalid, formatted and dirty documents, dates,
+amounts, addresses, ...), and its throughput (calls per second) and the
+median (p50) and 99th percentile (p99) of the time of each call are
+reported. Functions that take many values at once are called with batches
+of values. The functions that call web services are run against a local
+stub server (see `benchmarks.stub_server`).
+
+The results can be saved as a baseline, in a JSON file, and later runs are
+compared with it: the suite exits with status 1 if the throughput of any
+function dropped by more than the threshold. Baselines depend on the
+machine, so they should only be compared on the machine they were saved
+on.
+
+Usage:
+    python -m benchmarks.suite [--size N] [--repeat N] [--filter TEXT]
+                               [--baseline PATH] [--save] [--threshold F]
+                               [--no-network]
+"""
+
+import argparse
+import contextlib
+import datetime
+import json
+import pathlib
+import random
+import string
+import sys
+import time
+from decimal import Decimal
+
+import brutils
+from benchmarks import (
+    currency_parse,
+    email_domain_suggestion,
+    email_validation,
+    license_plate_resolve,
+)
+from benchmarks.stub_server import MISSING_CEP, MISSING_STREET, stub_server
+from brutils.ibge.municipality import _load_cities_code
+
+BASELINE = pathlib.Path(__file__).parent / "baseline.json"
+
+# Number of values in each call of the functions that take many values
+BATCH_SIZE = 1_000
+
+# Functions that return generators, which are consumed so that the values
+# are actually computed
+GENERATORS = {"parse_stream_legal_process", "sample_unique_license_plate"}
+
+UFS = ("SP", "RJ", "MG", "BA", "RS", "PR", "PE", "CE", "PA", "GO")
+
+DIRTY_CHARACTERS = string.digits + string.ascii_letters + " .-/()\t\n"
+
+
+def mutate(value, rng):
+    """
+    Replaces a random digit of a value by another one, which usually makes
+    a document invalid.
+    """
+
+    positions = [i for i, char in enumerate(value) if char.isdigit()]
+    position = rng.choice(positions)
+    digit = str((int(value[position]) + rng.randint(1, 9)) % 10)
+    return value[:position] + digit + value[position + 1 :]
+
+
+def dirty(value, rng):
+    """
+    Surrounds a value with whitespace and random symbols, as in copied and
+    pasted or badly typed inputs.
+    """
+
+    noise = "".join(rng.choice(" .-/") for _ in range(rng.randint(1, 3)))
+    return f" {noise}{value}{noise} " if rng.random() < 0.5 else noise + value
+
+
+def garbage(rng):
+    return "".join(
+        rng.choice(DIRTY_CHARACTERS) for _ in range(rng.randint(0, 20))
+    )
+
+
+def documents(generate, format, size, rng):
+    """
+    Builds a corpus of documents: valid ones, without and with symbols,
+    invalid ones, dirty ones and garbage, in equal parts and shuffled.
+
+    Returns:
+        dict[str, list[str]]: The valid, formatted, invalid, dirty and
+                              mixed documents.
+    """
+
+    valid = [generate() for _ in range(size)]
+    formatted = [format(value) for value in valid]
+    invalid = [mutate(value, rng) for value in valid]
+    dirty_values = [dirty(value, rng) for value in formatted]
+    mixed = [
+        rng.choice((value, formatted_value, invalid_value, dirty_value))
+        if rng.random() < 0.9
+        else garbage(rng)
+        for value, formatted_value, invalid_value, dirty_value in zip(
+            valid, formatted, invalid, dirty_values
+        )
+    ]
+    return {
+        "valid": valid,
+        "formatted": formatted,
+        "invalid": invalid,
+        "dirty": dirty_values,
+        "mixed": mixed,
+    }
+
+
+def batches(values):
+    """
+    Splits values in batches of `BATCH_SIZE`, each one the single argument
+    of a call.
+    """
+
+    return [
+        (values[start : start + BATCH_SIZE],)
+        for start in range(0, len(values), BATCH_SIZE)
+    ]
+
+
+def single(values):
+    """
+    Makes each value the single argument of a call.
+    """
+
+    return [(value,) for value in values]
+
+
+def build_cases(size, seed=0):
+    """
+    Builds the arguments of the calls of each function.
+
+    Returns:
+        dict[str, list[tuple]]: The arguments of each call, by the name of
+                                the function in `brutils`.
+    """
+
+    # The generators of `brutils` draw from the global random generator
+    random.seed(seed)
+    rng = random.Random(seed)
+    cases = {}
+    no_arguments = [()] * size
+
+    # CPF, CNPJ, PIS
+    encoded_corpora = {}
+    for suffix, generate, format in (
+        ("cpf", brutils.generate_cpf, brutils.format_cpf),
+        ("cnpj", brutils.generate_cnpj, brutils.format_cnpj),
+        ("pis", brutils.generate_pis, brutils.format_pis),
+    ):
+        corpus = documents(generate, format, size, rng)
+        cases[f"generate_{suffix}"] = no_arguments
+        cases[f"format_{suffix}"] = single(corpus["valid"] + corpus["invalid"])
+        cases[f"is_valid_{suffix}"] = single(corpus["mixed"])
+        cases[f"remove_symbols_{suffix}"] = single(
+            corpus["formatted"] + corpus["dirty"]
+        )
+        cases[f"to_int_{suffix}"] = single(corpus["mixed"])
+        encoded = getattr(brutils, f"encode_many_{suffix}")(corpus["mixed"])
+        cases[f"from_int_{suffix}"] = single(encoded.tolist())
+        cases[f"encode_many_{suffix}"] = batches(corpus["mixed"])
+        cases[f"decode_many_{suffix}"] = [
+            (encoded[start : start + BATCH_SIZE],)
+            for start in range(0, len(encoded), BATCH_SIZE)
+        ]
+        encoded_corpora[suffix] = encoded
+
+    cases["group_by_root_cnpj"] = [(encoded_corpora["cnpj"],)]
+    cases["unique_encoded"] = [(encoded_corpora["cpf"],)]
+    cases["intersect_encoded"] = [
+        (encoded_corpora["cpf"], encoded_corpora["cpf"][::2])
+    ]
+
+    # CEP
+    corpus = documents(brutils.generate_cep, brutils.format_cep, size, rng)
+    cases["generate_cep"] = no_arguments
+    cases["format_cep"] = single(corpus["valid"] + corpus["mixed"])
+    cases["is_valid_cep"] = single(corpus["mixed"])
+    cases["remove_symbols_cep"] = single(corpus["formatted"] + corpus["dirty"])
+
+    # Voter ID
+    corpus = documents(
+        lambda: brutils.generate_voter_id(rng.choice(UFS)),
+        lambda value: value,
+        size,
+        rng,
+    )
+    cases["generate_voter_id"] = [(rng.choice(UFS),) for _ in range(size)]
+    cases["format_voter_id"] = single(corpus["valid"] + corpus["invalid"])
+    cases["is_valid_voter_id"] = single(corpus["mixed"])
+
+    # Phone
+    corpus = documents(brutils.generate_phone, brutils.format_phone, size, rng)
+    cases["generate_phone"] = [
+        (rng.choice((None, "mobile", "landline")),) for _ in range(size)
+    ]
+    cases["format_phone"] = single(corpus["valid"] + corpus["invalid"])
+    cases["is_valid_phone"] = single(corpus["mixed"])
+    cases["remove_symbols_phone"] = single(
+        corpus["formatted"] + corpus["dirty"]
+    )
+    cases["remove_international_dialing_code"] = single(
+        [f"55{value}" for value in corpus["valid"]]
+        + [f"+55 {value}" for value in corpus["formatted"]]
+        + corpus["valid"]
+    )
+    cases["identify_ddd"] = single(corpus["valid"] + corpus["mixed"])
+
+    # License plate
+    old = [brutils.generate_license_plate("LLLNNNN") for _ in range(size)]
+    mercosul = [brutils.generate_license_plate("LLLNLNN") for _ in range(size)]
+    plates = old + mercosul + [mutate(plate, rng) for plate in old]
+    plates += [f"{plate[:3]}-{plate[3:]}" for plate in old]
+    plates += [garbage(rng) for _ in range(size)]
+    rng.shuffle(plates)
+    cases["generate_license_plate"] = [
+        (rng.choice(("LLLNNNN", "LLLNLNN")),) for _ in range(size)
+    ]
+    cases["format_license_plate"] = single(plates)
+    cases["get_format_license_plate"] = single(plates)
+    cases["is_valid_license_plate"] = single(plates)
+    cases["convert_license_plate_to_mercosul"] = single(old + plates)
+    cases["get_uf_license_plate"] = single(plates)
+    cases["get_uf_many_license_plate"] = batches(plates)
+    cases["remove_symbols_license_plate"] = single(
+        [dirty(plate, rng) for plate in plates]
+    )
+    cases["resolve_license_plate"] = single(
+        license_plate_resolve.build_corpus(size, seed)
+    )
+    cases["sample_unique_license_plate"] = [
+        (BATCH_SIZE, "LLLNLNN", seed) for seed in range(max(size // 100, 1))
+    ]
+
+    # Legal process
+    corpus = documents(
+        brutils.generate_legal_process, brutils.format_legal_process, size, rng
+    )
+    cases["generate_legal_process"] = no_arguments
+    cases["generate_many_legal_process"] = [
+        (BATCH_SIZE, None, None, seed) for seed in range(max(size // 100, 1))
+    ]
+    cases["format_legal_process"] = single(corpus["valid"] + corpus["invalid"])
+    cases["remove_symbols_legal_process"] = single(
+        corpus["formatted"] + corpus["dirty"]
+    )
+    cases["is_valid_legal_process"] = single(corpus["mixed"])
+    cases["parse_legal_process"] = single(corpus["mixed"])
+    cases["parse_stream_legal_process"] = batches(corpus["mixed"])
+    cases["describe_legal_process"] = single(corpus["valid"])
+    cases["describe_many_legal_process"] = batches(corpus["valid"])
+
+    # Email
+    emails = email_validation.build_corpus(size * 4, seed)
+    cases["is_valid_email"] = single(emails)
+    cases["is_valid_many_email"] = batches(emails)
+    emails = email_domain_suggestion.build_corpus(size, seed)
+    cases["suggest_domain_email"] = single(emails)
+    cases["suggest_domain_many_email"] = batches(emails)
+
+    # Date
+    start = datetime.date(1900, 1, 1).toordinal()
+    end = datetime.date(2035, 12, 31).toordinal()
+    dates = [
+        datetime.date.fromordinal(rng.randint(start, end)) for _ in range(size)
+    ]
+    texts = [
+        date.strftime(
+            rng.choice(("%d/%m/%Y", "%d.%m.%Y", "%d-%m-%Y", "%Y-%m-%d"))
+        )
+        for date in dates
+    ]
+    written = [brutils.convert_date_to_text(text) for text in texts]
+    cases["convert_date_to_text"] = single(texts)
+    cases["convert_dates_to_text"] = batches(texts)
+    cases["parse_text_date"] = single(written)
+    cases["find_text_dates"] = single(
+        [
+            f"Aos {text.lower()}, compareceu ao cartório o outorgante. "
+            f"Lavrada em {written[index - 1].lower()}."
+            for index, text in enumerate(written)
+        ]
+    )
+
+    # Date utils
+    dates = [
+        datetime.datetime.fromordinal(
+            rng.randint(
+                datetime.date(2000, 1, 1).toordinal(),
+                datetime.date(2035, 12, 31).toordinal(),
+            )
+        )
+        for _ in range(size)
+    ]
+    ufs = [rng.choice((None,) + UFS) for _ in range(size)]
+    cases["is_holiday"] = list(zip(dates, ufs))
+    cases["is_business_day"] = list(zip(dates, ufs))
+    cases["next_business_day"] = list(zip(dates, ufs))
+    cases["add_business_days"] = [
+        (date, rng.randint(-30, 30), uf) for date, uf in zip(dates, ufs)
+    ]
+    cases["business_days_between"] = [
+        (date, date + datetime.timedelta(days=rng.randint(-400, 400)), uf)
+        for date, uf in zip(dates, ufs)
+    ]
+    cases["is_holiday_many"] = batches(dates)
+    cases["is_business_day_many"] = batches(dates)
+
+    # IBGE
+    municipalities = [
+        (name, uf)
+        for uf, cities_code in _load_cities_code().items()
+        for name in cities_code
+    ]
+    municipalities = rng.sample(municipalities, min(size, len(municipalities)))
+    cases["convert_code_to_uf"] = single(
+        [str(rng.randint(10, 60)) for _ in range(size)]
+    )
+    cases["get_code_by_municipality_name"] = [
+        (name.title(), uf.lower()) for name, uf in municipalities
+    ]
+
+    # Currency
+    amounts = [
+        Decimal(rng.randrange(-(10 ** rng.randint(1, 8)), 10**12)).scaleb(-2)
+        for _ in range(size)
+    ]
+    formatted = currency_parse.build_corpus(size, seed)
+    real_texts = [brutils.convert_real_to_text(amount) for amount in amounts]
+    cases["format_currency"] = single(amounts)
+    cases["format_currency_many"] = batches(amounts)
+    cases["parse_currency"] = single(formatted)
+    cases["parse_currency_many"] = batches(formatted)
+    cases["convert_real_to_text"] = single(amounts)
+    cases["parse_real_text"] = single(real_texts)
+    cases["parse_real_text_many"] = batches(real_texts)
+
+    # Instrumentation
+    cases["add_event_listener"] = [(ignore,)] * size
+    cases["remove_event_listener"] = [(ignore,)] * size
+    cases["get_cache_info"] = no_arguments
+
+    return cases
+
+
+def build_network_cases(size, seed=0):
+    """
+    Builds the arguments of the calls of the functions that call web
+    services, which are run against the stub server.
+    """
+
+    rng = random.Random(seed)
+    ceps = [brutils.generate_cep() for _ in range(size)]
+    ceps[:: max(size // 10, 1)] = [MISSING_CEP] * len(
+        ceps[:: max(size // 10, 1)]
+    )
+    codes = [
+        code
+        for cities_code in _load_cities_code().values()
+        for code in cities_code.values()
+    ]
+
+    return {
+        "get_address_from_cep": single(ceps),
+        "is_valid_cep": [(cep, True) for cep in ceps],
+        "get_cep_information_from_address": [
+            (
+                rng.choice(UFS),
+                "São Paulo",
+                rng.choice(("Avenida Paulista", MISSING_STREET)),
+            )
+            for _ in range(size)
+        ],
+        "get_municipality_by_code": single(
+            [
+                rng.choice(codes) if rng.random() < 0.9 else "1234567"
+                for _ in range(size)
+            ]
+        ),
+    }
+
+
+def ignore(event):
+    """
+    Listener of the instrumentation events that does nothing.
+    """
+
+
+def consume(function):
+    """
+    Wraps a function that returns a generator, so that its values are
+    computed in the call.
+    """
+
+    def consumed(*arguments):
+        return list(function(*arguments))
+
+    return consumed
+
+
+def percentile(samples, fraction):
+    """
+    Returns a percentile of sorted samples, by the nearest rank method.
+    """
+
+    return samples[min(int(len(samples) * fraction), len(samples) - 1)]
+
+
+def measure(function, calls, repeat):
+    """
+    Calls a function with each of the arguments, `repeat` times.
+
+    Returns:
+        dict[str, float]: The best throughput, in calls per second, and the
+                          median and 99th percentile of the time of each
+                          call, in microseconds.
+    """
+
+    timer = time.perf_counter_ns
+    best = None
+    samples = []
+
+    # Warm up the caches (holidays of each year, compiled patterns, ...)
+    for arguments in calls:
+        function(*arguments)
+
+    for _ in range(repeat):
+        start = timer()
+        for arguments in calls:
+            function(*arguments)
+        elapsed = timer() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+        # The time of each call is measured in a separate pass, so that the
+        # overhead of the timer does not lower the throughput
+        for arguments in calls:
+            start = timer()
+            function(*arguments)
+            samples.append(timer() - start)
+
+    samples.sort()
+    return {
+        "ops": len(calls) / max(best, 1) * 1e9,
+        "p50": percentile(samples, 0.5) / 1000,
+        "p99": percentile(samples, 0.99) / 1000,
+    }
+
+
+def compare(results, baseline, threshold):
+    """
+    Returns the names of the functions whose throughput dropped by more
+    than `threshold` (a fraction) from the baseline.
+    """
+
+    return [
+        name
+        for name, result in results.items()
+        if name in baseline
+        and result["ops"] < baseline[name]["ops"] * (1 - threshold)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--filter", default="")
+    parser.add_argument("--baseline", type=pathlib.Path, default=BASELINE)
+    parser.add_argument("--save", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--no-network", action="store_true")
+    args = parser.parse_args()
+
+    cases = build_cases(args.size)
+    network_cases = (
+        {} if args.no_network else build_network_cases(args.size // 10 or 1)
+    )
+
+    missing = set(brutils.__all__) - set(cases) - set(network_cases)
+    if not args.no_network and missing:
+        sys.exit(f"Functions without benchmarks: {', '.join(sorted(missing))}")
+
+    baseline = {}
+    if args.baseline.exists() and not args.save:
+        baseline = json.loads(args.baseline.read_text())
+
+    results = {}
+    print(f"{'function':<42}{'ops/s':>12}{'p50 (us)':>11}{'p99 (us)':>11}")
+
+    for network, group in ((False, cases), (True, network_cases)):
+        names = sorted(name for name in group if args.filter in name)
+        if not names:
+            continue
+
+        # The listeners added by the benchmark of `add_event_listener` would
+        # slow down the functions that call web services
+        while brutils.remove_event_listener(ignore):
+            pass
+
+        context = stub_server() if network else contextlib.nullcontext()
+        with context:
+            for name in names:
+                label = f"{name} (stub)" if network else name
+                function = getattr(brutils, name)
+                if name in GENERATORS:
+                    function = consume(function)
+                result = measure(function, group[name], args.repeat)
+                results[label] = result
+
+                line = (
+                    f"{label:<42}{result['ops']:>12,.0f}"
+                    f"{result['p50']:>11.1f}{result['p99']:>11.1f}"
+                )
+                if label in baseline:
+                    change = result["ops"] / baseline[label]["ops"] - 1
+                    line += f"{change:>+10.1%}"
+                print(line)
+
+    if args.save:
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"\nBaseline saved to {args.baseline}")
+        return
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(
+            f"\nThroughput dropped by more than {args.threshold:.0%}: "
+            + ", ".join(regressions)
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Throughput benchmark for `brutils.date.find_text_dates`.
+
+A document with the requested number of millions of characters is built
+from filler sentences mixed with dates written out by
+`convert_date_to_text`, and the dates are extracted from it. The number of
+characters scanned per second is reported.
+
+Usage:
+    python -m benchmarks.text_dates [--size MILLIONS] [--repeat N]
+"""
+
+import argparse
+import datetime
+import random
+import timeit
+
+from brutils.date import convert_date_to_text, find_text_dates
+
+FILLER = (
+    "Certifico e dou fé que a presente escritura foi lavrada nesta "
+    "serventia, a pedido das partes, que a leram e acharam conforme. "
+)
+
+
+def build_document(millions, seed=0):
+    rng = random.Random(seed)
+    start = datetime.date(1900, 1, 1).toordinal()
+    end = datetime.date(2030, 12, 31).toordinal()
+    parts = []
+    size = expected = 0
+
+    while size < millions * 1_000_000:
+        date = datetime.date.fromordinal(rng.randint(start, end))
+        text = convert_date_to_text(date.strftime("%d/%m/%Y"))
+        parts.append(f"{FILLER}Em {text.lower()}. ")
+        size += len(parts[-1])
+        expected += 1
+
+    return "".join(parts), expected
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--size", type=float, default=5, help="millions of characters"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    document, expected = build_document(args.size)
+    found = len(find_text_dates(document))
+    assert found == expected, (found, expected)
+
+    best = min(
+        timeit.repeat(
+            lambda: find_text_dates(document), number=1, repeat=args.repeat
+        )
+    )
+
+    print(f"document: {len(document):,} characters, {found} dates")
+    print(
+        f"best:     {best:.3f}s ({len(document) / best / 1e6:.1f}M characters/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark for the value classes of `brutils.types`.
+
+A request that removes the symbols of a CPF, validates it and formats it a
+few times is run with the functions of `brutils` and with a `CPF` object,
+counting the calls to the check digit function (`cpf._hashdigit`) and
+measuring the time of each. The memory of a list of CPF objects is then
+compared with the memory of the same CPFs as strings, before and after
+their formatted and masked forms are cached.
+
+Usage:
+    python -m benchmarks.value_objects [--size N] [--uses N]
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+
+from brutils import cpf
+from brutils.types import CPF
+
+
+def by_functions(values, uses):
+    for value in values:
+        digits = cpf.remove_symbols(value)
+        if cpf.is_valid(digits):
+            for _ in range(uses):
+                cpf.format_cpf(digits)
+
+
+def by_objects(values, uses):
+    for value in values:
+        parsed = CPF.parse(value)
+        if parsed is not None:
+            for _ in range(uses):
+                parsed.formatted
+
+
+def counted(function, *args):
+    """
+    Runs a function, returning its time and the number of calls to
+    `cpf._hashdigit` it made.
+    """
+
+    original = cpf._hashdigit
+    calls = 0
+
+    def hashdigit(*args):
+        nonlocal calls
+        calls += 1
+        return original(*args)
+
+    cpf._hashdigit = hashdigit
+    try:
+        start = time.perf_counter()
+        function(*args)
+        return time.perf_counter() - start, calls
+    finally:
+        cpf._hashdigit = original
+
+
+def memory(build):
+    """
+    Returns the bytes allocated by `build`, and its result.
+    """
+
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--uses", type=int, default=3)
+    args = parser.parse_args()
+
+    random.seed(0)
+    values = [cpf.format_cpf(cpf.generate()) for _ in range(args.size)]
+    print(
+        f"{args.size:,} formatted CPFs, each validated once and formatted "
+        f"{args.uses} times"
+    )
+
+    print(f"{'':<12}{'_hashdigit calls':>18}{'per CPF':>10}{'time':>10}")
+    for label, function in (
+        ("functions", by_functions),
+        ("CPF", by_objects),
+    ):
+        elapsed, calls = counted(function, values, args.uses)
+        print(
+            f"{label:<12}{calls:>18,}{calls / args.size:>10.1f}"
+            f"{elapsed:>9.2f}s"
+        )
+
+    print()
+    print(f"{'':<24}{'bytes per CPF':>14}")
+    size, _ = memory(lambda: [cpf.remove_symbols(value) for value in values])
+    print(f"{'str (digits)':<24}{size / args.size:>14.0f}")
+    size, objects = memory(lambda: [CPF(value) for value in values])
+    print(f"{'CPF':<24}{size / args.size:>14.0f}")
+    size, _ = memory(
+        lambda: [(value.formatted, value.masked) for value in objects]
+    )
+    print(f"{'+ formatted and masked':<24}{size / args.size:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,80 +1,133 @@
-# CEP Imports
-from brutils.cep import (
-    format_cep,
-    get_address_from_cep,
-    get_cep_information_from_address,
-)
-from brutils.cep import generate as generate_cep
-from brutils.cep import is_valid as is_valid_cep
-from brutils.cep import remove_symbols as remove_symbols_cep
+from importlib import import_module as _import_module
 
-# CNPJ Imports
-from brutils.cnpj import format_cnpj
-from brutils.cnpj import generate as generate_cnpj
-from brutils.cnpj import is_valid as is_valid_cnpj
-from brutils.cnpj import remove_symbols as remove_symbols_cnpj
-
-# CPF Imports
-from brutils.cpf import format_cpf
-from brutils.cpf import generate as generate_cpf
-from brutils.cpf import is_valid as is_valid_cpf
-from brutils.cpf import remove_symbols as remove_symbols_cpf
-
-# Currency
-from brutils.currency import convert_real_to_text, format_currency
-
-# Date imports
-from brutils.date import convert_date_to_text
-
-# Date Utils Import
-from brutils.date_utils import is_holiday
-
-# Email Import
-from brutils.email import is_valid as is_valid_email
-
-# IBGE Imports
-from brutils.ibge.municipality import (
-    get_code_by_municipality_name,
-    get_municipality_by_code,
-)
-from brutils.ibge.uf import convert_code_to_uf
-
-# Legal Process Imports
-from brutils.legal_process import format_legal_process
-from brutils.legal_process import generate as generate_legal_process
-from brutils.legal_process import is_valid as is_valid_legal_process
-from brutils.legal_process import remove_symbols as remove_symbols_legal_process
-
-# License Plate Imports
-from brutils.license_plate import (
-    convert_to_mercosul as convert_license_plate_to_mercosul,
-)
-from brutils.license_plate import format_license_plate
-from brutils.license_plate import generate as generate_license_plate
-from brutils.license_plate import get_format as get_format_license_plate
-from brutils.license_plate import is_valid as is_valid_license_plate
-from brutils.license_plate import remove_symbols as remove_symbols_license_plate
-
-# Phone Imports
-from brutils.phone import (
-    format_phone,
-    remove_international_dialing_code,
-    remove_symbols_phone,
-)
-from brutils.phone import generate as generate_phone
-from brutils.phone import is_valid as is_valid_phone
-from brutils.phone import identify_ddd
-
-# PIS Imports
-from brutils.pis import format_pis
-from brutils.pis import generate as generate_pis
-from brutils.pis import is_valid as is_valid_pis
-from brutils.pis import remove_symbols as remove_symbols_pis
-
-# Voter ID Imports
-from brutils.voter_id import format_voter_id
-from brutils.voter_id import generate as generate_voter_id
-from brutils.voter_id import is_valid as is_valid_voter_id
+# Public names, mapped to the module they are defined in and their name in
+# it. The modules are only imported when one of their names is first used
+# (PEP 562), so that importing brutils is cheap and, for instance, validating
+# a CPF does not load the `holidays` library
+_IMPORTS = {
+    # CEP
+    "format_cep": ("brutils.cep", "format_cep"),
+    "get_address_from_cep": ("brutils.cep", "get_address_from_cep"),
+    "get_cep_information_from_address": (
+        "brutils.cep",
+        "get_cep_information_from_address",
+    ),
+    "generate_cep": ("brutils.cep", "generate"),
+    "is_valid_cep": ("brutils.cep", "is_valid"),
+    "remove_symbols_cep": ("brutils.cep", "remove_symbols"),
+    # CNPJ
+    "decode_many_cnpj": ("brutils.cnpj", "decode_many"),
+    "encode_many_cnpj": ("brutils.cnpj", "encode_many"),
+    "format_cnpj": ("brutils.cnpj", "format_cnpj"),
+    "from_int_cnpj": ("brutils.cnpj", "from_int"),
+    "generate_cnpj": ("brutils.cnpj", "generate"),
+    "group_by_root_cnpj": ("brutils.cnpj", "group_by_root"),
+    "is_valid_cnpj": ("brutils.cnpj", "is_valid"),
+    "remove_symbols_cnpj": ("brutils.cnpj", "remove_symbols"),
+    "to_int_cnpj": ("brutils.cnpj", "to_int"),
+    # CPF
+    "decode_many_cpf": ("brutils.cpf", "decode_many"),
+    "encode_many_cpf": ("brutils.cpf", "encode_many"),
+    "format_cpf": ("brutils.cpf", "format_cpf"),
+    "from_int_cpf": ("brutils.cpf", "from_int"),
+    "generate_cpf": ("brutils.cpf", "generate"),
+    "is_valid_cpf": ("brutils.cpf", "is_valid"),
+    "remove_symbols_cpf": ("brutils.cpf", "remove_symbols"),
+    "to_int_cpf": ("brutils.cpf", "to_int"),
+    # Currency
+    "convert_real_to_text": ("brutils.currency", "convert_real_to_text"),
+    "format_currency": ("brutils.currency", "format_currency"),
+    "format_currency_many": ("brutils.currency", "format_currency_many"),
+    "parse_currency": ("brutils.currency", "parse_currency"),
+    "parse_currency_many": ("brutils.currency", "parse_currency_many"),
+    "parse_real_text": ("brutils.currency", "parse_real_text"),
+    "parse_real_text_many": ("brutils.currency", "parse_real_text_many"),
+    # Date
+    "convert_date_to_text": ("brutils.date", "convert_date_to_text"),
+    "convert_dates_to_text": ("brutils.date", "convert_dates_to_text"),
+    "find_text_dates": ("brutils.date", "find_text_dates"),
+    "parse_text_date": ("brutils.date", "parse_text_date"),
+    # Date Utils
+    "add_business_days": ("brutils.date_utils", "add_business_days"),
+    "business_days_between": ("brutils.date_utils", "business_days_between"),
+    "is_business_day": ("brutils.date_utils", "is_business_day"),
+    "is_business_day_many": ("brutils.date_utils", "is_business_day_many"),
+    "is_holiday": ("brutils.date_utils", "is_holiday"),
+    "is_holiday_many": ("brutils.date_utils", "is_holiday_many"),
+    "next_business_day": ("brutils.date_utils", "next_business_day"),
+    # Email
+    "is_valid_email": ("brutils.email", "is_valid"),
+    "is_valid_many_email": ("brutils.email", "is_valid_many"),
+    "suggest_domain_email": ("brutils.email", "suggest_domain"),
+    "suggest_domain_many_email": ("brutils.email", "suggest_domain_many"),
+    # Encoded
+    "intersect_encoded": ("brutils.encoded", "intersect"),
+    "unique_encoded": ("brutils.encoded", "unique"),
+    # IBGE
+    "get_code_by_municipality_name": (
+        "brutils.ibge.municipality",
+        "get_code_by_municipality_name",
+    ),
+    "get_municipality_by_code": (
+        "brutils.ibge.municipality",
+        "get_municipality_by_code",
+    ),
+    "convert_code_to_uf": ("brutils.ibge.uf", "convert_code_to_uf"),
+    # Instrumentation
+    "add_event_listener": ("brutils.instrumentation", "add_event_listener"),
+    "get_cache_info": ("brutils.instrumentation", "get_cache_info"),
+    "remove_event_listener": (
+        "brutils.instrumentation",
+        "remove_event_listener",
+    ),
+    # Legal Process
+    "describe_legal_process": ("brutils.legal_process", "describe"),
+    "describe_many_legal_process": ("brutils.legal_process", "describe_many"),
+    "format_legal_process": ("brutils.legal_process", "format_legal_process"),
+    "generate_legal_process": ("brutils.legal_process", "generate"),
+    "generate_many_legal_process": ("brutils.legal_process", "generate_many"),
+    "is_valid_legal_process": ("brutils.legal_process", "is_valid"),
+    "parse_legal_process": ("brutils.legal_process", "parse"),
+    "parse_stream_legal_process": ("brutils.legal_process", "parse_stream"),
+    "remove_symbols_legal_process": ("brutils.legal_process", "remove_symbols"),
+    # License Plate
+    "convert_license_plate_to_mercosul": (
+        "brutils.license_plate",
+        "convert_to_mercosul",
+    ),
+    "format_license_plate": ("brutils.license_plate", "format_license_plate"),
+    "generate_license_plate": ("brutils.license_plate", "generate"),
+    "get_format_license_plate": ("brutils.license_plate", "get_format"),
+    "get_uf_license_plate": ("brutils.license_plate", "get_uf"),
+    "get_uf_many_license_plate": ("brutils.license_plate", "get_uf_many"),
+    "is_valid_license_plate": ("brutils.license_plate", "is_valid"),
+    "remove_symbols_license_plate": ("brutils.license_plate", "remove_symbols"),
+    "resolve_license_plate": ("brutils.license_plate", "resolve"),
+    "sample_unique_license_plate": ("brutils.license_plate", "sample_unique"),
+    # Phone
+    "format_phone": ("brutils.phone", "format_phone"),
+    "remove_international_dialing_code": (
+        "brutils.phone",
+        "remove_international_dialing_code",
+    ),
+    "remove_symbols_phone": ("brutils.phone", "remove_symbols_phone"),
+    "generate_phone": ("brutils.phone", "generate"),
+    "is_valid_phone": ("brutils.phone", "is_valid"),
+    "identify_ddd": ("brutils.phone", "identify_ddd"),
+    # PIS
+    "decode_many_pis": ("brutils.pis", "decode_many"),
+    "encode_many_pis": ("brutils.pis", "encode_many"),
+    "format_pis": ("brutils.pis", "format_pis"),
+    "from_int_pis": ("brutils.pis", "from_int"),
+    "generate_pis": ("brutils.pis", "generate"),
+    "is_valid_pis": ("brutils.pis", "is_valid"),
+    "remove_symbols_pis": ("brutils.pis", "remove_symbols"),
+    "to_int_pis": ("brutils.pis", "to_int"),
+    # Voter ID
+    "format_voter_id": ("brutils.voter_id", "format_voter_id"),
+    "generate_voter_id": ("brutils.voter_id", "generate"),
+    "is_valid_voter_id": ("brutils.voter_id", "is_valid"),
+}
 
 # Defining __all__ to expose the public methods
 __all__ = [
@@ -86,31 +139,55 @@ __all__ = [
     "is_valid_cep",
     "remove_symbols_cep",
     # CNPJ
+    "decode_many_cnpj",
+    "encode_many_cnpj",
     "format_cnpj",
+    "from_int_cnpj",
     "generate_cnpj",
+    "group_by_root_cnpj",
     "is_valid_cnpj",
     "remove_symbols_cnpj",
+    "to_int_cnpj",
     # CPF
+    "decode_many_cpf",
+    "encode_many_cpf",
     "format_cpf",
+    "from_int_cpf",
     "generate_cpf",
     "is_valid_cpf",
     "remove_symbols_cpf",
+    "to_int_cpf",
     # Date
     "convert_date_to_text",
+    "convert_dates_to_text",
+    "parse_text_date",
+    "find_text_dates",
     # Email
     "is_valid_email",
+    "is_valid_many_email",
+    "suggest_domain_email",
+    "suggest_domain_many_email",
     # Legal Process
+    "describe_legal_process",
+    "describe_many_legal_process",
     "format_legal_process",
     "generate_legal_process",
+    "generate_many_legal_process",
     "is_valid_legal_process",
+    "parse_legal_process",
+    "parse_stream_legal_process",
     "remove_symbols_legal_process",
     # License Plate
     "convert_license_plate_to_mercosul",
     "format_license_plate",
     "generate_license_plate",
     "get_format_license_plate",
+    "get_uf_license_plate",
+    "get_uf_many_license_plate",
     "is_valid_license_plate",
     "remove_symbols_license_plate",
+    "resolve_license_plate",
+    "sample_unique_license_plate",
     # Phone
     "format_phone",
     "remove_international_dialing_code",
@@ -119,10 +196,14 @@ __all__ = [
     "is_valid_phone",
     "identify_ddd",
     # PIS
+    "decode_many_pis",
+    "encode_many_pis",
     "format_pis",
+    "from_int_pis",
     "generate_pis",
     "is_valid_pis",
     "remove_symbols_pis",
+    "to_int_pis",
     # Voter ID
     "format_voter_id",
     "generate_voter_id",
@@ -133,7 +214,49 @@ __all__ = [
     "get_code_by_municipality_name",
     # Date Utils
     "is_holiday",
+    "is_business_day",
+    "add_business_days",
+    "business_days_between",
+    "next_business_day",
+    "is_holiday_many",
+    "is_business_day_many",
     # Currency
     "format_currency",
+    "format_currency_many",
+    "parse_currency",
+    "parse_currency_many",
     "convert_real_to_text",
+    "parse_real_text",
+    "parse_real_text_many",
+    # Instrumentation
+    "add_event_listener",
+    "remove_event_listener",
+    "get_cache_info",
+    # Encoded
+    "intersect_encoded",
+    "unique_encoded",
 ]
+
+
+def __getattr__(name):
+    try:
+        module_name, attribute = _IMPORTS[name]
+    except KeyError:
+        # Submodules, such as `brutils.cpf`, are imported on first use too
+        try:
+            return _import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as error:
+            if error.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+    value = getattr(_import_module(module_name), attribute)
+    # Later lookups of the name no longer go through this function
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
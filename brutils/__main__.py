@@ -0,0 +1,427 @@
+"""
+Command line interface of brutils.
+
+Validates, formats, cleans, detects the kind of, or enriches the values of a
+file or of the standard input, either one value per line or a column of a
+CSV file:
+
+    $ python -m brutils validate cpf cpfs.txt > valid.txt
+    $ brutils format cnpj companies.csv --column cnpj -o formatted.csv
+    $ cat phones.txt | brutils enrich phone --workers 4
+
+The input is read and written as a stream: the values are processed in
+chunks of `--chunk-size` by `--workers` processes (see `brutils.batch`), and
+only a few chunks per worker are kept in memory, so files of any size can be
+processed. At the end, the number of values, the throughput and the number
+of invalid values are reported on the standard error.
+"""
+
+import argparse
+import csv
+import os
+import sys
+import time
+from itertools import tee
+
+from brutils import batch
+
+# Kinds of values that `detect` recognizes, in order: a value is of the
+# first kind it is valid for. CPF and PIS come before phone, as the three
+# have 11 digits
+_DETECTED_KINDS = (
+    "cpf",
+    "cnpj",
+    "pis",
+    "voter_id",
+    "legal_process",
+    "cep",
+    "phone",
+    "license_plate",
+    "email",
+)
+
+# Symbols removed from the values by `detect`, except for emails
+_SYMBOLS = str.maketrans("", "", " ()+-./")
+
+# Fields that `enrich` adds to the values of each kind, and the function
+# that computes them for a list of values
+_ENRICHMENTS = {
+    "cep": (
+        ("logradouro", "bairro", "localidade", "uf", "ibge"),
+        "_enrich_cep",
+    ),
+    "email": (("suggested_domain",), "_enrich_email"),
+    "legal_process": (
+        ("segment", "tribunal", "origin"),
+        "_enrich_legal_process",
+    ),
+    "license_plate": (("uf", "format"), "_enrich_license_plate"),
+    "phone": (("state", "region"), "_enrich_phone"),
+}
+
+_OPERATIONS = {
+    "validate": "Writes the valid values only (or the invalid ones).",
+    "format": "Formats the values, with an empty value for the invalid ones.",
+    "clean": "Removes the symbols of the values.",
+    "detect": "Adds the kind of each value, empty if it is not recognized.",
+    "enrich": "Adds information about each value, empty if it is invalid.",
+}
+
+
+def _main(argv=None):  # type: (list[str] | None) -> int
+    """
+    Runs the command line interface, with the arguments of the command line
+    or `argv`, and returns the exit status.
+    """
+
+    parser, subparsers = _parsers()
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in subparsers:
+        # Prints the help or the error and exits
+        parser.parse_args(argv)
+
+    # The input may come after the options, e.g. `validate cpf -w 4 file`
+    parser = subparsers[argv[0]]
+    args = parser.parse_intermixed_args(argv[1:])
+    args.operation = argv[0]
+
+    kind, operation, fields = _task(args)
+    if args.workers is not None and args.workers < 1:
+        parser.error(f"invalid number of workers: {args.workers}")
+    if args.chunk_size < 1:
+        parser.error(f"invalid chunk size: {args.chunk_size}")
+
+    csv_mode = args.column is not None
+    try:
+        source = _open(args.input, "r", csv_mode)
+        target = _open(args.output, "w", csv_mode)
+    except OSError as error:
+        parser.error(str(error))
+
+    start = time.perf_counter()
+    try:
+        with source, target:
+            if csv_mode:
+                count, invalid = _process_csv(
+                    args, kind, operation, fields, source, target, parser
+                )
+            else:
+                count, invalid = _process_lines(
+                    args, kind, operation, fields, source, target
+                )
+    except BrokenPipeError:
+        # The output was closed early, e.g. by `head`: the rest of the
+        # output is dropped without an error
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"{count:,} values in {elapsed:.2f}s "
+        f"({count / elapsed if elapsed else 0:,.0f} values/s), "
+        f"{invalid:,} invalid",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def _parsers():  # type: () -> tuple[argparse.ArgumentParser, dict[str, argparse.ArgumentParser]]
+    """
+    Returns the parser of the command line and the parsers of each
+    operation.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="brutils",
+        description=__doc__.strip().split("\n")[0],
+    )
+    subparsers = parser.add_subparsers(
+        dest="operation", metavar="operation", required=True
+    )
+
+    for operation, help in _OPERATIONS.items():
+        subparser = subparsers.add_parser(
+            operation, help=help, description=help
+        )
+        if operation == "detect":
+            pass
+        elif operation == "enrich":
+            subparser.add_argument("kind", choices=sorted(_ENRICHMENTS))
+        else:
+            subparser.add_argument(
+                "kind",
+                choices=sorted(
+                    kind
+                    for kind, entry in batch._KINDS.items()
+                    if operation not in batch._OPERATIONS
+                    or entry[batch._OPERATIONS[operation]] is not None
+                ),
+            )
+
+        subparser.add_argument(
+            "input",
+            nargs="?",
+            default="-",
+            help="file to read, or - for the standard input (default)",
+        )
+        subparser.add_argument(
+            "-o",
+            "--output",
+            default="-",
+            help="file to write, or - for the standard output (default)",
+        )
+        subparser.add_argument(
+            "-c",
+            "--column",
+            help="name of the column of the values, in a CSV file with a "
+            "header; by default, the input has one value per line",
+        )
+        subparser.add_argument(
+            "-d",
+            "--delimiter",
+            default=",",
+            help="delimiter of the CSV file (default: ,)",
+        )
+        subparser.add_argument(
+            "-w",
+            "--workers",
+            type=int,
+            help="number of worker processes (default: number of CPUs)",
+        )
+        subparser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=10_000,
+            help="number of values sent to a worker at a time "
+            "(default: 10000)",
+        )
+        if operation == "validate":
+            subparser.add_argument(
+                "--invalid",
+                action="store_true",
+                help="write the invalid values instead of the valid ones",
+            )
+
+    return parser, subparsers.choices
+
+
+def _task(args):  # type: (argparse.Namespace) -> tuple[str | None, str, tuple[str, ...]]
+    """
+    Returns the kind and the operation given to `brutils.batch`, and the
+    names of the fields the operation adds to each value.
+    """
+
+    if args.operation == "detect":
+        return None, "brutils.__main__:_detect", ("kind",)
+    if args.operation == "enrich":
+        fields, function = _ENRICHMENTS[args.kind]
+        return None, f"brutils.__main__:{function}", fields
+    return args.kind, args.operation, ()
+
+
+def _open(path, mode, csv_mode):  # type: (str, str, bool) -> TextIO
+    """
+    Opens a file, or the standard input or output for "-", as UTF-8 text.
+    """
+
+    newline = "" if csv_mode else None
+    if path != "-":
+        return open(path, mode, encoding="utf-8", newline=newline)
+
+    stream = sys.stdin if mode == "r" else sys.stdout
+    # A copy of the descriptor, so that closing the file does not close the
+    # standard streams
+    return open(
+        os.dup(stream.fileno()), mode, encoding="utf-8", newline=newline
+    )
+
+
+def _process_lines(args, kind, operation, fields, source, target):  # type: (argparse.Namespace, str | None, str, tuple[str, ...], TextIO, TextIO) -> tuple[int, int]
+    lines = (line.rstrip("\r\n") for line in source)
+    write = target.write
+    count = invalid = 0
+
+    for value, result in _results(args, kind, operation, lines, None):
+        count += 1
+        bad = _is_invalid(args.operation, result)
+        invalid += bad
+
+        if args.operation == "validate":
+            if bad != args.invalid:
+                continue
+            line = value
+        elif fields:
+            line = "\t".join((value,) + _fields(result, fields))
+        else:
+            line = "" if result is None else result
+        write(f"{line}\n")
+
+    return count, invalid
+
+
+def _process_csv(args, kind, operation, fields, source, target, parser):  # type: (argparse.Namespace, str | None, str, tuple[str, ...], TextIO, TextIO, argparse.ArgumentParser) -> tuple[int, int]
+    reader = csv.reader(source, delimiter=args.delimiter)
+    writer = csv.writer(target, delimiter=args.delimiter, lineterminator="\n")
+
+    header = next(reader, None)
+    if header is None:
+        return 0, 0
+    if args.column not in header:
+        parser.error(f"column not found in the header: {args.column}")
+    column = header.index(args.column)
+
+    writer.writerow(
+        header + [f"{args.column}_{field}" for field in fields]
+        if fields
+        else header
+    )
+
+    writerow = writer.writerow
+    count = invalid = 0
+
+    for row, result in _results(
+        args,
+        kind,
+        operation,
+        reader,
+        lambda row: row[column] if column < len(row) else "",
+    ):
+        count += 1
+        bad = _is_invalid(args.operation, result)
+        invalid += bad
+
+        if args.operation == "validate":
+            if bad != args.invalid:
+                continue
+        elif fields:
+            row = row + list(_fields(result, fields))
+        elif column < len(row):
+            row[column] = "" if result is None else result
+        writerow(row)
+
+    return count, invalid
+
+
+def _results(args, kind, operation, rows, value):  # type: (argparse.Namespace, str | None, str, Iterator, Callable | None) -> Iterator[tuple]
+    """
+    Yields each row of the input with the result of the operation on its
+    value, given by `value` (the row itself if None).
+
+    The rows are read once, as `brutils.batch` reads the values, and kept
+    by `tee` only until their results are yielded, so that only the chunks
+    being processed are in memory.
+    """
+
+    rows, pending = tee(rows)
+    values = pending if value is None else map(value, pending)
+    results = batch._run(kind, operation, values, args.workers, args.chunk_size)
+    return zip(rows, results)
+
+
+def _is_invalid(operation, result):  # type: (str, object) -> bool
+    if operation == "validate":
+        return not result
+    return result is None and operation != "clean"
+
+
+def _fields(result, fields):  # type: (tuple[str, ...] | str | None, tuple[str, ...]) -> tuple[str, ...]
+    if result is None:
+        return ("",) * len(fields)
+    if isinstance(result, str):
+        return (result,)
+    return tuple("" if field is None else field for field in result)
+
+
+def _detect(values):  # type: (list[str]) -> list[str | None]
+    """
+    Detects the kind of each value, the first kind of `_DETECTED_KINDS` it
+    is valid for, with or without symbols.
+    """
+
+    kinds = [None] * len(values)
+    rows = list(range(len(values)))
+    cleaned = [value.translate(_SYMBOLS) for value in values]
+
+    for kind in _DETECTED_KINDS:
+        if not rows:
+            break
+        candidates = values if kind == "email" else cleaned
+        valid = batch._resolve(kind, "validate")(
+            [candidates[row] for row in rows]
+        )
+        remaining = []
+        for row, is_valid in zip(rows, valid):
+            if is_valid:
+                kinds[row] = kind
+            else:
+                remaining.append(row)
+        rows = remaining
+
+    return kinds
+
+
+def _enrich_cep(values):  # type: (list[str]) -> list[tuple[str, ...] | None]
+    from brutils.cep import get_address_from_cep
+
+    fields = _ENRICHMENTS["cep"][0]
+    results = []
+    for value in values:
+        address = get_address_from_cep(value)
+        results.append(
+            None
+            if address is None
+            else tuple(address.get(field) for field in fields)
+        )
+    return results
+
+
+def _enrich_email(values):  # type: (list[str]) -> list[tuple[str | None] | None]
+    from brutils.email import is_valid_many, suggest_domain_many
+
+    return [
+        (suggestion,) if valid else None
+        for valid, suggestion in zip(
+            is_valid_many(values), suggest_domain_many(values)
+        )
+    ]
+
+
+def _enrich_legal_process(values):  # type: (list[str]) -> list[tuple[str, str, str] | None]
+    from brutils.legal_process import describe_many
+
+    return [
+        None
+        if description is None
+        else (
+            description["segment"],
+            description["tribunal"],
+            description["origin"],
+        )
+        for description in describe_many(values)
+    ]
+
+
+def _enrich_license_plate(values):  # type: (list[str]) -> list[tuple[str | None, str] | None]
+    from brutils.license_plate import get_format, get_uf_many
+
+    results = []
+    for value, uf in zip(values, get_uf_many(values)):
+        format = get_format(value)
+        results.append(None if format is None else (uf, format))
+    return results
+
+
+def _enrich_phone(values):  # type: (list[str]) -> list[tuple[str, str | None] | None]
+    from brutils.phone import identify_ddd
+
+    results = []
+    for value in values:
+        ddd = identify_ddd(value)
+        results.append(
+            None if "error" in ddd else (ddd["state"], ddd.get("region"))
+        )
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(_main())
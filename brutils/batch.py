@@ -0,0 +1,290 @@
+import mmap
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from importlib import import_module
+from itertools import islice
+
+# Module of each kind of value, the names of its format and remove symbols
+# functions (None if there is none) and the number of digits of the value,
+# used to zero-pad integer arrays (None if values are not made of digits
+# only)
+_KINDS = {
+    "cep": ("brutils.cep", "format_cep", "remove_symbols", 8),
+    "cnpj": ("brutils.cnpj", "format_cnpj", "remove_symbols", 14),
+    "cpf": ("brutils.cpf", "format_cpf", "remove_symbols", 11),
+    "email": ("brutils.email", None, None, None),
+    "legal_process": (
+        "brutils.legal_process",
+        "format_legal_process",
+        "remove_symbols",
+        20,
+    ),
+    "license_plate": (
+        "brutils.license_plate",
+        "format_license_plate",
+        "remove_symbols",
+        None,
+    ),
+    "phone": ("brutils.phone", "format_phone", "remove_symbols_phone", None),
+    "pis": ("brutils.pis", "format_pis", "remove_symbols", 11),
+    "voter_id": ("brutils.voter_id", "format_voter_id", None, 12),
+}
+
+# Index of the function of each operation in the entries of `_KINDS`
+_OPERATIONS = {"format": 1, "clean": 2}
+
+# Number of chunks submitted to the workers ahead of the one being read,
+# per worker, which bounds the memory used by the results
+_CHUNKS_PER_WORKER = 2
+
+# Function run on each chunk and number of digits of the values, set in
+# each worker process by `_initialize`
+_worker = None
+
+
+def validate(kind, values, workers=None, chunk_size=10_000):  # type: (str, Iterable[str] | numpy.ndarray, int, int) -> Iterator[bool]
+    """
+    Validates many values of a kind in parallel, in a pool of processes.
+
+    The values are split in chunks of `chunk_size`, which are validated by
+    the `is_valid` function of the kind (or its `is_valid_many` variant, if
+    there is one) in the worker processes, and the results are yielded in
+    the same order as the input, as soon as each chunk is done. Only a few
+    chunks per worker are read ahead, so the input may be larger than the
+    memory, e.g. a generator of the lines of a file.
+
+    NumPy arrays are sent to the workers in slices, without converting them
+    to Python objects first, and memory-mapped arrays (`numpy.memmap`) are
+    reopened by each worker from their file, so that their values are never
+    copied between processes. Arrays of integers are read as digits,
+    zero-padded to the length of the kind (e.g. 11 for CPF).
+
+    Each worker imports the module of the kind, and loads its data, once.
+
+    Args:
+        kind (str): The kind of the values: "cep", "cnpj", "cpf", "email",
+                    "legal_process", "license_plate", "phone", "pis" or
+                    "voter_id".
+        values (Iterable[str] or numpy.ndarray): The values to be validated.
+        workers (int, optional): The number of processes. Defaults to the
+                                 number of CPUs. With 1, the values are
+                                 validated in the current process.
+        chunk_size (int, optional): How many values are sent to a worker at
+                                    a time. Defaults to 10,000.
+
+    Returns:
+        Iterator[bool]: Whether each value is valid, in the same order as
+                        the input.
+
+    Raises:
+        ValueError: If the kind is not supported, or `workers` or
+                    `chunk_size` are not positive.
+
+    Example:
+        >>> list(validate("cpf", ["82178537464", "00000000000"], workers=2))
+        [True, False]
+    """
+
+    return _run(kind, "validate", values, workers, chunk_size)
+
+
+def format(kind, values, workers=None, chunk_size=10_000):  # type: (str, Iterable[str] | numpy.ndarray, int, int) -> Iterator[str | None]
+    """
+    Formats many values of a kind in parallel, in a pool of processes.
+
+    It works as `validate`, with the format function of the kind (e.g.
+    `format_cpf`) instead of its validator.
+
+    Args:
+        kind (str): The kind of the values: "cep", "cnpj", "cpf",
+                    "legal_process", "license_plate", "phone", "pis" or
+                    "voter_id".
+        values (Iterable[str] or numpy.ndarray): The values to be formatted.
+        workers (int, optional): The number of processes. Defaults to the
+                                 number of CPUs. With 1, the values are
+                                 formatted in the current process.
+        chunk_size (int, optional): How many values are sent to a worker at
+                                    a time. Defaults to 10,000.
+
+    Returns:
+        Iterator[str | None]: The formatted values, in the same order as the
+                              input, with None for the invalid ones.
+
+    Raises:
+        ValueError: If the kind is not supported or cannot be formatted, or
+                    `workers` or `chunk_size` are not positive.
+
+    Example:
+        >>> list(format("cnpj", ["03560714000142", "123"], workers=2))
+        ['03.560.714/0001-42', None]
+    """
+
+    return _run(kind, "format", values, workers, chunk_size)
+
+
+def _run(kind, operation, values, workers, chunk_size):  # type: (str | None, str, Iterable, int | None, int) -> Iterator
+    """
+    Checks the arguments of `validate` and `format`, so that errors are
+    raised when they are called, and returns the generator of the results.
+
+    Besides "validate" and "format", the operation may be "clean", to remove
+    the symbols of the values, or, with no kind, the name of a function of
+    lists of values as "module:function", which the command line interface
+    uses for its own operations.
+    """
+
+    if kind is not None:
+        if kind not in _KINDS:
+            raise ValueError(f"Unsupported kind: {kind}")
+        index = _OPERATIONS.get(operation)
+        if index is not None and _KINDS[kind][index] is None:
+            raise ValueError(f"Unsupported operation for {kind}: {operation}")
+
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if workers < 1:
+        raise ValueError(f"Invalid number of workers: {workers}")
+    if chunk_size < 1:
+        raise ValueError(f"Invalid chunk size: {chunk_size}")
+
+    return _stream(kind, operation, values, workers, chunk_size)
+
+
+def _stream(kind, operation, values, workers, chunk_size):  # type: (str, str, Iterable, int, int) -> Iterator
+    chunks = _chunks(values, chunk_size)
+
+    if workers == 1:
+        function = _resolve(kind, operation)
+        length = _length(kind)
+        for chunk in chunks:
+            yield from function(_to_values(chunk, length))
+        return
+
+    with ProcessPoolExecutor(
+        workers, initializer=_initialize, initargs=(kind, operation)
+    ) as executor:
+        pending = deque()
+        try:
+            for chunk in chunks:
+                pending.append(executor.submit(_process, chunk))
+                if len(pending) >= workers * _CHUNKS_PER_WORKER:
+                    yield from pending.popleft().result()
+
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # When the generator is closed early, the chunks not started
+            # yet are dropped instead of waited for
+            for future in pending:
+                future.cancel()
+
+
+def _chunks(values, chunk_size):  # type: (Iterable | numpy.ndarray, int) -> Iterator
+    """
+    Splits the values in chunks: lists for iterables, slices for arrays, and
+    the file, dtype, offset and bounds of each slice for memory-mapped
+    arrays, which the workers read from the file themselves.
+    """
+
+    if hasattr(values, "dtype") and getattr(values, "ndim", 1) == 1:
+        # A `numpy.memmap` created from a file, not a view of another array
+        if isinstance(values.base, mmap.mmap) and getattr(
+            values, "filename", None
+        ):
+            descriptor = (values.filename, values.dtype.str, values.offset)
+            for start in range(0, len(values), chunk_size):
+                stop = min(start + chunk_size, len(values))
+                yield descriptor + (start, stop)
+        else:
+            for start in range(0, len(values), chunk_size):
+                yield values[start : start + chunk_size]
+        return
+
+    iterator = iter(values)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _to_values(chunk, length):  # type: (list | tuple | numpy.ndarray, int | None) -> list
+    """
+    Converts a chunk to the list of values given to the functions of a kind.
+    """
+
+    if type(chunk) is tuple:
+        import numpy
+
+        filename, dtype, offset, start, stop = chunk
+        dtype = numpy.dtype(dtype)
+        chunk = numpy.memmap(
+            filename,
+            dtype=dtype,
+            mode="r",
+            offset=offset + start * dtype.itemsize,
+            shape=(stop - start,),
+        )
+
+    if not hasattr(chunk, "dtype"):
+        return chunk
+
+    kind = chunk.dtype.kind
+    values = chunk.tolist()
+
+    if kind in "iu":
+        if length is None:
+            return [str(value) for value in values]
+        return [str(value).zfill(length) for value in values]
+    if kind == "S":
+        return [value.decode("ascii", "replace") for value in values]
+    return values
+
+
+def _resolve(kind, operation):  # type: (str | None, str) -> Callable[[list], list]
+    """
+    Returns the function that validates, formats or cleans a list of values
+    of a kind, or the function of lists of values named by `operation`.
+    """
+
+    if kind is None:
+        module_name, name = operation.split(":")
+        return getattr(import_module(module_name), name)
+
+    module = import_module(_KINDS[kind][0])
+
+    if operation == "validate":
+        many = getattr(module, "is_valid_many", None)
+        if many is not None:
+            return many
+        function = module.is_valid
+    else:
+        function = getattr(module, _KINDS[kind][_OPERATIONS[operation]])
+
+    return lambda values: list(map(function, values))
+
+
+def _length(kind):  # type: (str | None) -> int | None
+    """
+    Returns the number of digits of the values of a kind, if any.
+    """
+
+    return None if kind is None else _KINDS[kind][3]
+
+
+def _initialize(kind, operation):  # type: (str | None, str) -> None
+    """
+    Prepares a worker process to validate or format values of a kind.
+    """
+
+    global _worker
+    _worker = (_resolve(kind, operation), _length(kind))
+
+
+def _process(chunk):  # type: (list | tuple | numpy.ndarray) -> list
+    """
+    Validates or formats a chunk of values in a worker process.
+    """
+
+    function, length = _worker
+    return function(_to_values(chunk, length))
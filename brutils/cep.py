@@ -1,10 +1,12 @@
 from json import loads
 from random import randint
+from time import perf_counter
 from unicodedata import normalize
 from urllib.request import urlopen
 
 from brutils.data.enums import UF
 from brutils.exceptions import CEPNotFound, InvalidCEP
+from brutils.instrumentation import _emit
 from brutils.types import Address
 
 # FORMATTING
@@ -157,31 +159,44 @@ def get_address_from_cep(cep, raise_exceptions=False):  # type: (str, bool) -> A
     """
     base_api_url = "https://viacep.com.br/ws/{}/json/"
 
+    start = perf_counter()
     clean_cep = remove_symbols(cep)
     cep_is_valid = _is_valid_format(clean_cep) 
 
     if not cep_is_valid:
+        _emit("get_address_from_cep", "invalid", start, cep=cep)
+
         if raise_exceptions:
             raise InvalidCEP(cep)
 
         return None
 
+    outcome = "error"
     try:
         with urlopen(base_api_url.format(clean_cep)) as f:
             response = f.read()
             data = loads(response)
 
             if data.get("erro", False):
+                outcome = "not_found"
                 raise CEPNotFound(cep)
 
-            return Address(**loads(response))
+            address = Address(**data)
 
     except Exception as e:
+        if outcome == "error":
+            _emit("get_address_from_cep", outcome, start, cep=cep, error=str(e))
+        else:
+            _emit("get_address_from_cep", outcome, start, cep=cep)
+
         if raise_exceptions:
             raise CEPNotFound(cep) from e
 
         return None
 
+    _emit("get_address_from_cep", "ok", start, cep=cep)
+    return address
+
 
 def get_cep_information_from_address(
     federal_unit, city, street, raise_exceptions=False
@@ -228,10 +243,15 @@ def get_cep_information_from_address(
         >>> get_cep_information_from_address("SP", "Example", "Example", True)
         CEPNotFound: SP - Example - Example
     """
+    start = perf_counter()
+    address = {"federal_unit": federal_unit, "city": city, "street": street}
+
     if federal_unit in UF.values:
         federal_unit = UF(federal_unit).name
 
     if federal_unit not in UF.names:
+        _emit("get_cep_information_from_address", "invalid", start, **address)
+
         if raise_exceptions:
             raise ValueError(f"Invalid UF: {federal_unit}")
 
@@ -252,6 +272,7 @@ def get_cep_information_from_address(
         .replace(" ", "%20")
     )
 
+    outcome = "error"
     try:
         with urlopen(
             base_api_url.format(federal_unit, parsed_city, parsed_street)
@@ -260,12 +281,20 @@ def get_cep_information_from_address(
             response = loads(response)
 
             if len(response) == 0:
+                outcome = "not_found"
                 raise CEPNotFound(f"{federal_unit} - {city} - {street}")
 
-            return [Address(**address) for address in response]
+            addresses = [Address(**item) for item in response]
 
     except Exception as e:
+        if outcome == "error":
+            address["error"] = str(e)
+        _emit("get_cep_information_from_address", outcome, start, **address)
+
         if raise_exceptions:
             raise CEPNotFound(f"{federal_unit} - {city} - {street}") from e
 
-        return None
\ No newline at end of file
+        return None
+
+    _emit("get_cep_information_from_address", "ok", start, **address)
+    return addresses
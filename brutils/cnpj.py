@@ -209,6 +209,155 @@ def generate(branch=1):  # type: (int) -> str
     return base + _checksum(base)
 
 
+# ENCODING
+############
+
+
+def to_int(cnpj):  # type: (str) -> int | None
+    """
+    Encodes a CNPJ as an integer.
+
+    The integer keeps the value of the CNPJ in 8 bytes, instead of the
+    about 60 bytes of a string, and `from_int` restores its leading zeros.
+
+    Args:
+        cnpj (str): A CNPJ digit string.
+
+    Returns:
+        int: The CNPJ as an integer, or None if the CNPJ is not valid.
+
+    Example:
+        >>> to_int("03560714000142")
+        3560714000142
+        >>> to_int("00111222000133")
+        None
+    """
+
+    return int(cnpj) if is_valid(cnpj) else None
+
+
+def from_int(number):  # type: (int) -> str | None
+    """
+    Decodes a CNPJ encoded as an integer by `to_int`.
+
+    Args:
+        number (int): The CNPJ as an integer.
+
+    Returns:
+        str: The CNPJ digit string, with its leading zeros, or None if the
+             integer is not a valid CNPJ.
+
+    Example:
+        >>> from_int(3560714000142)
+        '03560714000142'
+        >>> from_int(0)
+        None
+    """
+
+    if (
+        not isinstance(number, int)
+        or isinstance(number, bool)
+        or not 0 <= number < 10**14
+    ):
+        return None
+
+    cnpj = str(number).zfill(14)
+    return cnpj if is_valid(cnpj) else None
+
+
+def encode_many(cnpjs):  # type: (Iterable[str] | numpy.ndarray) -> numpy.ndarray
+    """
+    Encodes many CNPJs as a NumPy array of unsigned 64-bit integers.
+
+    The CNPJs are validated with integer arithmetic over the digits of
+    all of them at once, which is much faster than calling `to_int` for
+    each one. Arrays of fixed-width strings (e.g. `numpy.dtype("S14")`)
+    are read without creating a Python object for each CNPJ. Requires
+    NumPy.
+
+    Args:
+        cnpjs (Iterable[str] or numpy.ndarray): The CNPJ digit strings.
+
+    Returns:
+        numpy.ndarray: The CNPJs as integers (`numpy.uint64`), in the same
+                       order as the input, with `brutils.encoded.INVALID`
+                       for the ones that are not valid.
+
+    Example:
+        >>> encode_many(["03560714000142", "00111222000133"])
+        array([       3560714000142, 18446744073709551615], dtype=uint64)
+    """
+
+    from brutils import encoded
+
+    return encoded._encode(cnpjs, 14, encoded._is_valid_cnpj, to_int)
+
+
+def decode_many(numbers):  # type: (numpy.ndarray | Iterable[int]) -> list[str | None]
+    """
+    Decodes many CNPJs encoded as integers by `encode_many`.
+
+    Requires NumPy.
+
+    Args:
+        numbers (numpy.ndarray or Iterable[int]): The CNPJs as integers.
+
+    Returns:
+        list[str | None]: The CNPJ digit strings, with their leading
+                          zeros, in the same order as the input, with None
+                          for the integers that are not valid CNPJs.
+
+    Example:
+        >>> decode_many(encode_many(["03560714000142", "00111222000133"]))
+        ['03560714000142', None]
+    """
+
+    from brutils import encoded
+
+    return encoded._decode(numbers, 14, encoded._is_valid_cnpj)
+
+
+def group_by_root(numbers):  # type: (numpy.ndarray) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+    """
+    Groups CNPJs encoded by `encode_many` by their root, the first 8
+    digits, which identify the company of each of its branches.
+
+    Requires NumPy.
+
+    Args:
+        numbers (numpy.ndarray): The CNPJs as integers.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The sorted
+            distinct roots (`cnpj // 10**6`), the position of the first
+            CNPJ of each root, and the sorted distinct valid CNPJs, so that
+            the CNPJs of `roots[i]` are `cnpjs[starts[i]:starts[i + 1]]`.
+
+    Example:
+        >>> roots, starts, cnpjs = group_by_root(
+        ...     encode_many(
+        ...         ["03560714000142", "03560714000223", "11222333000181"]
+        ...     )
+        ... )
+        >>> roots, starts
+        (array([ 3560714, 11222333], dtype=uint64), array([0, 2]))
+    """
+
+    import numpy
+
+    from brutils import encoded
+
+    cnpjs = encoded.unique(numbers)
+    roots = cnpjs // numpy.uint64(10**6)
+
+    first = numpy.empty(len(roots), dtype=bool)
+    first[:1] = True
+    numpy.not_equal(roots[1:], roots[:-1], out=first[1:])
+    starts = numpy.flatnonzero(first)
+
+    return roots[starts], starts, cnpjs
+
+
 def _hashdigit(cnpj, position):  # type: (str, int) -> int
     """
     Calculates the checksum digit at the given `position` for the provided
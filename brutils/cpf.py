@@ -185,6 +185,114 @@ def generate():  # type: () -> str
     return base + _checksum(base)
 
 
+# ENCODING
+############
+
+
+def to_int(cpf):  # type: (str) -> int | None
+    """
+    Encodes a CPF as an integer.
+
+    The integer keeps the value of the CPF in 8 bytes, instead of the
+    about 60 bytes of a string, and `from_int` restores its leading zeros.
+
+    Args:
+        cpf (str): A CPF digit string.
+
+    Returns:
+        int: The CPF as an integer, or None if the CPF is not valid.
+
+    Example:
+        >>> to_int("01234567890")
+        1234567890
+        >>> to_int("00000000000")
+        None
+    """
+
+    return int(cpf) if is_valid(cpf) else None
+
+
+def from_int(number):  # type: (int) -> str | None
+    """
+    Decodes a CPF encoded as an integer by `to_int`.
+
+    Args:
+        number (int): The CPF as an integer.
+
+    Returns:
+        str: The CPF digit string, with its leading zeros, or None if the
+             integer is not a valid CPF.
+
+    Example:
+        >>> from_int(1234567890)
+        '01234567890'
+        >>> from_int(0)
+        None
+    """
+
+    if (
+        not isinstance(number, int)
+        or isinstance(number, bool)
+        or not 0 <= number < 10**11
+    ):
+        return None
+
+    cpf = str(number).zfill(11)
+    return cpf if is_valid(cpf) else None
+
+
+def encode_many(cpfs):  # type: (Iterable[str] | numpy.ndarray) -> numpy.ndarray
+    """
+    Encodes many CPFs as a NumPy array of unsigned 64-bit integers.
+
+    The CPFs are validated with integer arithmetic over the digits of
+    all of them at once, which is much faster than calling `to_int` for
+    each one. Arrays of fixed-width strings (e.g. `numpy.dtype("S11")`)
+    are read without creating a Python object for each CPF. Requires
+    NumPy.
+
+    Args:
+        cpfs (Iterable[str] or numpy.ndarray): The CPF digit strings.
+
+    Returns:
+        numpy.ndarray: The CPFs as integers (`numpy.uint64`), in the same
+                       order as the input, with `brutils.encoded.INVALID`
+                       for the ones that are not valid.
+
+    Example:
+        >>> encode_many(["01234567890", "00000000000"])
+        array([          1234567890, 18446744073709551615], dtype=uint64)
+    """
+
+    from brutils import encoded
+
+    return encoded._encode(cpfs, 11, encoded._is_valid_cpf, to_int)
+
+
+def decode_many(numbers):  # type: (numpy.ndarray | Iterable[int]) -> list[str | None]
+    """
+    Decodes many CPFs encoded as integers by `encode_many`.
+
+    Requires NumPy.
+
+    Args:
+        numbers (numpy.ndarray or Iterable[int]): The CPFs as integers.
+
+    Returns:
+        list[str | None]: The CPF digit strings, with their leading
+                          zeros, in the same order as the input, with None
+                          for the integers that are not valid CPFs.
+
+    Example:
+        >>> decode_many(encode_many(["01234567890", "00000000000"]))
+        ['01234567890', None]
+    """
+
+    from brutils import encoded
+
+    return encoded._decode(numbers, 11, encoded._is_valid_cpf)
+
+
 def _hashdigit(cpf, position):  # type: (str, int) -> int
     """
     Compute the given position checksum digit for a CPF.
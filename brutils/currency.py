@@ -1,7 +1,143 @@
-from decimal import ROUND_DOWN, Decimal, InvalidOperation
+from decimal import ROUND_DOWN, ROUND_HALF_EVEN, Decimal, InvalidOperation
 from typing import Union
 
-from num2words import num2words
+from brutils.number_words import _from_words, _normalize, _to_words
+
+
+class CurrencyFormatter:
+    """
+    Reusable formatter of values as Brazilian currency (R$).
+
+    Integer and float values are grouped directly by Python's number
+    formatting, with "_" as a placeholder for the thousands separator, and
+    never go through `Decimal`, which makes formatting large amounts of values (e.g.
+    invoice tables and CSV exports) faster than repeated calls to
+    `format_currency`. With the default options, the output is identical to
+    the one of `format_currency`.
+
+    Args:
+        symbol (str): The currency symbol placed before the number. Default
+                      is 'R$'. An empty string omits the symbol.
+        negative_style (str): How negative values are written:
+                              'after_symbol' ('R$ -1,00', the default),
+                              'before_symbol' ('-R$ 1,00') or
+                              'parentheses' ('(R$ 1,00)').
+        integer_cents (bool): Whether the values are integer amounts of
+                              cents, e.g. 123456 for 'R$ 1.234,56'. Default
+                              is False.
+
+    Raises:
+        ValueError: If `negative_style` is not one of the supported styles.
+
+    Example:
+        >>> formatter = CurrencyFormatter(negative_style="parentheses")
+        >>> formatter.format(-1234.5)
+        '(R$ 1.234,50)'
+        >>> CurrencyFormatter(integer_cents=True).format(123456)
+        'R$ 1.234,56'
+        >>> CurrencyFormatter(symbol="").format_many([1, 2.5])
+        ['1,00', '2,50']
+    """
+
+    __slots__ = ("symbol", "negative_style", "integer_cents", "_prefix")
+
+    NEGATIVE_STYLES = ("after_symbol", "before_symbol", "parentheses")
+
+    def __init__(
+        self, symbol="R$", negative_style="after_symbol", integer_cents=False
+    ):  # type: (str, str, bool) -> None
+        if negative_style not in self.NEGATIVE_STYLES:
+            raise ValueError(
+                f"Invalid negative style '{negative_style}'. Please use one "
+                f"of: {', '.join(self.NEGATIVE_STYLES)}."
+            )
+
+        self.symbol = symbol
+        self.negative_style = negative_style
+        self.integer_cents = integer_cents
+        self._prefix = f"{symbol} " if symbol else ""
+
+    def format(self, value):  # type: (int | float | Decimal) -> str | None
+        """
+        Formats a value as Brazilian currency.
+
+        Args:
+            value (int, float or Decimal): The value to be formatted, or an
+                                           integer amount of cents when the
+                                           formatter uses `integer_cents`.
+
+        Returns:
+            str or None: The formatted value, or None if the input is
+                         invalid.
+        """
+
+        number = self._format_number(value)
+        if number is None:
+            return None
+
+        if number[0] == "-" and self.negative_style != "after_symbol":
+            if self.negative_style == "before_symbol":
+                return f"-{self._prefix}{number[1:]}"
+            return f"({self._prefix}{number[1:]})"
+
+        return self._prefix + number
+
+    def format_many(self, values):  # type: (Iterable) -> list[str | None]
+        """
+        Formats many values as Brazilian currency.
+
+        Args:
+            values (Iterable or numpy.ndarray): The values to be formatted.
+
+        Returns:
+            list[str | None]: The formatted values, in the same order as the
+                              input, with None for the invalid ones.
+        """
+
+        # NumPy arrays (and other array-likes) are converted to Python
+        # numbers in a single call
+        if hasattr(values, "tolist"):
+            values = values.tolist()
+
+        if self.negative_style == "after_symbol":
+            format_number = self._format_number
+            prefix = self._prefix
+            return [
+                None if number is None else prefix + number
+                for number in map(format_number, values)
+            ]
+
+        return [self.format(value) for value in values]
+
+    def _format_number(self, value):  # type: (int | float | Decimal) -> str | None
+        """
+        Formats a value with Brazilian separators, without the symbol.
+        """
+
+        value_type = type(value)
+
+        if self.integer_cents:
+            if value_type is not int:
+                if not isinstance(value, int) or isinstance(value, bool):
+                    return None
+                value = int(value)
+            sign = "-" if value < 0 else ""
+            units, cents = divmod(abs(value), 100)
+            return f"{sign}{units:_},{cents:02d}".replace("_", ".")
+
+        if value_type is int:
+            return f"{value:_},00".replace("_", ".")
+
+        if value_type is float and value - value == 0:
+            return f"{value:_.2f}".replace(".", ",").replace("_", ".")
+
+        try:
+            number = f"{Decimal(value):,.2f}"
+        except InvalidOperation:
+            return None
+
+        # `Decimal` does not support the "_" thousands separator
+        return number.replace(",", "_").replace(".", ",").replace("_", ".")
 
 
 def format_currency(value):  # type: (float) -> str | None
@@ -30,18 +166,205 @@ def format_currency(value):  # type: (float) -> str | None
         None
     """
 
-    try:
-        decimal_value = Decimal(value)
-        formatted_value = (
-            f"R$ {decimal_value:,.2f}".replace(",", "_")
-            .replace(".", ",")
-            .replace("_", ".")
-        )
+    return _DEFAULT_FORMATTER.format(value)
 
-        return formatted_value
-    except InvalidOperation:
+
+def format_currency_many(values, formatter=None):  # type: (Iterable, CurrencyFormatter) -> list[str | None]
+    """
+    Formats many values as Brazilian currency (R$).
+
+    The result is the same as calling `format_currency` for each value, but
+    faster for large inputs such as table columns and NumPy arrays.
+
+    Args:
+        values (Iterable or numpy.ndarray): The numeric values to be
+                                            formatted.
+        formatter (CurrencyFormatter): A formatter with custom options
+                                       (default is the same formatting as
+                                       `format_currency`).
+
+    Returns:
+        list[str | None]: The values formatted as Brazilian currency, in the
+                          same order as the input, with None for the
+                          invalid ones.
+
+    Example:
+        >>> format_currency_many([1234.56, 0, "not a number"])
+        ['R$ 1.234,56', 'R$ 0,00', None]
+        >>> formatter = CurrencyFormatter(integer_cents=True)
+        >>> format_currency_many([123456, -50], formatter=formatter)
+        ['R$ 1.234,56', 'R$ -0,50']
+    """
+
+    return (formatter or _DEFAULT_FORMATTER).format_many(values)
+
+
+def parse_currency(value, strict=True, as_decimal=False):  # type: (str, bool, bool) -> int | Decimal | None
+    """
+    Parses a string formatted as Brazilian currency (R$).
+
+    Parsing is a single pass of string operations (no regular expressions
+    and no `locale`), and the amount is returned as an integer number of
+    cents by default, so it can be summed without floating-point errors.
+
+    In strict mode, the accepted strings are the ones written with
+    Brazilian separators, with or without the symbol, e.g. 'R$ 1.234,56',
+    '1234,5', '-R$ 0,50', 'R$ -0,50' or '(R$ 0,50)'. The thousands
+    separators, when present, must be in the right places, and at most two
+    decimal places are allowed. The lenient mode also accepts surrounding
+    whitespace, spaces around the sign and the symbol, a lowercase symbol,
+    a '+' sign, thousands separators in any position and more than two
+    decimal places, which are rounded half to even.
+
+    Args:
+        value (str): The string to be parsed.
+        strict (bool): Whether to only accept well-formed strings (default
+                       is True).
+        as_decimal (bool): Whether to return a `Decimal` amount of reais
+                           instead of an integer amount of cents (default
+                           is False).
+
+    Returns:
+        int, Decimal or None: The amount in cents, or in reais if
+                              `as_decimal` is True, or None if the string
+                              is not a valid currency value.
+
+    Example:
+        >>> parse_currency("R$ 1.234,56")
+        123456
+        >>> parse_currency("-R$ 0,50", as_decimal=True)
+        Decimal('-0.50')
+        >>> parse_currency("1.234.567,8")
+        123456780
+        >>> parse_currency(" r$1234,567 ")
+        None
+        >>> parse_currency(" r$1234,567 ", strict=False)
+        123457
+    """
+
+    cents = _parse_cents(value, strict)
+    if cents is None or not as_decimal:
+        return cents
+
+    return Decimal(cents).scaleb(-2)
+
+
+def parse_currency_many(values, strict=True, as_decimal=False):  # type: (Iterable, bool, bool) -> list[int | Decimal | None]
+    """
+    Parses many strings formatted as Brazilian currency (R$).
+
+    The result is the same as calling `parse_currency` for each string, but
+    faster for large inputs such as bank statements and CSV columns.
+
+    Args:
+        values (Iterable or numpy.ndarray): The strings to be parsed.
+        strict (bool): Whether to only accept well-formed strings (default
+                       is True).
+        as_decimal (bool): Whether to return `Decimal` amounts of reais
+                           instead of integer amounts of cents (default is
+                           False).
+
+    Returns:
+        list[int | Decimal | None]: The parsed amounts, in the same order as
+                                    the input, with None for the invalid
+                                    strings.
+
+    Example:
+        >>> parse_currency_many(["R$ 1.234,56", "-R$ 0,50", "abc"])
+        [123456, -50, None]
+    """
+
+    if hasattr(values, "tolist"):
+        values = values.tolist()
+
+    amounts = [_parse_cents(value, strict) for value in values]
+    if not as_decimal:
+        return amounts
+
+    return [
+        None if cents is None else Decimal(cents).scaleb(-2)
+        for cents in amounts
+    ]
+
+
+def _parse_cents(value, strict):  # type: (str, bool) -> int | None
+    """
+    Parses a string formatted as Brazilian currency into cents.
+    """
+
+    if not isinstance(value, str):
         return None
 
+    if not strict:
+        value = value.strip()
+
+    signs = _STRICT_SIGNS if strict else _LENIENT_SIGNS
+    negative = signed = False
+
+    if value[:1] == "(" and value[-1:] == ")":
+        negative = signed = True
+        value = value[1:-1]
+
+    # The sign may come before or after the symbol, but only once
+    if value[:1] in signs:
+        if signed:
+            return None
+        negative, signed = value[0] == "-", True
+        value = value[1:] if strict else value[1:].lstrip()
+
+    if value[:2] == "R$" or (not strict and value[:2] == "r$"):
+        value = value[2:]
+        if not strict:
+            value = value.lstrip()
+        elif value[:1] in _SPACES:
+            value = value[1:]
+
+        if value[:1] in signs:
+            if signed:
+                return None
+            negative = value[0] == "-"
+            value = value[1:] if strict else value[1:].lstrip()
+
+    integer, separator, fraction = value.partition(",")
+
+    if "." in integer:
+        digits = integer.replace(".", "")
+        if strict:
+            # Thousands separators must be every 4th character from the
+            # end, and nowhere else
+            length = len(integer)
+            separators = length // 4
+            if (
+                not length % 4
+                or length - len(digits) != separators
+                or integer[length % 4 :: 4] != "." * separators
+            ):
+                return None
+        integer = digits
+
+    if not integer and not strict and fraction:
+        integer = "0"
+
+    if not (integer.isdigit() and integer.isascii()):
+        return None
+
+    if not separator:
+        cents = int(integer) * 100
+    elif not (fraction.isdigit() and fraction.isascii()):
+        return None
+    elif len(fraction) <= 2:
+        cents = int(integer) * 100 + int(fraction.ljust(2, "0"))
+    elif strict:
+        return None
+    else:
+        cents = int(
+            Decimal(
+                f"{integer}{fraction[:2]}.{fraction[2:]}"
+            ).to_integral_value(ROUND_HALF_EVEN)
+        )
+
+    return -cents if negative else cents
+
 
 def convert_real_to_text(amount: Decimal) -> Union[str, None]:
     """
@@ -106,17 +429,18 @@ def convert_real_to_text(amount: Decimal) -> Union[str, None]:
     if reais > 0:
         """
         Note:
-        Although the `num2words` library provides a "to='currency'" feature, it has known
-        issues with the representation of "zero reais" and "zero centavos". Therefore, this
-        implementation uses only the traditional number-to-text conversion for better accuracy.
+        The integer part is converted by the internal pt-BR cardinal engine, which
+        produces the same text as `num2words(reais, lang="pt_BR")` without loading
+        the `num2words` library. Its "to='currency'" feature is not used because of
+        known issues with the representation of "zero reais" and "zero centavos".
         """
-        reais_text = num2words(reais, lang="pt_BR")
+        reais_text = _to_words(reais)
         currency_text = "real" if reais == 1 else "reais"
         conector = "de " if reais_text.endswith(("lhão", "lhões")) else ""
         parts.append(f"{reais_text} {conector}{currency_text}")
 
     if centavos > 0:
-        centavos_text = f"{num2words(centavos, lang='pt_BR')} {'centavo' if centavos == 1 else 'centavos'}"
+        centavos_text = f"{_to_words(centavos)} {'centavo' if centavos == 1 else 'centavos'}"
         if reais > 0:
             parts.append(f"e {centavos_text}")
         else:
@@ -130,3 +454,123 @@ def convert_real_to_text(amount: Decimal) -> Union[str, None]:
         result = f"Menos {result}"
 
     return result.capitalize()
+
+
+def parse_real_text(text):  # type: (str) -> Decimal | None
+    """
+    Converts an amount in Brazilian Reais written out in Portuguese to a
+    `Decimal`.
+
+    It is the inverse of `convert_real_to_text`, and can be used to check
+    the amount written out in cheques and contracts against the numeric
+    one. The text is case- and accent-insensitive, commas are ignored, and
+    every word is looked up in a table of number, scale and currency words
+    in a single pass, so the time taken is linear in the length of the
+    text.
+
+    Args:
+        text (str): The amount written out, with "real"/"reais" after the
+                    integer part and "centavo"/"centavos" after the
+                    fractional part, and optionally starting with "menos".
+
+    Returns:
+        Decimal or None: The amount with 2 decimal places, or None if the
+                         text is not a valid amount.
+
+    Example:
+        >>> parse_real_text("Mil, quinhentos e vinte e três reais e quarenta e cinco centavos")
+        Decimal('1523.45')
+        >>> parse_real_text("UM MILHAO DE REAIS")
+        Decimal('1000000.00')
+        >>> parse_real_text("Menos cinquenta centavos")
+        Decimal('-0.50')
+        >>> parse_real_text("vinte e cem reais")
+        None
+    """
+
+    cents = _parse_real_text_cents(text)
+    if cents is None:
+        return None
+
+    return Decimal(cents).scaleb(-2)
+
+
+def parse_real_text_many(texts):  # type: (Iterable[str]) -> list[Decimal | None]
+    """
+    Converts many amounts in Brazilian Reais written out in Portuguese to
+    `Decimal`.
+
+    Args:
+        texts (Iterable[str]): The amounts written out.
+
+    Returns:
+        list[Decimal | None]: The amounts with 2 decimal places, in the same
+                              order as the input, with None for the invalid
+                              texts.
+
+    Example:
+        >>> parse_real_text_many(["Um real", "Dez centavos", "abc"])
+        [Decimal('1.00'), Decimal('0.10'), None]
+    """
+
+    return [
+        None if cents is None else Decimal(cents).scaleb(-2)
+        for cents in map(_parse_real_text_cents, texts)
+    ]
+
+
+def _parse_real_text_cents(text):  # type: (str) -> int | None
+    """
+    Converts an amount in Brazilian Reais written out in Portuguese to
+    cents.
+    """
+
+    if not isinstance(text, str):
+        return None
+
+    words = _normalize(text).replace(",", " ").split()
+
+    negative = words[:1] == ["menos"]
+    if negative:
+        del words[0]
+
+    reais = centavos = None
+    start = 0
+
+    for index, word in enumerate(words):
+        if word == "reais" or word == "real":
+            if reais is not None or centavos is not None:
+                return None
+            end = index - 1 if words[index - 1 : index] == ["de"] else index
+            reais = _from_words(words[start:end])
+            if reais is None:
+                return None
+            start = index + 1
+            # The fractional part is introduced by "e"
+            if words[start : start + 1] == ["e"]:
+                start += 1
+                if start == len(words):
+                    return None
+
+        elif word == "centavos" or word == "centavo":
+            if centavos is not None or index + 1 != len(words):
+                return None
+            centavos = _from_words(words[start:index])
+            if centavos is None or centavos > 99:
+                return None
+            start = index + 1
+
+    if start != len(words) or (reais is None and centavos is None):
+        return None
+
+    cents = (reais or 0) * 100 + (centavos or 0)
+    return -cents if negative else cents
+
+
+_DEFAULT_FORMATTER = CurrencyFormatter()
+
+# Spaces accepted between the symbol and the number, including the
+# non-breaking space used by `Intl.NumberFormat` and spreadsheets
+_SPACES = (" ", "\xa0")
+_STRICT_SIGNS = ("-",)
+_LENIENT_SIGNS = ("-", "+")
@@ -0,0 +1,35 @@
+# Common email domains in Brazil, from the most to the least used, which are
+# suggested as corrections of mistyped domains. When two domains are equally
+# close to a mistyped one, the first of them is suggested.
+
+EMAIL_DOMAINS = (
+    "gmail.com",
+    "hotmail.com",
+    "outlook.com",
+    "yahoo.com.br",
+    "hotmail.com.br",
+    "outlook.com.br",
+    "live.com",
+    "yahoo.com",
+    "icloud.com",
+    "bol.com.br",
+    "uol.com.br",
+    "terra.com.br",
+    "ig.com.br",
+    "globo.com",
+    "globomail.com",
+    "msn.com",
+    "me.com",
+    "r7.com",
+    "oi.com.br",
+    "zipmail.com.br",
+    "protonmail.com",
+    "proton.me",
+    "aol.com",
+    "gmx.com",
+    "mail.com",
+    "yandex.com",
+    "live.com.br",
+    "ymail.com",
+    "googlemail.com",
+)
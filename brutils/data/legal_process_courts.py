@@ -0,0 +1,83 @@
+# Labels for the justice segment (J) and tribunal (TR) fields of a CNJ legal
+# process ID, as defined by the CNJ Resolution 65/2008. Both tables are
+# indexed by the numeric code found in the ID, with None for unused codes.
+
+_UFS = (
+    "AC",
+    "AL",
+    "AP",
+    "AM",
+    "BA",
+    "CE",
+    "DF",
+    "ES",
+    "GO",
+    "MA",
+    "MT",
+    "MS",
+    "MG",
+    "PA",
+    "PB",
+    "PR",
+    "PE",
+    "PI",
+    "RJ",
+    "RN",
+    "RS",
+    "RO",
+    "RR",
+    "SC",
+    "SE",
+    "SP",
+    "TO",
+)
+
+
+def _table(labels):
+    table = [None] * 100
+    for code, label in labels.items():
+        table[code] = label
+    return tuple(table)
+
+
+SEGMENTS = (
+    None,
+    "Supremo Tribunal Federal",
+    "Conselho Nacional de Justiça",
+    "Superior Tribunal de Justiça",
+    "Justiça Federal",
+    "Justiça do Trabalho",
+    "Justiça Eleitoral",
+    "Justiça Militar da União",
+    "Justiça dos Estados e do Distrito Federal e Territórios",
+    "Justiça Militar Estadual",
+)
+
+TRIBUNALS = (
+    None,
+    _table({code: "STF" for code in range(100)}),
+    _table({code: "CNJ" for code in range(100)}),
+    _table({code: "STJ" for code in range(100)}),
+    _table({**{code: f"TRF{code}" for code in range(1, 7)}, 90: "CJF"}),
+    _table(
+        {
+            0: "TST",
+            **{code: f"TRT{code}" for code in range(1, 25)},
+            90: "CSJT",
+        }
+    ),
+    _table(
+        {
+            0: "TSE",
+            **{code: f"TRE-{uf}" for code, uf in enumerate(_UFS, start=1)},
+        }
+    ),
+    _table({0: "STM", **{code: f"{code}ª CJM" for code in range(1, 13)}}),
+    _table(
+        {
+            code: "TJDFT" if uf == "DF" else f"TJ{uf}"
+            for code, uf in enumerate(_UFS, start=1)
+        }
+    ),
+    _table({13: "TJMMG", 21: "TJMRS", 26: "TJMSP"}),
+)
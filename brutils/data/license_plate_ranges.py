@@ -0,0 +1,57 @@
+# Letter ranges (first and last 3-letter prefix, inclusive) in which the
+# pre-Mercosul license plates (LLLNNNN) were issued by each state, sorted by
+# the first prefix. Prefixes outside these ranges have no known issuing UF.
+
+LICENSE_PLATE_RANGES = (
+    ("AAA", "BEZ", "PR"),
+    ("BFA", "GKI", "SP"),
+    ("GKJ", "HOK", "MG"),
+    ("HOL", "HQE", "MA"),
+    ("HQF", "HTW", "MS"),
+    ("HTX", "HZA", "CE"),
+    ("HZB", "IAP", "SE"),
+    ("IAQ", "JDO", "RS"),
+    ("JDP", "JKR", "DF"),
+    ("JKS", "JSZ", "BA"),
+    ("JTA", "JWE", "PA"),
+    ("JWF", "JXY", "AM"),
+    ("JXZ", "KAU", "MT"),
+    ("KAV", "KFC", "GO"),
+    ("KFD", "KME", "PE"),
+    ("KMF", "LVE", "RJ"),
+    ("LVF", "LWQ", "PI"),
+    ("LWR", "MMM", "SC"),
+    ("MMN", "MOW", "PB"),
+    ("MOX", "MTZ", "ES"),
+    ("MUA", "MVK", "AL"),
+    ("MVL", "MXG", "TO"),
+    ("MXH", "MZM", "RN"),
+    ("MZN", "NAG", "AC"),
+    ("NAH", "NBA", "RR"),
+    ("NBB", "NEH", "RO"),
+    ("NEI", "NFB", "AP"),
+    ("NFC", "NGZ", "GO"),
+    ("NHA", "NHT", "MA"),
+    ("NHU", "NIX", "PI"),
+    ("NIY", "NJW", "MT"),
+    ("NJX", "NLU", "GO"),
+    ("NLV", "NMO", "AL"),
+    ("NMP", "NNI", "MA"),
+    ("NNJ", "NOH", "RN"),
+    ("NOI", "NPB", "AM"),
+    ("NPC", "NPQ", "RR"),
+    ("NPR", "NQK", "PI"),
+    ("NQL", "NRE", "CE"),
+    ("NRF", "NSD", "MS"),
+    ("NSE", "NTC", "PA"),
+    ("NTD", "NTW", "BA"),
+    ("NTX", "NUG", "MT"),
+    ("NUH", "NVF", "CE"),
+    ("NVG", "NVN", "SE"),
+    ("NVO", "NWR", "GO"),
+    ("NWS", "NXQ", "MA"),
+    ("NXR", "NXT", "AC"),
+    ("NXU", "NXW", "PE"),
+    ("NXX", "NYG", "MG"),
+    ("NYH", "NZZ", "BA"),
+)
@@ -0,0 +1,74 @@
+# Municipal holidays, by the IBGE code of the municipality, as
+# (code, month, day, rule) rows. With the FIXED rule, the holiday is on the
+# given month and day every year; with the EASTER rule, the month is 0 and
+# the holiday is `day` days after Easter Sunday (60 for Corpus Christi).
+# Holidays that are also national or state holidays are not listed. The
+# state capitals are covered, except for Rio Branco (AC, 1200401), whose
+# municipal holidays are not listed yet; Brasília (DF) has no municipalities.
+
+FIXED = 0
+EASTER = 1
+
+MUNICIPAL_HOLIDAYS = (
+    # Porto Velho (RO): Aniversário da cidade
+    (1100205, 10, 2, FIXED),
+    # Manaus (AM): Aniversário da cidade, Nossa Senhora da Conceição
+    (1302603, 10, 24, FIXED),
+    (1302603, 12, 8, FIXED),
+    # Boa Vista (RR): Aniversário da cidade
+    (1400100, 7, 9, FIXED),
+    # Belém (PA): Aniversário da cidade
+    (1501402, 1, 12, FIXED),
+    # Macapá (AP): Aniversário da cidade
+    (1600303, 2, 4, FIXED),
+    # Palmas (TO): Aniversário da cidade
+    (1721000, 5, 20, FIXED),
+    # São Luís (MA): Aniversário da cidade
+    (2111300, 9, 8, FIXED),
+    # Teresina (PI): Aniversário da cidade
+    (2211001, 8, 16, FIXED),
+    # Fortaleza (CE): Nossa Senhora da Assunção
+    (2304400, 8, 15, FIXED),
+    # Natal (RN): Santos Reis, Nossa Senhora da Apresentação
+    (2408102, 1, 6, FIXED),
+    (2408102, 11, 21, FIXED),
+    # João Pessoa (PB): Nossa Senhora das Neves
+    (2507507, 8, 5, FIXED),
+    # Recife (PE): Nossa Senhora do Carmo, Nossa Senhora da Conceição
+    (2611606, 7, 16, FIXED),
+    (2611606, 12, 8, FIXED),
+    # Maceió (AL): Nossa Senhora dos Prazeres
+    (2704302, 8, 27, FIXED),
+    # Aracaju (SE): Aniversário da cidade, Nossa Senhora da Conceição
+    (2800308, 3, 17, FIXED),
+    (2800308, 12, 8, FIXED),
+    # Salvador (BA): São João, Nossa Senhora da Conceição da Praia
+    (2927408, 6, 24, FIXED),
+    (2927408, 12, 8, FIXED),
+    # Belo Horizonte (MG): Corpus Christi, Assunção de Nossa Senhora,
+    # Imaculada Conceição
+    (3106200, 0, 60, EASTER),
+    (3106200, 8, 15, FIXED),
+    (3106200, 12, 8, FIXED),
+    # Vitória (ES): Nossa Senhora da Vitória
+    (3205309, 9, 8, FIXED),
+    # Rio de Janeiro (RJ): São Sebastião
+    (3304557, 1, 20, FIXED),
+    # São Paulo (SP): Aniversário da cidade, Corpus Christi
+    (3550308, 1, 25, FIXED),
+    (3550308, 0, 60, EASTER),
+    # Curitiba (PR): Nossa Senhora da Luz dos Pinhais
+    (4106902, 9, 8, FIXED),
+    # Florianópolis (SC): Aniversário da cidade
+    (4205407, 3, 23, FIXED),
+    # Porto Alegre (RS): Nossa Senhora dos Navegantes
+    (4314902, 2, 2, FIXED),
+    # Campo Grande (MS): Santo Antônio, Aniversário da cidade
+    (5002704, 6, 13, FIXED),
+    (5002704, 8, 26, FIXED),
+    # Cuiabá (MT): Aniversário da cidade
+    (5103403, 4, 8, FIXED),
+    # Goiânia (GO): Nossa Senhora Auxiliadora, Aniversário da cidade
+    (5208707, 5, 24, FIXED),
+    (5208707, 10, 24, FIXED),
+)
@@ -1,8 +1,45 @@
 import re
+from datetime import date as Date
+from functools import lru_cache
 from typing import Union
-from num2words import num2words
-from datetime import datetime
+
 from brutils.data.enums.months import MonthsEnum
+from brutils.number_words import _FOLD, _NUMBER_WORDS, _from_words, _to_words
+
+# Days written out, indexed by the day of the month
+_DAY_WORDS = (None, "Primeiro") + tuple(
+    _to_words(day, comma=False).capitalize() for day in range(2, 32)
+)
+
+# Month names, indexed by the number of the month
+_MONTH_NAMES = (None,) + tuple(
+    MonthsEnum(month).month_name for month in range(1, 13)
+)
+
+# Number of days of each month in a common year
+_DAYS_IN_MONTH = (None, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Separators of the day-first formats (dd/mm/yyyy, dd.mm.yyyy, dd-mm-yyyy)
+_SEPARATORS = ("/", ".", "-")
+
+# Number of each month, by its name without accents
+_MONTH_NUMBERS = {
+    name: month for month, name in enumerate(_MONTH_NAMES) if name
+}
+
+# A date written out ("primeiro de março de dois mil e vinte e quatro"), to
+# be matched against a text folded with `_FOLD`. The alternations of words
+# are compiled once, and the values of the day and the year are checked
+# afterwards by `_from_words`
+_NUMBER_PATTERN = "|".join(
+    sorted((word for word in _NUMBER_WORDS if word != "zero"), key=len)[::-1]
+)
+_TEXT_DATE = re.compile(
+    rf"\b(?P<day>primeiro|(?:{_NUMBER_PATTERN})(?:\s+e\s+(?:{_NUMBER_PATTERN}))?)"
+    rf"\s+de\s+(?P<month>{'|'.join(_MONTH_NUMBERS)})\s+de\s+"
+    rf"(?P<year>(?:{_NUMBER_PATTERN}|mil)(?:\s+(?:e\s+)?(?:{_NUMBER_PATTERN}|mil))*)\b"
+)
+
 
 def convert_date_to_text(date: str) -> Union[str, None]:
     """
@@ -24,41 +61,243 @@ def convert_date_to_text(date: str) -> Union[str, None]:
         ValueError: If the input date string does not match any of the supported formats
     """
 
-    supported_formats = {
-        r"^\d{2}/\d{2}/\d{4}$": '%d/%m/%Y',  
-        r"^\d{2}\.\d{2}\.\d{4}$": '%d.%m.%Y', 
-        r"^\d{2}-\d{2}-\d{4}$": '%d-%m-%Y', 
-        r"^\d{4}-\d{2}-\d{2}$": '%Y-%m-%d',    
-    }
-
-    matched_strptime_format = None
+    parsed = _parse_date(date)
 
-    for regex_pattern, strptime_format in supported_formats.items():
-        if re.match(regex_pattern, date):
-            matched_strptime_format = strptime_format
-            break
-    
-    if not matched_strptime_format:
+    if parsed is False:
         raise ValueError(
             f"Date '{date}' has an invalid format. Please use one of the supported formats: dd/mm/yyyy, dd.mm.yyyy, dd-mm-yyyy, or YYYY-MM-DD."
         )
 
-    dateObject = None
-    try: 
-        dateObject = datetime.strptime(date, matched_strptime_format)
+    if parsed is None:
+        return None
+
+    day, month, year = parsed
+    return (
+        f"{_DAY_WORDS[day]} de {_MONTH_NAMES[month]} de {_year_to_words(year)}"
+    )
+
+
+def convert_dates_to_text(dates):  # type: (Iterable[str]) -> list[str | None]
+    """
+    Converts many dates to their textual representation.
+
+    The result is the same as calling `convert_date_to_text` for each date,
+    except that dates in an unsupported format are converted to None
+    instead of raising an error. Repeated dates are only converted once.
+
+    Args:
+        dates (Iterable[str]): The dates to be converted into text, in the
+                               formats supported by `convert_date_to_text`.
+
+    Returns:
+        list[str | None]: The dates written out in Brazilian Portuguese, in
+                          the same order as the input, with None for the
+                          nonexistent dates and the unsupported formats.
+
+    Example:
+        >>> convert_dates_to_text(["01/03/2025", "2024-08-15", "31/04/2025"])
+        ['Primeiro de marco de dois mil e vinte e cinco', 'Quinze de agosto de dois mil e vinte e quatro', None]
+    """
+
+    texts = {}
+    result = []
+
+    for date in dates:
+        text = texts.get(date)
+        if text is None and date not in texts:
+            parsed = _parse_date(date) if isinstance(date, str) else None
+            if parsed:
+                day, month, year = parsed
+                text = (
+                    f"{_DAY_WORDS[day]} de {_MONTH_NAMES[month]} de "
+                    f"{_year_to_words(year)}"
+                )
+            texts[date] = text
+        result.append(text)
+
+    return result
+
+
+def parse_text_date(text):  # type: (str) -> Date | None
+    """
+    Parses a date written out in Portuguese, the inverse of
+    `convert_date_to_text`.
+
+    The text is case- and accent-insensitive, so month names may be written
+    with or without accents ("março" or "marco"), and the day may be written
+    as "primeiro" or as a cardinal number ("um", "vinte e nove").
+
+    Args:
+        text (str): The date written out, and nothing else except for
+                    surrounding whitespace.
+
+    Returns:
+        datetime.date or None: The date, or None if the text is not a date
+                               written out or the date does not exist.
+
+    Example:
+        >>> parse_text_date("Primeiro de março de dois mil e vinte e quatro")
+        datetime.date(2024, 3, 1)
+        >>> parse_text_date("trinta e um de dezembro de mil novecentos e noventa e nove")
+        datetime.date(1999, 12, 31)
+        >>> parse_text_date("trinta de fevereiro de dois mil")
+        None
+    """
+
+    if not isinstance(text, str):
+        return None
+
+    match = _TEXT_DATE.fullmatch(text.strip().translate(_FOLD))
+    if match is None:
+        return None
+
+    date, end = _to_date(match)
+    return date if end == match.end() else None
+
+
+def find_text_dates(text):  # type: (str) -> list[tuple[Date, tuple[int, int]]]
+    """
+    Finds every date written out in Portuguese in a text.
+
+    Dates are found by a precompiled pattern of the day, month and year
+    words, matched against the text after removing its accents and
+    uppercase letters, so the whole text is scanned once, in linear time,
+    which makes it suitable for large documents such as notary and court
+    records.
+
+    Args:
+        text (str): The text to be searched.
+
+    Returns:
+        list[tuple[datetime.date, tuple[int, int]]]: The dates found, in
+                                                     the order they appear,
+                                                     each with the start and
+                                                     end positions of its
+                                                     words in the text.
+
+    Example:
+        >>> find_text_dates("Lavrada em primeiro de março de dois mil e vinte e quatro.")
+        [(datetime.date(2024, 3, 1), (11, 57))]
+    """
+
+    if not isinstance(text, str):
+        return []
+
+    text = text.translate(_FOLD)
+    dates = []
+    position = 0
+    while True:
+        match = _TEXT_DATE.search(text, position)
+        if match is None:
+            return dates
+
+        date, end = _to_date(match)
+        if date is not None:
+            dates.append((date, (match.start(), end)))
+        # The number words after the year may start the next date
+        position = end
+
+
+def _to_date(match):  # type: (re.Match) -> tuple[Date | None, int]
+    """
+    Converts a match of `_TEXT_DATE` to a date.
+
+    The year group may run into number words that follow the date, as in
+    "de dois mil e dez vinte testemunhas", so the year is the longest run of
+    its first words that is written as `convert_date_to_text` writes a year,
+    with all of its "e" connectors, and the date ends after it.
+
+    Returns:
+        tuple[datetime.date | None, int]: The date, or None if there is no
+                                          such year or the date does not
+                                          exist, and the position where the
+                                          date ends in the text.
+    """
+
+    words = list(re.finditer(r"\S+", match["year"]))
+    for count in range(len(words), 0, -1):
+        year_words = [word[0] for word in words[:count]]
+        year = _from_words(year_words)
+        if (
+            year
+            and year <= 9999
+            and _year_to_words(year).translate(_FOLD).split() == year_words
+        ):
+            break
+    else:
+        return None, match.end()
+
+    end = match.start("year") + words[count - 1].end()
+
+    day = match["day"]
+    day = 1 if day == "primeiro" else _from_words(day.split())
+    if not day:
+        return None, end
+
+    try:
+        return Date(year, _MONTH_NUMBERS[match["month"]], day), end
     except ValueError:
+        return None, end
+
+
+def _parse_date(date):  # type: (str) -> tuple[int, int, int] | None | bool
+    """
+    Parses a date in one of the fixed-width formats dd/mm/yyyy, dd.mm.yyyy,
+    dd-mm-yyyy or yyyy-mm-dd.
+
+    Returns:
+        tuple[int, int, int], None or False: The day, month and year, None
+                                             if the date does not exist or
+                                             False if the format is not
+                                             supported.
+    """
+
+    # A single trailing newline was accepted by the format check of the
+    # previous implementation, which then found no date
+    if len(date) == 11 and date[-1] == "\n":
+        return None if _parse_date(date[:10]) is not False else False
+
+    if len(date) != 10:
+        return False
+
+    separator = date[2]
+    if separator in _SEPARATORS and date[5] == separator:
+        day, month, year = date[:2], date[3:5], date[6:]
+    elif date[4] == "-" and date[7] == "-":
+        year, month, day = date[:4], date[5:7], date[8:]
+    else:
+        return False
+
+    digits = day + month + year
+    if not digits.isdecimal():
+        return False
+
+    # Decimal digits of other scripts match the supported formats, but are
+    # not dates
+    if not digits.isascii():
         return None
-    
-    day = dateObject.day
-    month = dateObject.month
-    year = dateObject.year
 
-    day_string = "Primeiro" if day == 1 else num2words(day, lang="pt")
-    month_string = MonthsEnum(month).month_name
-    year_string = num2words(year, lang="pt")
+    day, month, year = int(day), int(month), int(year)
 
-    date_string = (
-        f"{day_string.capitalize()} de {month_string} de {year_string}"
-    )
+    if not 1 <= month <= 12 or not year or day < 1:
+        return None
+
+    if day > _DAYS_IN_MONTH[month] and not (
+        month == 2
+        and day == 29
+        and year % 4 == 0
+        and (year % 100 != 0 or year % 400 == 0)
+    ):
+        return None
+
+    return day, month, year
+
+
+@lru_cache(maxsize=None)
+def _year_to_words(year):  # type: (int) -> str
+    """
+    Converts a year (from 1 to 9999) to words, without the comma before
+    compound hundreds, e.g. 'mil novecentos e noventa e nove'.
+    """
 
-    return date_string
\ No newline at end of file
+    return _to_words(year, comma=False)
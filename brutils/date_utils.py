@@ -1,31 +1,46 @@
-from datetime import datetime
+from array import array
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Union
 
-import holidays
+from brutils.data.municipal_holidays import EASTER, MUNICIPAL_HOLIDAYS
 
+# Ordinal of 1970-01-01, the epoch of NumPy's `datetime64`
+_UNIX_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
 
-def is_holiday(target_date: datetime, uf: str = None) -> Union[bool, None]:
+
+def is_holiday(
+    target_date: datetime, uf: str = None, municipality_code: str = None
+) -> Union[bool, None]:
     """
-    Checks if the given date is a national or state holiday in Brazil.
+    Checks if the given date is a national, state or municipal holiday in Brazil.
 
-    This function takes a date as a `datetime` object and an optional UF (Unidade Federativa),
-    returning a boolean value indicating whether the date is a holiday or `None` if the date or
-    UF are invalid.
+    This function takes a date as a `datetime` object, an optional UF (Unidade Federativa)
+    and an optional IBGE municipality code, returning a boolean value indicating whether the
+    date is a holiday or `None` if the date, UF or municipality code are invalid.
 
-    The method does not handle municipal holidays.
+    Municipal holidays are looked up in a bundled dataset, which covers the state
+    capitals except Rio Branco (AC). For other municipalities, including Rio Branco,
+    only national and state holidays are considered.
 
     Args:
         target_date (datetime): The date to be checked.
         uf (str, optional): The state abbreviation (UF) to check for state holidays.
                             If not provided, only national holidays will be considered.
+        municipality_code (str, optional): The 7-digit IBGE code of the municipality to
+                                           check for municipal holidays. Its state holidays
+                                           are also considered, so `uf` may be omitted.
 
     Returns:
         bool | None: Returns `True` if the date is a holiday, `False` if it is not,
-                     or `None` if the date or UF are invalid.
+                     or `None` if the date, UF or municipality code are invalid, or if
+                     the municipality is not in the given UF.
 
     Note:
         The function logic should be implemented using the `holidays` library.
         For more information, refer to the documentation at: https://pypi.org/project/holidays/
+        The holidays of each year and UF, and the municipal holidays of each year, are
+        computed once and cached.
 
     Usage Examples:
         >>> from datetime import datetime
@@ -40,19 +55,494 @@ def is_holiday(target_date: datetime, uf: str = None) -> Union[bool, None]:
 
         >>> is_holiday(datetime(2024, 12, 25), uf="RJ")
         True
+
+        >>> is_holiday(datetime(2024, 1, 25), municipality_code="3550308")
+        True
     """
 
     if not isinstance(target_date, datetime):
         return None
 
-    valid_ufs = holidays.Brazil().subdivisions
-    if uf is not None and uf not in valid_ufs:
+    if municipality_code is not None:
+        municipality_uf = _get_municipality_ufs().get(municipality_code)
+        if municipality_uf is None or uf not in (None, municipality_uf):
+            return None
+        uf = municipality_uf
+
+    if not _is_valid_uf(uf):
+        return None
+
+    ordinal = target_date.toordinal()
+    year = target_date.year
+
+    return ordinal in _get_holidays(year, uf) or (
+        municipality_code is not None
+        and (municipality_code, ordinal) in _get_municipal_holidays(year)
+    )
+
+
+def is_business_day(target_date, uf=None):  # type: (date, str) -> bool | None
+    """
+    Checks if the given date is a business day in Brazil, i.e. a weekday
+    (Monday to Friday) that is not a national holiday, nor a state holiday
+    when a UF is given.
+
+    Args:
+        target_date (date or datetime): The date to be checked.
+        uf (str, optional): The state abbreviation (UF) to also consider
+                            the state holidays of.
+
+    Returns:
+        bool or None: True if the date is a business day, False if it is
+                      not, or None if the date or the UF are invalid.
+
+    Example:
+        >>> from datetime import date
+        >>> is_business_day(date(2024, 11, 20))
+        False
+        >>> is_business_day(date(2024, 7, 9))
+        True
+        >>> is_business_day(date(2024, 7, 9), uf="SP")
+        False
+    """
+
+    if not _is_valid(target_date, uf):
+        return None
+
+    return _is_business_day(target_date.toordinal(), target_date.year, uf)
+
+
+def next_business_day(target_date, uf=None):  # type: (date, str) -> date | None
+    """
+    Returns the first business day after the given date.
+
+    Args:
+        target_date (date or datetime): The reference date.
+        uf (str, optional): The state abbreviation (UF) to also consider
+                            the state holidays of.
+
+    Returns:
+        date, datetime or None: The next business day, of the same type as
+                                `target_date`, or None if the date or the
+                                UF are invalid.
+
+    Example:
+        >>> from datetime import date
+        >>> next_business_day(date(2024, 12, 24))
+        datetime.date(2024, 12, 26)
+        >>> next_business_day(date(2024, 12, 27))
+        datetime.date(2024, 12, 30)
+    """
+
+    return add_business_days(target_date, 1, uf)
+
+
+def add_business_days(target_date, days, uf=None):  # type: (date, int, str) -> date | None
+    """
+    Adds a number of business days to a date, as in D+N settlement and due
+    date computations.
+
+    The result is the N-th business day after the given date (or before it,
+    when `days` is negative). With 0 days, the date itself is returned if it
+    is a business day, and the next business day otherwise. Each call is
+    answered with table lookups on precomputed business days of each year,
+    without iterating over the days in between.
+
+    Args:
+        target_date (date or datetime): The reference date.
+        days (int): The number of business days to add. May be negative.
+        uf (str, optional): The state abbreviation (UF) to also consider
+                            the state holidays of.
+
+    Returns:
+        date, datetime or None: The resulting business day, of the same
+                                type as `target_date`, or None if any
+                                argument is invalid.
+
+    Example:
+        >>> from datetime import date
+        >>> add_business_days(date(2024, 12, 23), 2)
+        datetime.date(2024, 12, 26)
+        >>> add_business_days(date(2024, 12, 26), -2)
+        datetime.date(2024, 12, 23)
+        >>> add_business_days(date(2024, 7, 8), 1, uf="SP")
+        datetime.date(2024, 7, 10)
+    """
+
+    if not _is_valid(target_date, uf) or not _is_integer(days):
+        return None
+
+    ordinal = target_date.toordinal()
+    year = target_date.year
+    first, business_days, counts = _get_business_days(year, uf)
+
+    # Number of business days of the year up to the date, inclusive
+    count = counts[ordinal - first]
+
+    if days > 0 or (days == 0 and not _is_business_day(ordinal, year, uf)):
+        index = count + max(days, 1) - 1
+        while index >= len(business_days):
+            index -= len(business_days)
+            year += 1
+            business_days = _get_business_days(year, uf)[1]
+    elif days == 0:
+        return target_date
+    else:
+        index = count - _is_business_day(ordinal, year, uf) + days
+        while index < 0:
+            year -= 1
+            business_days = _get_business_days(year, uf)[1]
+            index += len(business_days)
+
+    return target_date + timedelta(days=business_days[index] - ordinal)
+
+
+def business_days_between(start_date, end_date, uf=None):  # type: (date, date, str) -> int | None
+    """
+    Counts the business days between two dates, excluding the start date
+    and including the end date.
+
+    The count is computed from cumulative business day counts of each year,
+    in constant time for dates in the same year.
+
+    Args:
+        start_date (date or datetime): The start date (excluded).
+        end_date (date or datetime): The end date (included).
+        uf (str, optional): The state abbreviation (UF) to also consider
+                            the state holidays of.
+
+    Returns:
+        int or None: The number of business days, negative if `end_date`
+                     is before `start_date`, or None if any argument is
+                     invalid.
+
+    Example:
+        >>> from datetime import date
+        >>> business_days_between(date(2024, 12, 20), date(2024, 12, 31))
+        6
+        >>> business_days_between(date(2024, 12, 31), date(2024, 12, 20))
+        -6
+    """
+
+    if not _is_valid(start_date, uf) or not _is_valid(end_date, uf):
+        return None
+
+    if end_date < start_date:
+        return -business_days_between(end_date, start_date, uf)
+
+    count = _count_business_days(end_date, uf) - _count_business_days(
+        start_date, uf
+    )
+    for year in range(start_date.year, end_date.year):
+        count += len(_get_business_days(year, uf)[1])
+
+    return count
+
+
+def is_holiday_many(dates, uf=None):  # type: (Iterable[date], str) -> numpy.ndarray | list[bool] | None
+    """
+    Checks which of the given dates are national or state holidays in
+    Brazil.
+
+    With NumPy installed, the dates are converted to a `datetime64[D]` array
+    and checked at once, by indexing a table of flags for every day between
+    the first and the last date, built from the cached holidays of each
+    year, so there are no per-date Python calls. Without NumPy, the dates
+    are checked one by one.
+
+    Args:
+        dates (Iterable[date] or numpy.ndarray or pandas.DatetimeIndex): The
+            dates to be checked: a `datetime64` array, a pandas
+            `DatetimeIndex` or `Series`, or a list of `date` or `datetime`
+            objects. Missing values (NaT) are never holidays.
+        uf (str, optional): The state abbreviation (UF) to also check for
+                            state holidays.
+
+    Returns:
+        numpy.ndarray, list[bool] or None: A boolean array (a list of
+                                           booleans without NumPy) in the
+                                           same order as the input, or None
+                                           if the dates or the UF are
+                                           invalid.
+
+    Example:
+        >>> from datetime import date
+        >>> is_holiday_many([date(2024, 1, 1), date(2024, 1, 2)])
+        array([ True, False])
+        >>> is_holiday_many(numpy.array(["2024-07-09"], dtype="datetime64[D]"), uf="SP")
+        array([ True])
+    """
+
+    return _check_many(dates, uf, business=False)
+
+
+def is_business_day_many(dates, uf=None):  # type: (Iterable[date], str) -> numpy.ndarray | list[bool] | None
+    """
+    Checks which of the given dates are business days in Brazil.
+
+    It works like `is_holiday_many`, and a date is a business day if it is
+    a weekday (Monday to Friday) that is not a holiday.
+
+    Args:
+        dates (Iterable[date] or numpy.ndarray or pandas.DatetimeIndex): The
+            dates to be checked: a `datetime64` array, a pandas
+            `DatetimeIndex` or `Series`, or a list of `date` or `datetime`
+            objects. Missing values (NaT) are never business days.
+        uf (str, optional): The state abbreviation (UF) to also consider
+                            the state holidays of.
+
+    Returns:
+        numpy.ndarray, list[bool] or None: A boolean array (a list of
+                                           booleans without NumPy) in the
+                                           same order as the input, or None
+                                           if the dates or the UF are
+                                           invalid.
+
+    Example:
+        >>> from datetime import date
+        >>> is_business_day_many([date(2024, 12, 24), date(2024, 12, 25)])
+        array([ True, False])
+    """
+
+    return _check_many(dates, uf, business=True)
+
+
+def _check_many(dates, uf, business):  # type: (Iterable[date], str, bool) -> numpy.ndarray | list[bool] | None
+    """
+    Checks which dates are holidays, or business days if `business` is True.
+    """
+
+    if not _is_valid_uf(uf):
+        return None
+
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover
+        numpy = None
+
+    if numpy is None:  # pragma: no cover
+        dates = list(dates)
+        if not all(isinstance(target_date, date) for target_date in dates):
+            return None
+        if business:
+            return [
+                _is_business_day(target_date.toordinal(), target_date.year, uf)
+                for target_date in dates
+            ]
+        return [
+            target_date.toordinal() in _get_holidays(target_date.year, uf)
+            for target_date in dates
+        ]
+
+    if not hasattr(dates, "dtype"):
+        dates = list(dates)
+
+    try:
+        days = numpy.asarray(dates)
+        if days.dtype.kind != "M" and not all(
+            isinstance(target_date, date) for target_date in days.flat
+        ):
+            return None
+        days = days.astype("datetime64[D]")
+    except (TypeError, ValueError):
         return None
 
-    national_holidays = holidays.Brazil(years=target_date.year)
+    result = numpy.zeros(days.shape, dtype=bool)
+    present = ~numpy.isnat(days)
+    if not present.any():
+        return result
+
+    # Days since 1970-01-01
+    days = days[present].astype(numpy.int64)
+    try:
+        first_year = date.fromordinal(int(days.min()) + _UNIX_EPOCH_ORDINAL)
+        last_year = date.fromordinal(int(days.max()) + _UNIX_EPOCH_ORDINAL)
+    except (ValueError, OverflowError):
+        return None
+    first_year, last_year = first_year.year, last_year.year
+
+    # Flags of every day from January 1st of the first year to December
+    # 31st of the last one, looked up at once for all the dates
+    flags = numpy.concatenate(
+        [
+            _get_day_flags(year, uf, business)
+            for year in range(first_year, last_year + 1)
+        ]
+    )
+    offset = date(first_year, 1, 1).toordinal() - _UNIX_EPOCH_ORDINAL
+    result[present] = flags[days - offset]
+
+    return result
+
+
+def _is_valid(target_date, uf):  # type: (date, str) -> bool
+    """
+    Checks if a date and an optional UF are valid arguments.
+    """
+
+    return isinstance(target_date, date) and _is_valid_uf(uf)
+
+
+def _is_valid_uf(uf):  # type: (str | None) -> bool
+    """
+    Checks if an optional UF is valid, i.e. None or a UF (or other
+    subdivision) with state holidays.
+    """
+
+    return uf is None or uf in _get_valid_ufs()
+
+
+def _is_integer(value):  # type: (int) -> bool
+    """
+    Checks if a value is an integer, but not a boolean.
+    """
+
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_business_day(ordinal, year, uf):  # type: (int, int, str) -> bool
+    """
+    Checks if a proleptic Gregorian ordinal is a business day.
+    """
+
+    # The ordinal 1 (0001-01-01) is a Monday
+    return (ordinal - 1) % 7 < 5 and ordinal not in _get_holidays(year, uf)
+
+
+def _count_business_days(target_date, uf):  # type: (date, str) -> int
+    """
+    Counts the business days from the start of the year of a date until the
+    date, inclusive.
+    """
+
+    first, _, counts = _get_business_days(target_date.year, uf)
+    return counts[target_date.toordinal() - first]
+
+
+@lru_cache(maxsize=1024)
+def _get_holidays(year, uf):  # type: (int, str | None) -> frozenset[int]
+    """
+    Returns the ordinals of the national holidays of a year and, if a UF is
+    given, of its state holidays.
+    """
+
+    # `holidays` is slow to import, so it is only imported when needed
+    import holidays
+
+    calendar = holidays.Brazil(subdiv=uf, years=year)
+    return frozenset(holiday.toordinal() for holiday in calendar)
+
+
+@lru_cache(maxsize=None)
+def _get_valid_ufs():  # type: () -> frozenset[str]
+    """
+    Returns the UFs (and other subdivisions) with state holidays.
+    """
+
+    import holidays
+
+    return frozenset(holidays.Brazil.subdivisions)
+
+
+@lru_cache(maxsize=1024)
+def _get_municipal_holidays(year):  # type: (int) -> frozenset[tuple[str, int]]
+    """
+    Returns the municipal holidays of a year, as pairs of the IBGE code of
+    the municipality and the ordinal of the holiday.
+    """
+
+    easter = _easter(year).toordinal()
+    return frozenset(
+        (
+            str(code),
+            easter + day
+            if rule == EASTER
+            else date(year, month, day).toordinal(),
+        )
+        for code, month, day, rule in MUNICIPAL_HOLIDAYS
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_municipality_ufs():  # type: () -> dict[str, str]
+    """
+    Returns the UF of each municipality, by its IBGE code.
+    """
+
+    from brutils.ibge.municipality import _load_cities_code
+
+    return {
+        code: uf
+        for uf, cities_code in _load_cities_code().items()
+        for code in cities_code.values()
+    }
+
+
+def _easter(year):  # type: (int) -> date
+    """
+    Returns the date of Easter Sunday of a year, with the anonymous
+    Gregorian algorithm (Meeus/Jones/Butcher).
+    """
+
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7  # noqa: E741
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+
+    return date(year, month, day + 1)
+
+
+@lru_cache(maxsize=1024)
+def _get_business_days(year, uf):  # type: (int, str | None) -> tuple[int, tuple[int, ...], array]
+    """
+    Returns the business days of a year.
+
+    Returns:
+        tuple[int, tuple[int, ...], array]: The ordinal of January 1st, the
+                                            ordinals of the business days
+                                            and, for each day of the year,
+                                            the number of business days up
+                                            to it, inclusive.
+    """
+
+    first = date(year, 1, 1).toordinal()
+    last = date(year, 12, 31).toordinal()
+    holiday_ordinals = _get_holidays(year, uf)
+
+    business_days = []
+    counts = array("H")
+    for ordinal in range(first, last + 1):
+        if (ordinal - 1) % 7 < 5 and ordinal not in holiday_ordinals:
+            business_days.append(ordinal)
+        counts.append(len(business_days))
+
+    return first, tuple(business_days), counts
+
+
+@lru_cache(maxsize=1024)
+def _get_day_flags(year, uf, business):  # type: (int, str | None, bool) -> numpy.ndarray
+    """
+    Returns a read-only boolean NumPy array with a flag for each day of a
+    year, True for the holidays, or for the business days if `business` is
+    True.
+    """
+
+    import numpy
+
+    first, _, counts = _get_business_days(year, uf)
 
-    if uf is None:
-        return target_date in national_holidays
+    if business:
+        flags = numpy.diff(numpy.asarray(counts, dtype=numpy.int64), prepend=0)
+        flags = flags.astype(bool)
+    else:
+        flags = numpy.zeros(len(counts), dtype=bool)
+        flags[[ordinal - first for ordinal in _get_holidays(year, uf)]] = True
 
-    state_holidays = holidays.Brazil(prov=uf, years=target_date.year)
-    return target_date in state_holidays
+    flags.flags.writeable = False
+    return flags
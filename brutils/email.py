@@ -1,10 +1,32 @@
 import re
+from functools import lru_cache
+
+from brutils.data.email_domains import EMAIL_DOMAINS
+
+# The local part (letters, digits and "._%+-", not starting with a dot), a
+# single "@" and the domain (letters, digits, dots and hyphens), optionally
+# followed by a newline. Each repetition is a single character class ended by
+# a character outside of it, so there is only one way to match a string and
+# every character is examined a bounded number of times
+_EMAIL = re.compile(r"[a-zA-Z0-9_%+-][a-zA-Z0-9._%+-]*@([a-zA-Z0-9.-]+)\n?")
+
+# Largest edit distance between a mistyped domain and its suggestion
+_MAX_DISTANCE = 2
 
 
 def is_valid(email):  # type: (str) -> bool
     """
     Check if a string corresponds to a valid email address.
 
+    The address must have a local part made of letters, digits and the
+    characters ".", "_", "%", "+" and "-", not starting with a dot, a
+    single "@" and a domain made of letters, digits, dots and hyphens,
+    ending with a top-level domain of at least two letters. The string is
+    matched by an unambiguous pattern and the top-level domain is then
+    checked separately, so the time taken is proportional to the length of
+    the string even on adversarial input such as long runs of dots or
+    hyphens.
+
     Args:
         email (str): The input string to be checked.
 
@@ -23,7 +45,295 @@ def is_valid(email):  # type: (str) -> bool
         which is the widely accepted standard for email address formats.
     """
 
-    pattern = re.compile(
-        r"^(?![.])[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+    if not isinstance(email, str):
+        return False
+
+    # A single trailing newline is accepted, as it was by the `$` anchor of
+    # the regular expression this function used to be implemented with
+    match = _EMAIL.fullmatch(email)
+    if match is None:
+        return False
+
+    # The top-level domain starts after the last dot, which must not be the
+    # first character of the domain
+    domain = match[1]
+    dot = domain.rfind(".")
+    top_level_domain = domain[dot + 1 :]
+
+    return dot > 0 and len(top_level_domain) >= 2 and top_level_domain.isalpha()
+
+
+def is_valid_many(emails):  # type: (Iterable[str]) -> list[bool]
+    """
+    Check which of the given strings are valid email addresses.
+
+    Each string is checked as by `is_valid`, in a single loop that avoids a
+    function call per string, for large lists such as mailing lists.
+
+    Args:
+        emails (Iterable[str]): The input strings to be checked.
+
+    Returns:
+        list[bool]: Whether each string is a valid email address, in the
+                    same order as the input.
+
+    Example:
+        >>> is_valid_many(["brutils@brutils.com", "invalid-email@brutils"])
+        [True, False]
+    """
+
+    fullmatch = _EMAIL.fullmatch
+    valid = []
+    append = valid.append
+
+    for email in emails:
+        match = fullmatch(email) if isinstance(email, str) else None
+        if match is None:
+            append(False)
+            continue
+
+        domain = match[1]
+        dot = domain.rfind(".")
+        top_level_domain = domain[dot + 1 :]
+        append(
+            dot > 0
+            and len(top_level_domain) >= 2
+            and top_level_domain.isalpha()
+        )
+
+    return valid
+
+
+def suggest_domain(email):  # type: (str) -> str | None
+    """
+    Suggest a correction for a mistyped domain of an email address.
+
+    A domain that is a common Brazilian one without its ".br", such as
+    "uol.com", is completed. Otherwise, the domain is compared with a
+    bundled list of common Brazilian and global email domains, and the
+    closest one is suggested if it is at most two edits away (insertions,
+    deletions, substitutions or transpositions of adjacent characters).
+    The candidates are found in a precomputed
+    index of the domains with up to two characters deleted, the
+    SymSpell algorithm, so each suggestion takes a few dictionary lookups
+    instead of a comparison with every domain.
+
+    Args:
+        email (str): The email address, or just its domain.
+
+    Returns:
+        str or None: The suggested domain, or None if the domain is already
+                     a common one or no common domain is close to it.
+
+    Example:
+        >>> suggest_domain("joao.ninguem@gmial.com")
+        'gmail.com'
+        >>> suggest_domain("joao.ninguem@yahoo.com.bt")
+        'yahoo.com.br'
+        >>> suggest_domain("joao.ninguem@gmail.com")
+        None
+    """
+
+    if not isinstance(email, str):
+        return None
+
+    return _suggest(email.rpartition("@")[2].strip().lower())
+
+
+def suggest_domain_many(emails):  # type: (Iterable[str]) -> list[str | None]
+    """
+    Suggest corrections for the domains of many email addresses.
+
+    Each address is handled as by `suggest_domain`, and each distinct
+    domain is only looked up once, as mailing lists repeat a few domains
+    many times.
+
+    Args:
+        emails (Iterable[str]): The email addresses, or just their domains.
+
+    Returns:
+        list[str | None]: The suggested domain of each address, in the same
+                          order as the input, with None where there is no
+                          suggestion.
+
+    Example:
+        >>> suggest_domain_many(["a@hotmal.com", "b@gmail.com", "c@hotmal.com"])
+        ['hotmail.com', None, 'hotmail.com']
+    """
+
+    suggestions = {}
+    result = []
+
+    for email in emails:
+        if not isinstance(email, str):
+            result.append(None)
+            continue
+
+        domain = email.rpartition("@")[2].strip().lower()
+        if domain not in suggestions:
+            suggestions[domain] = _suggest(domain)
+        result.append(suggestions[domain])
+
+    return result
+
+
+def _suggest(domain):  # type: (str) -> str | None
+    """
+    Returns the common domain closest to a lowercased domain, if it is not
+    a common domain itself.
+    """
+
+    domains, index = _get_domain_index()
+
+    if not domain or domain in domains:
+        return None
+
+    # Users of Brazilian providers often leave out the ".br", and the
+    # closest domain by edit distance would be a different provider, as
+    # "aol.com" for "uol.com"
+    if domain + ".br" in domains:
+        return domain + ".br"
+
+    # A deletion shared by the domain and a common one, after deleting
+    # `depth` and `common_depth` of their characters, means that they are at
+    # most `depth + common_depth` edits apart, and each edit adds at most 2
+    # to that bound. Every common domain up to `depth` edits apart shares a
+    # deletion of at most `depth` characters of the domain, so the search
+    # stops at the first depth with a candidate that close, which for most
+    # typos is a single deletion
+    bounds = {}
+    for depth, deletions in enumerate(_deletions(domain)):
+        for deletion in deletions:
+            for position, common_depth in index.get(deletion, ()):
+                bound = depth + common_depth
+                if bound < bounds.get(position, bound + 1):
+                    bounds[position] = bound
+
+        best = None
+        best_distance = depth + 1
+        for position in sorted(bounds):
+            # A bound of 1 is the distance itself, as the domains differ
+            distance = bounds[position]
+            if distance > 2 * depth:
+                continue
+            if distance > 1:
+                distance = _distance(
+                    domain, EMAIL_DOMAINS[position], best_distance
+                )
+            if distance < best_distance:
+                best, best_distance = position, distance
+
+        if best is not None:
+            return EMAIL_DOMAINS[best]
+
+    return None
+
+
+@lru_cache(maxsize=None)
+def _get_domain_index():  # type: () -> tuple[frozenset[str], dict[str, tuple[tuple[int, int], ...]]]
+    """
+    Returns the common domains and an index of their deletions: each string
+    obtained by deleting up to `_MAX_DISTANCE` characters of a domain,
+    mapped to the position of the domain in `EMAIL_DOMAINS` and the number
+    of characters deleted. It is built on the first suggestion, so
+    importing the module stays cheap.
+    """
+
+    index = {}
+    for position, domain in enumerate(EMAIL_DOMAINS):
+        seen = set()
+        for depth, deletions in enumerate(_deletions(domain)):
+            for deletion in deletions - seen:
+                index.setdefault(deletion, []).append((position, depth))
+            seen |= deletions
+
+    return frozenset(EMAIL_DOMAINS), {
+        deletion: tuple(entries) for deletion, entries in index.items()
+    }
+
+
+def _deletions(word):  # type: (str) -> Iterator[set[str]]
+    """
+    Yields the strings obtained by deleting characters of a word, grouped
+    by the number of characters deleted, from 0 (the word itself) to
+    `_MAX_DISTANCE`.
+    """
+
+    deletions = {word}
+    yield deletions
+    for _ in range(_MAX_DISTANCE):
+        deletions = {
+            item[:position] + item[position + 1 :]
+            for item in deletions
+            for position in range(len(item))
+        }
+        yield deletions
+
+
+def _distance(first, second, limit):  # type: (str, str, int) -> int
+    """
+    Returns the edit distance between two strings, counting insertions,
+    deletions, substitutions and transpositions of adjacent characters
+    (the optimal string alignment distance), or `limit` if it is not
+    smaller than `limit`.
+    """
+
+    if abs(len(first) - len(second)) >= limit:
+        return limit
+
+    if limit == 2:
+        return 1 if _one_edit_apart(first, second) else 2
+
+    previous = None
+    current = list(range(len(second) + 1))
+
+    for i in range(1, len(first) + 1):
+        before, previous = previous, current
+        current = [i] + [limit] * len(second)
+        # Only the cells within `limit` of the diagonal may be smaller
+        # than `limit`
+        for j in range(
+            max(1, i - limit + 1), min(len(second), i + limit - 1) + 1
+        ):
+            cost = first[i - 1] != second[j - 1]
+            value = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + cost,
+            )
+            if (
+                i > 1
+                and j > 1
+                and first[i - 1] == second[j - 2]
+                and first[i - 2] == second[j - 1]
+                and before[j - 2] + 1 < value
+            ):
+                value = before[j - 2] + 1
+            current[j] = value
+        if min(current) >= limit:
+            return limit
+
+    return min(current[-1], limit)
+
+
+def _one_edit_apart(first, second):  # type: (str, str) -> bool
+    """
+    Checks if two different strings are a single insertion, deletion,
+    substitution or transposition of adjacent characters apart, by
+    comparing what follows their first difference.
+    """
+
+    if len(first) < len(second):
+        first, second = second, first
+
+    index = 0
+    while index < len(second) and first[index] == second[index]:
+        index += 1
+
+    if len(first) > len(second):
+        return first[index + 1 :] == second[index:]
+
+    return first[index + 1 :] == second[index + 1 :] or (
+        first[index + 2 :] == second[index + 2 :]
+        and first[index : index + 2] == second[index : index + 2][::-1]
     )
-    return isinstance(email, str) and re.match(pattern, email) is not None
@@ -0,0 +1,297 @@
+"""
+Compact encoding of CPF, CNPJ and PIS as unsigned 64-bit integers.
+
+The `encode_many` functions of `brutils.cpf`, `brutils.cnpj` and
+`brutils.pis` convert identifiers to a NumPy array of `uint64`, 8 bytes
+each, with `INVALID` for the ones that are not valid; `decode_many`
+converts them back to strings, with the leading zeros. This module has the
+functions that work on those arrays, and the column-level validation shared
+with `brutils.integrations`: the identifiers are read as a matrix of
+digits, one row each, and their check digits are computed with integer
+arithmetic for the whole matrix at once.
+"""
+
+from itertools import islice
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+# Value of the identifiers that are not valid in an encoded array: it has
+# 20 digits, so it is never a valid identifier, and it is sorted last
+INVALID = 2**64 - 1
+
+# Weights of the check digits, from the first digit of the identifier
+_CPF_WEIGHTS = (11, 10, 9, 8, 7, 6, 5, 4, 3, 2)
+_CNPJ_WEIGHTS = (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+_PIS_WEIGHTS = (3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+
+# Number of identifiers encoded or decoded at a time, which bounds the
+# memory of the matrices of digits
+_CHUNK_SIZE = 1 << 16
+
+
+def unique(encoded, in_place=False):  # type: (numpy.ndarray, bool) -> numpy.ndarray
+    """
+    Returns the distinct valid identifiers of an encoded array, sorted.
+
+    Args:
+        encoded (numpy.ndarray): Identifiers encoded by `encode_many`.
+        in_place (bool, optional): Whether to sort `encoded` itself, instead
+                                   of a copy, which saves 8 bytes per
+                                   identifier. Defaults to False.
+
+    Returns:
+        numpy.ndarray: The sorted distinct identifiers, without `INVALID`.
+
+    Example:
+        >>> from brutils.cpf import encode_many
+        >>> unique(encode_many(["82178537464", "11144477735", "82178537464"]))
+        array([11144477735, 82178537464], dtype=uint64)
+    """
+
+    values = numpy.asarray(encoded, dtype=numpy.uint64)
+    if in_place:
+        values.sort()
+    else:
+        values = numpy.sort(values)
+
+    # `INVALID` is sorted last
+    values = values[: numpy.searchsorted(values, numpy.uint64(INVALID))]
+    if len(values) == 0:
+        return values.copy()
+
+    distinct = numpy.empty(len(values), dtype=bool)
+    distinct[0] = True
+    numpy.not_equal(values[1:], values[:-1], out=distinct[1:])
+    return values[distinct]
+
+
+def intersect(encoded, other):  # type: (numpy.ndarray, numpy.ndarray) -> numpy.ndarray
+    """
+    Returns the distinct valid identifiers that are in both encoded arrays,
+    sorted.
+
+    Args:
+        encoded (numpy.ndarray): Identifiers encoded by `encode_many`.
+        other (numpy.ndarray): Identifiers encoded by `encode_many`.
+
+    Returns:
+        numpy.ndarray: The sorted distinct identifiers of both arrays,
+                       without `INVALID`.
+
+    Example:
+        >>> from brutils.cpf import encode_many
+        >>> intersect(
+        ...     encode_many(["82178537464", "11144477735"]),
+        ...     encode_many(["11144477735", "00000000000"]),
+        ... )
+        array([11144477735], dtype=uint64)
+    """
+
+    values = unique(encoded)
+    others = unique(other)
+    if len(values) > len(others):
+        values, others = others, values
+    if len(others) == 0:
+        return others
+
+    # Each identifier of the smaller array is looked up in the larger one
+    positions = numpy.searchsorted(others, values)
+    positions[positions == len(others)] = 0
+    return values[others[positions] == values]
+
+
+def _encode(values, length, is_valid, to_int):  # type: (Iterable[str] | numpy.ndarray, int, Callable[[numpy.ndarray], numpy.ndarray], Callable[[str], int | None]) -> numpy.ndarray
+    """
+    Encodes identifiers of `length` digits, validated by `is_valid` over
+    their matrix of digits, or by `to_int` for strings with non-ASCII
+    characters.
+    """
+
+    if numpy is None:  # pragma: no cover
+        raise ImportError("NumPy is required to encode identifiers")
+
+    powers = 10 ** numpy.arange(length - 1, -1, -1, dtype=numpy.int64)
+
+    # Arrays of fixed-width strings are read as a matrix of characters
+    # directly, without creating a Python object for each identifier
+    if isinstance(values, numpy.ndarray) and values.dtype in (
+        numpy.dtype(f"S{length}"),
+        numpy.dtype(f"U{length}"),
+    ):
+        characters = numpy.uint8 if values.dtype.kind == "S" else numpy.uint32
+        encoded = numpy.full(len(values), INVALID, dtype=numpy.uint64)
+        for start in range(0, len(values), _CHUNK_SIZE):
+            chunk = numpy.ascontiguousarray(values[start : start + _CHUNK_SIZE])
+            codes = chunk.view(characters).reshape(-1, length)
+            digits = codes - characters(ord("0"))
+            # Characters other than digits wrap around to values above 9
+            valid = (digits <= 9).all(axis=1)
+            digits = digits.astype(numpy.int64)
+            valid &= is_valid(digits)
+            encoded[start : start + _CHUNK_SIZE][valid] = digits[valid] @ powers
+
+            # Strings with non-ASCII characters, which may still be digits
+            # for `str.isdigit`, are checked by the scalar function, as in
+            # `_digits`
+            if values.dtype.kind == "U":
+                for row in numpy.flatnonzero((codes > 127).any(axis=1)):
+                    number = to_int(str(chunk[row]))
+                    if number is not None:
+                        encoded[start + row] = number
+        return encoded
+
+    chunks = []
+    iterator = iter(values)
+    while True:
+        chunk = numpy.fromiter(
+            islice(iterator, _CHUNK_SIZE), dtype=object, count=-1
+        )
+        if len(chunk) == 0:
+            break
+
+        encoded = numpy.full(len(chunk), INVALID, dtype=numpy.uint64)
+        rows, digits, others = _digits(chunk, length)
+        valid = is_valid(digits)
+        encoded[rows[valid]] = digits[valid] @ powers
+        for row in others:
+            number = to_int(chunk[row])
+            if number is not None:
+                encoded[row] = number
+        chunks.append(encoded)
+
+    if not chunks:
+        return numpy.empty(0, dtype=numpy.uint64)
+    return numpy.concatenate(chunks)
+
+
+def _decode(encoded, length, is_valid):  # type: (numpy.ndarray | Iterable[int], int, Callable[[numpy.ndarray], numpy.ndarray]) -> list[str | None]
+    """
+    Decodes integers to identifiers of `length` digits, with None for the
+    integers that are not valid identifiers.
+    """
+
+    if numpy is None:  # pragma: no cover
+        raise ImportError("NumPy is required to decode identifiers")
+
+    encoded = numpy.asarray(encoded)
+    if encoded.dtype.kind not in "iu":
+        encoded = encoded.astype(numpy.uint64)
+
+    decoded = []
+    for start in range(0, len(encoded), _CHUNK_SIZE):
+        chunk = encoded[start : start + _CHUNK_SIZE]
+        result = numpy.full(len(chunk), None, dtype=object)
+
+        rows = numpy.flatnonzero((chunk >= 0) & (chunk < 10**length))
+        digits = _matrix(chunk[rows].astype(numpy.uint64), length)
+        valid = is_valid(digits)
+        rows, digits = rows[valid], digits[valid]
+
+        # The digits are written as a single buffer of ASCII characters,
+        # read back as one string per identifier
+        strings = numpy.frombuffer(
+            (digits + ord("0")).astype(numpy.uint8).tobytes(),
+            dtype=f"S{length}",
+        )
+        result[rows] = strings.astype(f"U{length}").tolist()
+        decoded.extend(result.tolist())
+
+    return decoded
+
+
+def _digits(values, length):  # type: (numpy.ndarray, int) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+    """
+    Finds the values that are strings of `length` digits.
+
+    The strings of the right length are joined and read as a single buffer
+    of bytes, so that their digits are converted at once.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The positions of
+            the values made of ASCII digits, the matrix of their digits, one
+            row per value, and the positions of the strings of the right
+            length with non-ASCII characters, which may still be digits for
+            `str.isdigit`, to be checked by the scalar functions.
+    """
+
+    values = numpy.asarray(values, dtype=object)
+    rows = numpy.flatnonzero(
+        numpy.fromiter(
+            (
+                isinstance(value, str) and len(value) == length
+                for value in values
+            ),
+            dtype=bool,
+            count=len(values),
+        )
+    )
+    strings = values[rows]
+    others = rows[:0]
+
+    try:
+        buffer = "".join(strings).encode("ascii")
+    except UnicodeEncodeError:
+        ascii = numpy.fromiter(
+            (string.isascii() for string in strings),
+            dtype=bool,
+            count=len(strings),
+        )
+        rows, strings, others = rows[ascii], strings[ascii], rows[~ascii]
+        buffer = "".join(strings).encode("ascii")
+
+    # Characters other than digits wrap around to values above 9
+    digits = numpy.frombuffer(buffer, dtype=numpy.uint8).reshape(-1, length)
+    digits = digits - numpy.uint8(ord("0"))
+    only_digits = (digits <= 9).all(axis=1)
+
+    return (
+        rows[only_digits],
+        digits[only_digits].astype(numpy.int64),
+        others,
+    )
+
+
+def _matrix(numbers, length):  # type: (numpy.ndarray, int) -> numpy.ndarray
+    """
+    Returns the matrix of the digits of integers of up to `length` digits,
+    one row per integer, with leading zeros.
+    """
+
+    powers = 10 ** numpy.arange(length - 1, -1, -1, dtype=numpy.uint64)
+    digits = numbers[:, None] // powers % numpy.uint64(10)
+    return digits.astype(numpy.int64)
+
+
+def _check_digit(digits, weights):  # type: (numpy.ndarray, Sequence[int]) -> numpy.ndarray
+    """
+    Computes the modulo 11 check digit of CPF and CNPJ for each row of a
+    matrix of digits.
+    """
+
+    remainder = digits @ numpy.array(weights) % 11
+    return numpy.where(remainder < 2, 0, 11 - remainder)
+
+
+def _is_valid_cpf(digits):  # type: (numpy.ndarray) -> numpy.ndarray
+    return (
+        (_check_digit(digits[:, :9], _CPF_WEIGHTS[1:]) == digits[:, 9])
+        & (_check_digit(digits[:, :10], _CPF_WEIGHTS) == digits[:, 10])
+        & (digits != digits[:, :1]).any(axis=1)
+    )
+
+
+def _is_valid_cnpj(digits):  # type: (numpy.ndarray) -> numpy.ndarray
+    return (
+        (_check_digit(digits[:, :12], _CNPJ_WEIGHTS[1:]) == digits[:, 12])
+        & (_check_digit(digits[:, :13], _CNPJ_WEIGHTS) == digits[:, 13])
+        & (digits != digits[:, :1]).any(axis=1)
+    )
+
+
+def _is_valid_pis(digits):  # type: (numpy.ndarray) -> numpy.ndarray
+    check_digit = 11 - digits[:, :10] @ numpy.array(_PIS_WEIGHTS) % 11
+    check_digit[check_digit >= 10] = 0
+    return check_digit == digits[:, 10]
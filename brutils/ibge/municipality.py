@@ -3,9 +3,16 @@ import io
 import json
 import pathlib
 import unicodedata
+from functools import lru_cache
+from time import perf_counter
 from urllib.error import HTTPError
 from urllib.request import urlopen
 
+from brutils.instrumentation import _emit
+
+# Name of `get_municipality_by_code` in its instrumentation events
+_FUNCTION = "get_municipality_by_code"
+
 
 def get_municipality_by_code(code):  # type: (str) -> Tuple[str, str] | None
     """
@@ -21,6 +28,9 @@ def get_municipality_by_code(code):  # type: (str) -> Tuple[str, str] | None
         tuple: A tuple formatted as ("Município", "UF").
             - Returns None if the code is not valid.
 
+    The outcome of each call, and the error message when the request fails,
+    is reported to the listeners registered with `add_event_listener`.
+
     Example:
         >>> get_municipality_by_code("3550308")
         ("São Paulo", "SP")
@@ -28,6 +38,7 @@ def get_municipality_by_code(code):  # type: (str) -> Tuple[str, str] | None
     baseUrl = (
         f"https://servicodados.ibge.gov.br/api/v1/localidades/municipios/{code}"
     )
+    start = perf_counter()
     try:
         with urlopen(baseUrl) as f:
             compressed_data = f.read()
@@ -38,40 +49,79 @@ def get_municipality_by_code(code):  # type: (str) -> Tuple[str, str] | None
                     ) as gzip_file:
                         decompressed_data = gzip_file.read()
                 except OSError as e:
-                    print(f"Erro ao descomprimir os dados: {e}")
+                    _emit(
+                        _FUNCTION,
+                        "error",
+                        start,
+                        code=code,
+                        error=f"Erro ao descomprimir os dados: {e}",
+                    )
                     return None
                 except Exception as e:
-                    print(f"Erro desconhecido ao descomprimir os dados: {e}")
+                    _emit(
+                        _FUNCTION,
+                        "error",
+                        start,
+                        code=code,
+                        error=f"Erro desconhecido ao descomprimir os dados: {e}",
+                    )
                     return None
             else:
                 decompressed_data = compressed_data
 
             if _is_empty(decompressed_data):
-                print(f"{code} é um código inválido")
+                _emit(_FUNCTION, "not_found", start, code=code)
                 return None
 
     except HTTPError as e:
         if e.code == 404:
-            print(f"{code} é um código inválido")
+            _emit(_FUNCTION, "not_found", start, code=code)
             return None
         else:
-            print(f"Erro HTTP ao buscar o código {code}: {e}")
+            _emit(
+                _FUNCTION,
+                "error",
+                start,
+                code=code,
+                error=f"Erro HTTP ao buscar o código {code}: {e}",
+            )
             return None
 
     except Exception as e:
-        print(f"Erro desconhecido ao buscar o código {code}: {e}")
+        _emit(
+            _FUNCTION,
+            "error",
+            start,
+            code=code,
+            error=f"Erro desconhecido ao buscar o código {code}: {e}",
+        )
         return None
 
     try:
         json_data = json.loads(decompressed_data)
-        return _get_values(json_data)
+        municipality = _get_values(json_data)
     except json.JSONDecodeError as e:
-        print(f"Erro ao decodificar os dados JSON: {e}")
+        _emit(
+            _FUNCTION,
+            "error",
+            start,
+            code=code,
+            error=f"Erro ao decodificar os dados JSON: {e}",
+        )
         return None
     except KeyError as e:
-        print(f"Erro ao acessar os dados do município: {e}")
+        _emit(
+            _FUNCTION,
+            "error",
+            start,
+            code=code,
+            error=f"Erro ao acessar os dados do município: {e}",
+        )
         return None
 
+    _emit(_FUNCTION, "ok", start, code=code)
+    return municipality
+
 
 def get_code_by_municipality_name(municipality_name: str, uf: str):  # type: (str, str) -> str | None
     """
@@ -105,14 +155,8 @@ def get_code_by_municipality_name(municipality_name: str, uf: str):  # type: (st
         None
     """
 
-    abs_path = pathlib.Path(__file__).resolve()
-    script_dir = abs_path.parent.parent
-
-    json_cities_code_path = script_dir / "data" / "cities_code.json"
     uf = uf.upper()
-
-    with open(json_cities_code_path, "r", encoding="utf-8") as file:
-        cities_uf_code = json.load(file)
+    cities_uf_code = _load_cities_code()
 
     if uf not in cities_uf_code.keys():
         return None
@@ -128,6 +172,22 @@ def get_code_by_municipality_name(municipality_name: str, uf: str):  # type: (st
     return code
 
 
+@lru_cache(maxsize=None)
+def _load_cities_code():  # type: () -> dict[str, dict[str, str]]
+    """
+    Loads the IBGE codes of the municipalities, by UF and normalized name,
+    from the bundled dataset. The file is read once and cached.
+    """
+
+    abs_path = pathlib.Path(__file__).resolve()
+    script_dir = abs_path.parent.parent
+
+    json_cities_code_path = script_dir / "data" / "cities_code.json"
+
+    with open(json_cities_code_path, "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
 def _get_values(data):
     municipio = data["nome"]
     estado = data["microrregiao"]["mesorregiao"]["UF"]["sigla"]
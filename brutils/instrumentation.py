@@ -0,0 +1,231 @@
+import sys
+from bisect import bisect_left
+from threading import Lock
+from time import perf_counter
+
+# Functions called with an `Event` for each call of the functions that use
+# web services. Disabled while empty, which costs a single truth test per
+# call
+_listeners = []
+
+# Upper bounds, in seconds, of the latency histogram buckets, the same as
+# the default buckets of the Prometheus clients
+_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Cached functions reported by `get_cache_info`, by module
+_CACHES = {
+    "brutils.date": ("_year_to_words",),
+    "brutils.date_utils": (
+        "_get_holidays",
+        "_get_business_days",
+        "_get_day_flags",
+        "_get_municipal_holidays",
+        "_get_municipality_ufs",
+        "_get_valid_ufs",
+    ),
+    "brutils.email": ("_get_domain_index",),
+    "brutils.ibge.municipality": ("_load_cities_code",),
+    "brutils.legal_process": ("_load_legal_process_ids", "_get_registry"),
+    "brutils.number_words": ("_to_words",),
+}
+
+
+class Event:
+    """
+    A call of a `brutils` function that uses a web service.
+
+    Attributes:
+        function (str): The name of the function, e.g.
+                        "get_municipality_by_code".
+        outcome (str): How the call ended: "ok", "not_found" when the
+                       service has no data for the input, "invalid" when
+                       the input was rejected without calling the service,
+                       or "error" when the request or its response failed.
+        duration (float): The time spent in the call, in seconds.
+        data (dict): Details of the call, such as the input and, for
+                     errors, the error message in "error".
+    """
+
+    __slots__ = ("function", "outcome", "duration", "data")
+
+    def __init__(self, function, outcome, duration, data):  # type: (str, str, float, dict) -> None
+        self.function = function
+        self.outcome = outcome
+        self.duration = duration
+        self.data = data
+
+    def __repr__(self):
+        return (
+            f"Event(function={self.function!r}, outcome={self.outcome!r}, "
+            f"duration={self.duration!r}, data={self.data!r})"
+        )
+
+
+class Metrics:
+    """
+    Listener that aggregates the events into call counts, error counts and
+    latency histograms per function, in the shape of Prometheus counters
+    and histograms, so that they can be exported to Prometheus or
+    OpenTelemetry.
+
+    Example:
+        >>> metrics = Metrics()
+        >>> add_event_listener(metrics)
+        >>> get_address_from_cep("01310200")
+        >>> metrics.snapshot()["get_address_from_cep"]["calls"]
+        1
+    """
+
+    def __init__(self, buckets=_BUCKETS):  # type: (tuple[float, ...]) -> None
+        self.buckets = tuple(sorted(buckets))
+        self._functions = {}
+        self._lock = Lock()
+
+    def __call__(self, event):  # type: (Event) -> None
+        with self._lock:
+            metrics = self._functions.get(event.function)
+            if metrics is None:
+                metrics = self._functions[event.function] = {
+                    "outcomes": {},
+                    # One counter per bucket plus the last one, +Inf
+                    "counts": [0] * (len(self.buckets) + 1),
+                    "sum": 0.0,
+                }
+
+            outcomes = metrics["outcomes"]
+            outcomes[event.outcome] = outcomes.get(event.outcome, 0) + 1
+            metrics["counts"][bisect_left(self.buckets, event.duration)] += 1
+            metrics["sum"] += event.duration
+
+    def snapshot(self):  # type: () -> dict[str, dict]
+        """
+        Returns the metrics recorded so far, by function.
+
+        Returns:
+            dict[str, dict]: For each function, the number of "calls", the
+                             number of "errors", the number of calls by
+                             "outcomes" and the "latency" histogram, with
+                             the cumulative count of calls up to each
+                             bucket bound (the last one is
+                             `float("inf")`), their "sum" and "count".
+        """
+
+        snapshot = {}
+
+        with self._lock:
+            for function, metrics in self._functions.items():
+                calls = sum(metrics["outcomes"].values())
+                cumulative = 0
+                buckets = {}
+                for bound, count in zip(
+                    self.buckets + (float("inf"),), metrics["counts"]
+                ):
+                    cumulative += count
+                    buckets[bound] = cumulative
+
+                snapshot[function] = {
+                    "calls": calls,
+                    "errors": metrics["outcomes"].get("error", 0),
+                    "outcomes": dict(metrics["outcomes"]),
+                    "latency": {
+                        "buckets": buckets,
+                        "sum": metrics["sum"],
+                        "count": calls,
+                    },
+                }
+
+        return snapshot
+
+    def reset(self):  # type: () -> None
+        """
+        Discards the metrics recorded so far.
+        """
+
+        with self._lock:
+            self._functions.clear()
+
+
+def add_event_listener(listener):  # type: (Callable[[Event], None]) -> None
+    """
+    Registers a function to be called with an `Event` after each call of
+    the functions that use web services (`get_address_from_cep`,
+    `get_cep_information_from_address` and `get_municipality_by_code`).
+
+    Instrumentation is disabled while no listener is registered, and then
+    it has no measurable cost. Listeners are called in the thread that
+    made the call, in the order they were registered, and the errors they
+    raise are propagated to the caller.
+
+    Args:
+        listener (Callable[[Event], None]): The function to be called, such
+                                            as a `Metrics` instance.
+
+    Example:
+        >>> add_event_listener(lambda event: logger.info("%r", event))
+        >>> get_municipality_by_code("1234567")
+        Event(function='get_municipality_by_code', outcome='not_found', ...)
+    """
+
+    _listeners.append(listener)
+
+
+def remove_event_listener(listener):  # type: (Callable[[Event], None]) -> bool
+    """
+    Unregisters a function registered with `add_event_listener`.
+
+    Args:
+        listener (Callable[[Event], None]): The function to be unregistered.
+
+    Returns:
+        bool: True if the function was registered, False otherwise.
+    """
+
+    try:
+        _listeners.remove(listener)
+    except ValueError:
+        return False
+
+    return True
+
+
+def get_cache_info():  # type: () -> dict[str, CacheInfo]
+    """
+    Returns the hit and miss counts of the internal caches of `brutils`,
+    such as the holiday calendars and the municipality codes. Only the
+    caches of the modules already imported are reported.
+
+    Returns:
+        dict[str, CacheInfo]: The `functools.lru_cache` statistics of each
+                              cache, by "module.function".
+
+    Example:
+        >>> is_holiday(datetime(2024, 12, 25))
+        True
+        >>> get_cache_info()["brutils.date_utils._get_holidays"]
+        CacheInfo(hits=0, misses=1, maxsize=1024, currsize=1)
+    """
+
+    info = {}
+
+    for module_name, functions in _CACHES.items():
+        module = sys.modules.get(module_name)
+        if module is None:
+            continue
+        for function in functions:
+            info[f"{module_name}.{function}"] = getattr(
+                module, function
+            ).cache_info()
+
+    return info
+
+
+def _emit(function, outcome, start, **data):  # type: (str, str, float, Any) -> None
+    """
+    Sends an `Event` for a call of `function`, started at `start` (a value
+    of `time.perf_counter`), to the listeners, if there are any.
+    """
+
+    if _listeners:
+        event = Event(function, outcome, perf_counter() - start, data)
+        for listener in tuple(_listeners):
+            listener(event)
@@ -0,0 +1,123 @@
+"""
+Column-level implementations of the `brutils` functions, shared by the
+pandas and Polars integrations.
+
+Each function takes a column as a NumPy array (or any sequence) of Python
+objects and returns a NumPy array with the result for each value, the same
+as calling the scalar function on it. The check digits of CPF, CNPJ and PIS
+are computed at once for the whole column, as a matrix of digits, and the
+other functions are called once per distinct value.
+"""
+
+from brutils import cep, cnpj, cpf, encoded, pis
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+# Marks the values not looked up yet in `_map`
+_MISSING = object()
+
+
+def _is_valid_cpf(values):  # type: (Sequence) -> numpy.ndarray
+    return _is_valid(values, 11, encoded._is_valid_cpf, cpf.is_valid)
+
+
+def _is_valid_cnpj(values):  # type: (Sequence) -> numpy.ndarray
+    return _is_valid(values, 14, encoded._is_valid_cnpj, cnpj.is_valid)
+
+
+def _is_valid_pis(values):  # type: (Sequence) -> numpy.ndarray
+    return _is_valid(values, 11, encoded._is_valid_pis, pis.is_valid)
+
+
+def _is_valid_cep(values):  # type: (Sequence) -> numpy.ndarray
+    return _is_valid(
+        values, 8, lambda digits: numpy.ones(len(digits), bool), cep.is_valid
+    )
+
+
+def _format_cpf(values):  # type: (Sequence) -> numpy.ndarray
+    return _format(
+        values,
+        _is_valid_cpf(values),
+        lambda value: f"{value[:3]}.{value[3:6]}.{value[6:9]}-{value[9:]}",
+    )
+
+
+def _format_cnpj(values):  # type: (Sequence) -> numpy.ndarray
+    return _format(
+        values,
+        _is_valid_cnpj(values),
+        lambda value: (
+            f"{value[:2]}.{value[2:5]}.{value[5:8]}/{value[8:12]}-{value[12:]}"
+        ),
+    )
+
+
+def _format_pis(values):  # type: (Sequence) -> numpy.ndarray
+    return _format(
+        values,
+        _is_valid_pis(values),
+        lambda value: f"{value[:3]}.{value[3:8]}.{value[8:10]}-{value[10:]}",
+    )
+
+
+def _format_cep(values):  # type: (Sequence) -> numpy.ndarray
+    return _format(
+        values, _is_valid_cep(values), lambda value: f"{value[:5]}-{value[5:]}"
+    )
+
+
+def _map(function, values, dtype=object):  # type: (Callable, Sequence, type) -> numpy.ndarray
+    """
+    Calls a scalar function once for each distinct value of a column.
+    """
+
+    results = {}
+    get = results.get
+    mapped = []
+    append = mapped.append
+
+    for value in values:
+        try:
+            result = get(value, _MISSING)
+        except TypeError:
+            # Unhashable values
+            result = function(value)
+        else:
+            if result is _MISSING:
+                result = results[value] = function(value)
+        append(result)
+
+    return numpy.array(mapped, dtype=dtype)
+
+
+def _is_valid(values, length, is_valid, fallback):  # type: (Sequence, int, Callable[[numpy.ndarray], numpy.ndarray], Callable[[str], bool]) -> numpy.ndarray
+    """
+    Validates the values of a column that are strings of `length` digits by
+    `is_valid`, over their matrix of digits, and the strings with non-ASCII
+    characters by the scalar function `fallback`.
+    """
+
+    values = numpy.asarray(values, dtype=object)
+    result = numpy.zeros(len(values), dtype=bool)
+    rows, digits, others = encoded._digits(values, length)
+    result[rows] = is_valid(digits)
+    for row in others:
+        result[row] = fallback(values[row])
+    return result
+
+
+def _format(values, valid, format):  # type: (Sequence, numpy.ndarray, Callable[[str], str]) -> numpy.ndarray
+    """
+    Formats the valid values of a column, with None for the others.
+    """
+
+    values = numpy.asarray(values, dtype=object)
+    result = numpy.full(len(values), None, dtype=object)
+    rows = numpy.flatnonzero(valid)
+    for row, value in zip(rows, values[rows]):
+        result[row] = format(value)
+    return result
@@ -0,0 +1,169 @@
+"""
+pandas integration: the `br` accessor of `pandas.Series`.
+
+Importing this module registers the accessor, if pandas is installed:
+
+    >>> import brutils.integrations.pandas
+    >>> df["cpf"].br.is_valid_cpf()
+
+The methods work on whole columns: CPF, CNPJ, PIS and CEP are validated and
+formatted by NumPy over the digits of the column, symbols are removed by
+the string methods of pandas, and the other functions are called once per
+distinct value. The results are the same as calling the scalar functions
+of `brutils` on each value.
+"""
+
+from brutils import date_utils, email, phone
+from brutils.ibge.municipality import get_code_by_municipality_name
+from brutils.integrations import _columns
+
+try:
+    import pandas
+except ImportError:  # pragma: no cover
+    pandas = None
+
+
+class BrutilsSeriesAccessor:
+    """
+    The `br` accessor of `pandas.Series`.
+
+    Each method returns a new Series, with the same index, with the result
+    of the function of the same name of `brutils` for each value.
+
+    Example:
+        >>> series = pandas.Series(["82178537464", "00000000000", None])
+        >>> series.br.is_valid_cpf().tolist()
+        [True, False, False]
+        >>> series.br.format_cpf()[0]
+        '821.785.374-64'
+    """
+
+    def __init__(self, series):  # type: (pandas.Series) -> None
+        self._series = series
+
+    # CPF, CNPJ, PIS and CEP
+
+    def is_valid_cpf(self):  # type: () -> pandas.Series
+        return self._wrap(_columns._is_valid_cpf(self._values()))
+
+    def is_valid_cnpj(self):  # type: () -> pandas.Series
+        return self._wrap(_columns._is_valid_cnpj(self._values()))
+
+    def is_valid_pis(self):  # type: () -> pandas.Series
+        return self._wrap(_columns._is_valid_pis(self._values()))
+
+    def is_valid_cep(self):  # type: () -> pandas.Series
+        return self._wrap(_columns._is_valid_cep(self._values()))
+
+    def format_cpf(self):  # type: () -> pandas.Series
+        return self._wrap(_columns._format_cpf(self._values()))
+
+    def format_cnpj(self):  # type: () -> pandas.Series
+        return self._wrap(_columns._format_cnpj(self._values()))
+
+    def format_pis(self):  # type: () -> pandas.Series
+        return self._wrap(_columns._format_pis(self._values()))
+
+    def format_cep(self):  # type: () -> pandas.Series
+        return self._wrap(_columns._format_cep(self._values()))
+
+    def remove_symbols_cpf(self):  # type: () -> pandas.Series
+        return self._remove(r"[.-]")
+
+    def remove_symbols_cnpj(self):  # type: () -> pandas.Series
+        return self._remove(r"[./-]")
+
+    def remove_symbols_pis(self):  # type: () -> pandas.Series
+        return self._remove(r"[.-]")
+
+    def remove_symbols_cep(self):  # type: () -> pandas.Series
+        return self._remove(r"[.-]")
+
+    # Phone and email
+
+    def is_valid_phone(self):  # type: () -> pandas.Series
+        return self._wrap(_columns._map(phone.is_valid, self._values(), bool))
+
+    def format_phone(self):  # type: () -> pandas.Series
+        return self._wrap(_columns._map(phone.format_phone, self._values()))
+
+    def remove_symbols_phone(self):  # type: () -> pandas.Series
+        return self._remove(r"[()+ -]")
+
+    def is_valid_email(self):  # type: () -> pandas.Series
+        return self._wrap(email.is_valid_many(self._values()), dtype=bool)
+
+    # IBGE
+
+    def get_code_by_municipality_name(self, uf):  # type: (str) -> pandas.Series
+        """
+        Returns the IBGE code of each municipality name, in the given UF.
+        """
+
+        return self._wrap(
+            _columns._map(
+                lambda name: (
+                    get_code_by_municipality_name(name, uf)
+                    if isinstance(name, str)
+                    else None
+                ),
+                self._values(),
+            )
+        )
+
+    # Dates
+
+    def is_holiday(self, uf=None):  # type: (str | None) -> pandas.Series
+        """
+        Returns whether each date is a national holiday, or a state holiday
+        of the given UF. Missing dates are not holidays.
+
+        Raises:
+            ValueError: If the UF is not valid.
+        """
+
+        return self._dates(date_utils.is_holiday_many, uf)
+
+    def is_business_day(self, uf=None):  # type: (str | None) -> pandas.Series
+        """
+        Returns whether each date is a business day, nationally or in the
+        given UF. Missing dates are not business days.
+
+        Raises:
+            ValueError: If the UF is not valid.
+        """
+
+        return self._dates(date_utils.is_business_day_many, uf)
+
+    def _values(self):  # type: () -> numpy.ndarray
+        # Missing values of the nullable dtypes (pandas.NA) are converted to
+        # None, and the values of string dtypes to `str`
+        return self._series.to_numpy(dtype=object, na_value=None)
+
+    def _wrap(self, values, dtype=None):  # type: (Sequence, type | None) -> pandas.Series
+        return pandas.Series(
+            values,
+            index=self._series.index,
+            name=self._series.name,
+            dtype=dtype,
+        )
+
+    def _remove(self, symbols):  # type: (str) -> pandas.Series
+        values = self._series
+        if values.dtype != object and not pandas.api.types.is_string_dtype(
+            values
+        ):
+            values = values.astype(object)
+        return values.str.replace(symbols, "", regex=True)
+
+    def _dates(self, function, uf):  # type: (Callable, str | None) -> pandas.Series
+        if not date_utils._is_valid_uf(uf):
+            raise ValueError(f"Invalid UF: {uf}")
+
+        return self._wrap(
+            function(pandas.to_datetime(self._series).to_numpy(), uf)
+        )
+
+
+if pandas is not None:
+    pandas.api.extensions.register_series_accessor("br")(BrutilsSeriesAccessor)
@@ -0,0 +1,166 @@
+"""
+Polars integration: the `br` namespace of `polars.Expr`.
+
+Importing this module registers the namespace, if Polars is installed:
+
+    >>> import brutils.integrations.polars
+    >>> df.with_columns(pl.col("cpf").br.is_valid_cpf().alias("valid"))
+
+The expressions work on whole columns: CPF, CNPJ, PIS and CEP are
+validated and formatted by NumPy over the digits of the column, symbols are
+removed by the string expressions of Polars, and the other functions are
+called once per distinct value. The results are the same as calling the
+scalar functions of `brutils` on each value.
+"""
+
+from brutils import date_utils, email, phone
+from brutils.ibge.municipality import get_code_by_municipality_name
+from brutils.integrations import _columns
+
+try:
+    import polars
+except ImportError:  # pragma: no cover
+    polars = None
+
+
+class BrutilsExprNamespace:
+    """
+    The `br` namespace of `polars.Expr`.
+
+    Each method returns an expression with the result of the function of the
+    same name of `brutils` for each value of the column.
+
+    Example:
+        >>> df = polars.DataFrame({"cpf": ["82178537464", "00000000000"]})
+        >>> df.select(polars.col("cpf").br.format_cpf())["cpf"].to_list()
+        ['821.785.374-64', None]
+    """
+
+    def __init__(self, expr):  # type: (polars.Expr) -> None
+        self._expr = expr
+
+    # CPF, CNPJ, PIS and CEP
+
+    def is_valid_cpf(self):  # type: () -> polars.Expr
+        return self._map(_columns._is_valid_cpf, polars.Boolean)
+
+    def is_valid_cnpj(self):  # type: () -> polars.Expr
+        return self._map(_columns._is_valid_cnpj, polars.Boolean)
+
+    def is_valid_pis(self):  # type: () -> polars.Expr
+        return self._map(_columns._is_valid_pis, polars.Boolean)
+
+    def is_valid_cep(self):  # type: () -> polars.Expr
+        return self._map(_columns._is_valid_cep, polars.Boolean)
+
+    def format_cpf(self):  # type: () -> polars.Expr
+        return self._map(_columns._format_cpf, polars.Utf8)
+
+    def format_cnpj(self):  # type: () -> polars.Expr
+        return self._map(_columns._format_cnpj, polars.Utf8)
+
+    def format_pis(self):  # type: () -> polars.Expr
+        return self._map(_columns._format_pis, polars.Utf8)
+
+    def format_cep(self):  # type: () -> polars.Expr
+        return self._map(_columns._format_cep, polars.Utf8)
+
+    def remove_symbols_cpf(self):  # type: () -> polars.Expr
+        return self._expr.str.replace_all(r"[.-]", "")
+
+    def remove_symbols_cnpj(self):  # type: () -> polars.Expr
+        return self._expr.str.replace_all(r"[./-]", "")
+
+    def remove_symbols_pis(self):  # type: () -> polars.Expr
+        return self._expr.str.replace_all(r"[.-]", "")
+
+    def remove_symbols_cep(self):  # type: () -> polars.Expr
+        return self._expr.str.replace_all(r"[.-]", "")
+
+    # Phone and email
+
+    def is_valid_phone(self):  # type: () -> polars.Expr
+        return self._map(
+            lambda values: _columns._map(phone.is_valid, values, bool),
+            polars.Boolean,
+        )
+
+    def format_phone(self):  # type: () -> polars.Expr
+        return self._map(
+            lambda values: _columns._map(phone.format_phone, values),
+            polars.Utf8,
+        )
+
+    def remove_symbols_phone(self):  # type: () -> polars.Expr
+        return self._expr.str.replace_all(r"[()+ -]", "")
+
+    def is_valid_email(self):  # type: () -> polars.Expr
+        return self._map(email.is_valid_many, polars.Boolean)
+
+    # IBGE
+
+    def get_code_by_municipality_name(self, uf):  # type: (str) -> polars.Expr
+        """
+        Returns the IBGE code of each municipality name, in the given UF.
+        """
+
+        return self._map(
+            lambda values: _columns._map(
+                lambda name: (
+                    get_code_by_municipality_name(name, uf)
+                    if isinstance(name, str)
+                    else None
+                ),
+                values,
+            ),
+            polars.Utf8,
+        )
+
+    # Dates
+
+    def is_holiday(self, uf=None):  # type: (str | None) -> polars.Expr
+        """
+        Returns whether each date is a national holiday, or a state holiday
+        of the given UF. Missing dates are not holidays.
+
+        Raises:
+            ValueError: If the UF is not valid.
+        """
+
+        return self._dates(date_utils.is_holiday_many, uf)
+
+    def is_business_day(self, uf=None):  # type: (str | None) -> polars.Expr
+        """
+        Returns whether each date is a business day, nationally or in the
+        given UF. Missing dates are not business days.
+
+        Raises:
+            ValueError: If the UF is not valid.
+        """
+
+        return self._dates(date_utils.is_business_day_many, uf)
+
+    def _map(self, function, dtype):  # type: (Callable[[list], Sequence], polars.DataType) -> polars.Expr
+        return self._expr.map_batches(
+            lambda series: polars.Series(
+                series.name, list(function(series.to_list())), dtype=dtype
+            ),
+            return_dtype=dtype,
+        )
+
+    def _dates(self, function, uf):  # type: (Callable, str | None) -> polars.Expr
+        if not date_utils._is_valid_uf(uf):
+            raise ValueError(f"Invalid UF: {uf}")
+
+        return self._expr.map_batches(
+            lambda series: polars.Series(
+                series.name,
+                function(series.cast(polars.Date).to_numpy(), uf),
+                dtype=polars.Boolean,
+            ),
+            return_dtype=polars.Boolean,
+        )
+
+
+if polars is not None:
+    polars.api.register_expr_namespace("br")(BrutilsExprNamespace)
@@ -1,8 +1,15 @@
 import json
+import math
 import os
 import re
 from datetime import datetime
-from random import randint
+from functools import lru_cache
+from itertools import islice
+from numbers import Real
+from random import Random, randint
+
+from brutils.data.legal_process_courts import SEGMENTS, TRIBUNALS
+from brutils.types import LegalProcess
 
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = f"{ROOT_DIR}/data"
@@ -92,19 +99,18 @@ def is_valid(legal_process_id):  # type: (str) -> bool
     """
 
     clean_legal_process_id = remove_symbols(legal_process_id)
+    if not _has_20_digits(clean_legal_process_id):
+        return False
+
     DD = clean_legal_process_id[7:9]
     J = clean_legal_process_id[13:14]
     TR = clean_legal_process_id[14:16]
     OOOO = clean_legal_process_id[16:]
 
-    with open(VALID_IDS_FILE) as file:
-        legal_process_ids = json.load(file)
-        process = legal_process_ids.get(f"orgao_{J}")
-        if not process:
-            return False
-        valid_process = int(TR) in process.get("id_tribunal") and int(
-            OOOO
-        ) in process.get("id_foro")
+    process = _get_registry().get(f"orgao_{J}")
+    if not process:
+        return False
+    valid_process = int(TR) in process[0] and int(OOOO) in process[1]
 
     return (
         _checksum(int(clean_legal_process_id[0:7] + clean_legal_process_id[9:]))
@@ -112,7 +118,7 @@ def is_valid(legal_process_id):  # type: (str) -> bool
     ) and valid_process
 
 
-def generate(year=datetime.now().year, orgao=randint(1, 9)):  # type: (int, int) -> (str)
+def generate(year=None, orgao=None):  # type: (int, int) -> (str)
     """
     Generate a random legal process ID number.
 
@@ -136,21 +142,377 @@ def generate(year=datetime.now().year, orgao=randint(1, 9)):  # type: (int, int)
         None
     """
 
+    if year is None:
+        year = datetime.now().year
+    if orgao is None:
+        orgao = randint(1, 9)
+
     if year < datetime.now().year or orgao not in range(1, 10):
         return None
 
     # Getting possible legal process ids from 'legal_process_ids.json' asset
+    _ = _load_legal_process_ids()[f"orgao_{orgao}"]
+    TR = str(_["id_tribunal"][randint(0, (len(_["id_tribunal"]) - 1))]).zfill(2)
+    OOOO = str(_["id_foro"][randint(0, (len(_["id_foro"])) - 1)]).zfill(4)
+    NNNNNNN = str(randint(0, 9999999)).zfill(7)
+    DD = _checksum(f"{NNNNNNN}{year}{orgao}{TR}{OOOO}")
+
+    return f"{NNNNNNN}{DD}{year}{orgao}{TR}{OOOO}"
+
+
+def generate_many(n, year=None, orgao=None, seed=None, weights=None):  # type: (int, int, int, int, dict[int, float]) -> list[str] | None
+    """
+    Generate many random legal process ID numbers at once.
+
+    The segment (orgao) of each ID is sampled according to `weights`, and
+    its tribunal and origin are sampled from the valid ones for that
+    segment. The check digits are computed with integer arithmetic only, so
+    millions of IDs can be generated quickly, e.g. for test fixtures.
+
+    Args:
+        n (int): How many legal process IDs to generate.
+        year (int): The year for the legal process IDs (default is the
+                    current year). The year should not be in the past.
+        orgao (int): The organization code (1-9) for all the legal process
+                     IDs (default is to sample it from `weights`).
+        seed (int): A seed for the random generator, to make the result
+                    reproducible (default is random).
+        weights (dict[int, float]): The relative weight of each organization
+                                    code (1-9) when `orgao` is not given,
+                                    a non-negative number, at least one
+                                    of them positive. Codes left out, or
+                                    with weight 0, are never generated
+                                    (default is the same weight for all).
+
+    Returns:
+        list[str]: The randomly generated legal process IDs.
+                   None if one of the arguments is invalid.
+
+    Example:
+        >>> generate_many(3, year=2030, seed=42)
+        ['17195830920306080072', '05332240220301010000', '36681365720303030000']
+        >>> generate_many(2, weights={5: 0.7, 8: 0.3})
+        ['56411368720265240242', '28668742820265140403']
+        >>> generate_many(2, orgao=10)
+        None
+    """
+
+    current_year = datetime.now().year
+    if year is None:
+        year = current_year
+
+    if (
+        not isinstance(n, int)
+        or isinstance(n, bool)
+        or n < 0
+        or year < current_year
+    ):
+        return None
+
+    if orgao is not None:
+        weights = {orgao: 1}
+    elif weights is None:
+        weights = {orgao: 1 for orgao in range(1, 10)}
+
+    if not weights or any(orgao not in range(1, 10) for orgao in weights):
+        return None
+
+    # Weights are non-negative real numbers, and at least one is positive
+    if (
+        any(
+            not isinstance(weight, Real)
+            or isinstance(weight, bool)
+            or not math.isfinite(weight)
+            or weight < 0
+            for weight in weights.values()
+        )
+        or sum(weights.values()) <= 0
+    ):
+        return None
+
+    legal_process_ids = _load_legal_process_ids()
+    random = Random(seed)
+
+    # Each sampled segment keeps its valid tribunals and origins at hand,
+    # while the numeric suffix "AAAAJ" only depends on the year and segment
+    segments = [
+        (
+            legal_process_ids[f"orgao_{orgao}"]["id_tribunal"],
+            legal_process_ids[f"orgao_{orgao}"]["id_foro"],
+            (year * 10 + orgao) * 10**6,
+        )
+        for orgao in weights
+    ]
+    sampled_segments = random.choices(
+        segments, weights=list(weights.values()), k=n
+    )
+
+    generated = []
+    for tribunals, foros, year_and_orgao in sampled_segments:
+        suffix = (
+            year_and_orgao
+            + random.choice(tribunals) * 10**4
+            + random.choice(foros)
+        )
+        sequence = random.randrange(10**7)
+        base = sequence * 10**11 + suffix
+        check_digits = 97 - base * 100 % 97
+        generated.append(f"{sequence:07d}{check_digits:02d}{suffix:011d}")
+
+    return generated
+
+
+def parse(legal_process_id):  # type: (str) -> Optional[LegalProcess]
+    """
+    Parse a legal process ID into its CNJ fields.
+
+    The ID may be formatted or digit-only. Every field is returned as an
+    integer, together with the result of the same validation performed by
+    `is_valid`.
+
+    Args:
+        legal_process_id (str): A legal process ID, with or without symbols.
+
+    Returns:
+        LegalProcess: A record with the sequence, check digits, year,
+                      segment (J), tribunal (TR), origin (OOOO) and validity
+                      of the ID, or None if the input does not have 20
+                      digits.
+
+    Example:
+        >>> parse("1018874-82.2023.4.01.8200")
+        LegalProcess(sequence=1018874, check_digits=82, year=2023, segment=4, tribunal=1, origin=8200, valid=True)
+        >>> parse("123")
+        None
+    """
+
+    return _parse(legal_process_id, _get_registry())
+
+
+def parse_stream(legal_process_ids, chunk_size=1024):  # type: (Iterable[str], int) -> Iterator[Optional[LegalProcess]]
+    """
+    Lazily parse an iterable of legal process IDs.
+
+    The IDs are consumed in chunks of `chunk_size` items and the registry of
+    valid tribunals and origins is loaded only once, which makes this
+    function suitable for large datasets (JSONL/CSV dumps, database cursors,
+    etc). Results are yielded in the same order as the input, with None for
+    items that cannot be parsed.
+
+    Args:
+        legal_process_ids (Iterable[str]): The legal process IDs to be parsed.
+        chunk_size (int): How many IDs are read from the iterable at a time.
+
+    Yields:
+        LegalProcess: The parsed legal process ID, or None if it does not
+                      have 20 digits.
+
+    Example:
+        >>> records = parse_stream(["10188748220234018200", "123"])
+        >>> [record and record.year for record in records]
+        [2023, None]
+    """
+
+    registry = _get_registry()
+    iterator = iter(legal_process_ids)
+
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+
+        for legal_process_id in chunk:
+            yield _parse(legal_process_id, registry)
+
+
+def describe(legal_process_id):  # type: (str) -> Optional[LegalProcessDescription]
+    """
+    Describe the court a legal process ID belongs to.
+
+    The justice segment (J) and tribunal (TR) fields of the ID are resolved
+    to human-readable labels using the CNJ tables bundled with the library,
+    so no network access is needed. The originating court unit (OOOO) is
+    returned as its 4-digit code.
+
+    Args:
+        legal_process_id (str): A legal process ID, with or without symbols.
+
+    Returns:
+        LegalProcessDescription: A dictionary with the 'segment', 'tribunal'
+                                 and 'origin' of the legal process ID, or
+                                 None if the ID cannot be parsed or its
+                                 segment or tribunal are unknown.
+
+    Example:
+        >>> describe("1018874-82.2023.4.01.8200")
+        {'segment': 'Justiça Federal', 'tribunal': 'TRF1', 'origin': '8200'}
+        >>> describe("0000000-00.2023.8.26.0100")
+        {'segment': 'Justiça dos Estados e do Distrito Federal e Territórios', 'tribunal': 'TJSP', 'origin': '0100'}
+        >>> describe("123")
+        None
+    """
+
+    return describe_many([legal_process_id])[0]
+
+
+def describe_many(legal_process_ids):  # type: (Iterable[str]) -> list[Optional[LegalProcessDescription]]
+    """
+    Describe the courts of many legal process IDs at once.
+
+    Equivalent to calling `describe` for each ID, but faster for large
+    inputs.
+
+    Args:
+        legal_process_ids (Iterable[str]): The legal process IDs, with or
+                                           without symbols.
+
+    Returns:
+        list[LegalProcessDescription]: The descriptions of the IDs, in the
+                                       same order as the input, with None
+                                       for the IDs that cannot be described.
+
+    Example:
+        >>> describe_many(["10188748220234018200", "123"])
+        [{'segment': 'Justiça Federal', 'tribunal': 'TRF1', 'origin': '8200'}, None]
+    """
+
+    courts = {}
+    descriptions = []
+
+    for legal_process_id in legal_process_ids:
+        if not isinstance(legal_process_id, str):
+            descriptions.append(None)
+            continue
+
+        clean_legal_process_id = remove_symbols(legal_process_id)
+        if not _has_20_digits(clean_legal_process_id):
+            descriptions.append(None)
+            continue
+
+        # Segment and tribunal labels are resolved once per J.TR pair
+        court_code = clean_legal_process_id[13:16]
+        court = courts.get(court_code)
+        if court is None:
+            court = courts[court_code] = _get_court(court_code)
+
+        descriptions.append(
+            {
+                "segment": court[0],
+                "tribunal": court[1],
+                "origin": clean_legal_process_id[16:],
+            }
+            if court
+            else None
+        )
+
+    return descriptions
+
+
+def _has_20_digits(clean_legal_process_id):  # type: (str) -> bool
+    """
+    Check that a legal process ID without symbols has 20 ASCII digits, the
+    check shared by `is_valid`, `parse` and `describe`.
+    """
+
+    return (
+        len(clean_legal_process_id) == 20
+        and clean_legal_process_id.isascii()
+        and clean_legal_process_id.isdigit()
+    )
+
+
+def _get_court(court_code):  # type: (str) -> Optional[tuple[str, str]]
+    """
+    Resolve the segment and tribunal labels of a J.TR code.
+
+    Args:
+        court_code (str): The 3 digits with the segment (J) and the tribunal
+                          (TR) of a legal process ID.
+
+    Returns:
+        tuple[str, str]: The segment and tribunal labels, or False if any of
+                         them is unknown.
+    """
+
+    tribunals = TRIBUNALS[int(court_code[0])]
+    tribunal = tribunals and tribunals[int(court_code[1:])]
+    if not tribunal:
+        return False
+
+    return SEGMENTS[int(court_code[0])], tribunal
+
+
+def _parse(legal_process_id, registry):  # type: (str, dict) -> Optional[LegalProcess]
+    """
+    Parse a legal process ID using an already loaded registry.
+
+    Args:
+        legal_process_id (str): A legal process ID, with or without symbols.
+        registry (dict): The registry returned by `_get_registry`.
+
+    Returns:
+        LegalProcess: The parsed legal process ID, or None if it does not
+                      have 20 digits.
+    """
+
+    if not isinstance(legal_process_id, str):
+        return None
+
+    clean_legal_process_id = remove_symbols(legal_process_id)
+    if not _has_20_digits(clean_legal_process_id):
+        return None
+
+    sequence = int(clean_legal_process_id[:7])
+    check_digits = int(clean_legal_process_id[7:9])
+    base = int(clean_legal_process_id[9:])
+    year, court = divmod(base, 10**7)
+    segment, court = divmod(court, 10**6)
+    tribunal, origin = divmod(court, 10**4)
+
+    process = registry.get(f"orgao_{segment}")
+    valid = (
+        process is not None
+        and tribunal in process[0]
+        and origin in process[1]
+        and 97 - (sequence * 10**11 + base) * 100 % 97 == check_digits
+    )
+
+    return LegalProcess(
+        sequence, check_digits, year, segment, tribunal, origin, valid
+    )
+
+
+@lru_cache(maxsize=None)
+def _load_legal_process_ids():  # type: () -> dict
+    """
+    Load the 'legal_process_ids.json' asset.
+
+    The file is read only once per process; later calls return the same
+    dictionary, which must not be mutated.
+
+    Returns:
+        dict: The valid tribunals ('id_tribunal') and origins ('id_foro')
+              for each justice segment ('orgao_J').
+    """
+
     with open(VALID_IDS_FILE) as file:
-        legal_process_ids = json.load(file)
-        _ = legal_process_ids[f"orgao_{orgao}"]
-        TR = str(
-            _["id_tribunal"][randint(0, (len(_["id_tribunal"]) - 1))]
-        ).zfill(2)
-        OOOO = str(_["id_foro"][randint(0, (len(_["id_foro"])) - 1)]).zfill(4)
-        NNNNNNN = str(randint(0, 9999999)).zfill(7)
-        DD = _checksum(f"{NNNNNNN}{year}{orgao}{TR}{OOOO}")
-
-        return f"{NNNNNNN}{DD}{year}{orgao}{TR}{OOOO}"
+        return json.load(file)
+
+
+@lru_cache(maxsize=None)
+def _get_registry():  # type: () -> dict
+    """
+    Build a membership registry from the 'legal_process_ids.json' asset.
+
+    Returns:
+        dict: A mapping from 'orgao_J' to a tuple with the frozensets of
+              valid tribunals and valid origins for that segment.
+    """
+
+    return {
+        orgao: (frozenset(ids["id_tribunal"]), frozenset(ids["id_foro"]))
+        for orgao, ids in _load_legal_process_ids().items()
+    }
 
 
 def _checksum(basenum):  # type: (int) -> str
@@ -1,7 +1,11 @@
 import re
-from random import choice, randint
+from bisect import bisect_right
+from itertools import product
+from random import Random, choice, randint
 from string import ascii_uppercase
-from typing import Optional
+from typing import Iterator, Optional
+
+from brutils.data.license_plate_ranges import LICENSE_PLATE_RANGES
 
 # FORMATTING
 ############
@@ -145,6 +149,156 @@ def get_format(license_plate: str) -> Optional[str]:
     return None
 
 
+def get_uf(license_plate):  # type: (str) -> str | None
+    """
+    Return the state (UF) that issued a license plate.
+
+    Pre-Mercosul plates (LLLNNNN) were issued in letter ranges assigned to
+    each state, so the UF is found from the 3 letters of the plate. Mercosul
+    plates (LLLNLNN) are accepted when they were converted from the old
+    format, as done by `convert_to_mercosul`.
+
+    Args:
+        license_plate (str): A license plate string, with or without the
+                             dash (-) symbol.
+
+    Returns:
+        str: The UF that issued the license plate, or None if the plate is
+             invalid, is a Mercosul plate that was not converted from the
+             old format or its letters are outside the known ranges.
+
+    Example:
+        >>> get_uf("ABC-1234")
+        'PR'
+        >>> get_uf("KMF1A23")
+        'RJ'
+        >>> get_uf("ABC1K23")
+        None
+        >>> get_uf("ZZZ1234")
+        None
+    """
+
+    return get_uf_many([license_plate])[0]
+
+
+def get_uf_many(license_plates):  # type: (Iterable[str]) -> list[str | None]
+    """
+    Return the states (UF) that issued many license plates at once.
+
+    Equivalent to calling `get_uf` for each plate, but faster for large
+    inputs, as the UF of each 3-letter prefix is looked up only once.
+
+    Args:
+        license_plates (Iterable[str]): The license plate strings, with or
+                                        without the dash (-) symbol.
+
+    Returns:
+        list[str]: The UF that issued each license plate, in the same order
+                   as the input, with None for the plates whose UF is
+                   unknown.
+
+    Example:
+        >>> get_uf_many(["ABC1234", "KMF-1234", "ABC1K23"])
+        ['PR', 'RJ', None]
+    """
+
+    ufs = {}
+    result = []
+
+    for license_plate in license_plates:
+        if not isinstance(license_plate, str):
+            result.append(None)
+            continue
+
+        license_plate = remove_symbols(license_plate).upper().strip()
+        if _is_valid_mercosul(license_plate):
+            license_plate = _convert_to_old_format(license_plate)
+
+        if license_plate is None or not _is_valid_old_format(license_plate):
+            result.append(None)
+            continue
+
+        prefix = license_plate[:3]
+        if prefix not in ufs:
+            ufs[prefix] = _get_uf_by_prefix(prefix)
+
+        result.append(ufs[prefix])
+
+    return result
+
+
+def resolve(license_plate, max_edits=2):  # type: (str, int) -> list[str]
+    """
+    Resolve a possibly misread license plate into valid plate candidates.
+
+    Optical character recognition (OCR) of license plates commonly confuses
+    similar letters and digits, such as O/0, I/1, B/8 and S/5. This function
+    replaces those characters where the old (LLLNNNN) or the Mercosul
+    (LLLNLNN) layout expects the other kind, and returns the resulting
+    plates ranked from the most to the least likely.
+
+    Args:
+        license_plate (str): The license plate as read, with or without the
+                             dash (-) symbol.
+        max_edits (int): The maximum number of replaced characters in each
+                         candidate, a non-negative integer (default is 2).
+
+    Returns:
+        list[str]: The candidate license plates, without symbols and sorted
+                   by likelihood. An already valid plate is always the first
+                   candidate. The list is empty if no candidate is found or
+                   if `max_edits` is not valid.
+
+    Example:
+        >>> resolve("ABC1234")
+        ['ABC1234', 'ABC1Z34']
+        >>> resolve("A8C-I234")
+        ['ABC1234']
+        >>> resolve("ABC1B34")
+        ['ABC1B34', 'ABC1834', 'ABC1334']
+        >>> resolve("0BC1234", max_edits=0)
+        []
+    """
+
+    if (
+        not isinstance(license_plate, str)
+        or not isinstance(max_edits, int)
+        or isinstance(max_edits, bool)
+        or max_edits < 0
+    ):
+        return []
+
+    license_plate = (
+        remove_symbols(license_plate).replace(" ", "").upper().strip()
+    )
+    if len(license_plate) != 7:
+        return []
+
+    scored = []
+    for layout in _RESOLVE_LAYOUTS:
+        options = []
+        for char, table in zip(license_plate, layout):
+            replacements = table.get(char)
+            if replacements is None:
+                break
+            options.append(replacements)
+        else:
+            for candidate in product(*options):
+                edits = 0
+                score = 1.0
+                for _, weight in candidate:
+                    if weight != 1.0:
+                        edits += 1
+                        score *= weight
+                if edits <= max_edits:
+                    scored.append(
+                        (-score, "".join(char for char, _ in candidate))
+                    )
+
+    scored.sort()
+    return [candidate for _, candidate in scored]
+
+
 def generate(format="LLLNLNN"):  # type: (str) -> str | None
     """
     Generate a valid license plate in the given format. In case no format is
@@ -186,6 +340,49 @@ def generate(format="LLLNLNN"):  # type: (str) -> str | None
     return generated
 
 
+def sample_unique(n, format="LLLNLNN", seed=None):  # type: (int, str, int) -> Iterator[str] | None
+    """
+    Generate distinct license plates in the given format.
+
+    Plates are produced by running a counter through a keyed permutation of
+    all the plates of the format, so they look random but never repeat, and
+    memory usage does not grow with `n`. The same seed always produces the
+    same sequence of plates.
+
+    Args:
+        n (int): How many license plates to generate. It must not exceed
+                 the number of plates of the format (175,760,000 for the
+                 old pattern and 456,976,000 for the Mercosul one).
+        format (str): The desired format for the license plates.
+                      'LLLNNNN' for the old pattern or 'LLLNLNN' for the
+                      Mercosul one. Default is 'LLLNLNN'.
+        seed (int): A seed for the permutation, to make the result
+                    reproducible (default is random).
+
+    Returns:
+        Iterator[str]: An iterator over the generated license plates, or
+                       'None' if the arguments are invalid.
+
+    Example:
+        >>> list(sample_unique(3, seed=42))
+        ['EFO5Z58', 'FSE4O88', 'BFW4Q19']
+        >>> list(sample_unique(2, format="LLLNNNN", seed=42))
+        ['WPR6405', 'HKP8000']
+        >>> sample_unique(10, format="invalid")
+        None
+    """
+
+    format = format.upper() if isinstance(format, str) else format
+    if format not in _PLATE_SPACE_SIZES:
+        return None
+
+    size = _PLATE_SPACE_SIZES[format]
+    if not isinstance(n, int) or not 0 <= n <= size:
+        return None
+
+    return _sample_unique(n, format, size, seed)
+
+
 def _is_valid_old_format(license_plate: str) -> bool:
     """
     Checks whether a string matches the old format of Brazilian license plate.
@@ -221,3 +418,191 @@ def _is_valid_mercosul(license_plate: str) -> bool:
     license_plate = license_plate.upper().strip()
     pattern = re.compile(r"^[A-Z]{3}\d[A-Z]\d{2}$")
     return re.match(pattern, license_plate) is not None
+
+
+def _convert_to_old_format(license_plate: str) -> Optional[str]:
+    """
+    Converts a Mercosul license plate (LLLNLNN) back to the old pattern
+    (LLLNNNN). This is the inverse of `convert_to_mercosul`, so only the
+    letters A to J are accepted in the fifth position.
+
+    Args:
+        license_plate (str): An uppercase Mercosul license plate.
+
+    Returns:
+        Optional[str]: The old pattern license plate or 'None' if the plate
+                       could not have been converted from the old pattern.
+    """
+
+    digit = ord(license_plate[4]) - ord("A")
+    if not 0 <= digit <= 9:
+        return None
+
+    return license_plate[:4] + str(digit) + license_plate[5:]
+
+
+def _encode_prefix(prefix: str) -> int:
+    """
+    Encodes the 3 letters of a license plate as a base-26 integer, so that
+    'AAA' is 0 and 'ZZZ' is 17575.
+
+    Args:
+        prefix (str): The 3 uppercase letters of a license plate.
+
+    Returns:
+        int: The base-26 encoding of the letters.
+    """
+
+    return (
+        (ord(prefix[0]) - 65) * 676
+        + (ord(prefix[1]) - 65) * 26
+        + (ord(prefix[2]) - 65)
+    )
+
+
+_RANGE_STARTS = [_encode_prefix(start) for start, _, _ in LICENSE_PLATE_RANGES]
+_RANGE_ENDS = [_encode_prefix(end) for _, end, _ in LICENSE_PLATE_RANGES]
+_RANGE_UFS = [uf for _, _, uf in LICENSE_PLATE_RANGES]
+
+
+def _get_uf_by_prefix(prefix: str) -> Optional[str]:
+    """
+    Finds the UF that issued the plates starting with the given letters,
+    using a binary search over the issuance ranges.
+
+    Args:
+        prefix (str): The 3 uppercase letters of a license plate.
+
+    Returns:
+        Optional[str]: The UF that issued the plates or 'None' if the
+                       letters are outside the known ranges.
+    """
+
+    code = _encode_prefix(prefix)
+    index = bisect_right(_RANGE_STARTS, code) - 1
+    if index < 0 or code > _RANGE_ENDS[index]:
+        return None
+
+    return _RANGE_UFS[index]
+
+
+# OCR confusions between letters and digits, with the likelihood of each
+# replacement
+_LETTER_TO_DIGIT = {
+    "O": (("0", 0.9),),
+    "D": (("0", 0.5),),
+    "Q": (("0", 0.5),),
+    "U": (("0", 0.2),),
+    "I": (("1", 0.9),),
+    "L": (("1", 0.5),),
+    "T": (("7", 0.5), ("1", 0.2)),
+    "Z": (("2", 0.8),),
+    "E": (("3", 0.2),),
+    "A": (("4", 0.5),),
+    "S": (("5", 0.9),),
+    "G": (("6", 0.7), ("9", 0.2)),
+    "B": (("8", 0.9), ("3", 0.2)),
+}
+_DIGIT_TO_LETTER = {
+    "0": (("O", 0.9), ("D", 0.5), ("Q", 0.5), ("U", 0.2)),
+    "1": (("I", 0.9), ("L", 0.5), ("T", 0.2)),
+    "2": (("Z", 0.8),),
+    "3": (("B", 0.2), ("E", 0.2)),
+    "4": (("A", 0.5),),
+    "5": (("S", 0.9),),
+    "6": (("G", 0.7),),
+    "7": (("T", 0.5),),
+    "8": (("B", 0.9),),
+    "9": (("G", 0.2),),
+}
+
+# Per-position replacement tables: for each character read, the characters
+# it may stand for and their likelihood (1.0 when kept as read)
+_RESOLVE_LETTER = {
+    **{letter: ((letter, 1.0),) for letter in ascii_uppercase},
+    **_DIGIT_TO_LETTER,
+}
+_RESOLVE_DIGIT = {
+    **{digit: ((digit, 1.0),) for digit in "0123456789"},
+    **_LETTER_TO_DIGIT,
+}
+_RESOLVE_LAYOUTS = tuple(
+    tuple(_RESOLVE_LETTER if kind == "L" else _RESOLVE_DIGIT for kind in layout)
+    for layout in ("LLLNNNN", "LLLNLNN")
+)
+
+
+# Number of distinct plates of each format: 26³·10⁴ and 26⁴·10³
+_PLATE_SPACE_SIZES = {"LLLNNNN": 26**3 * 10**4, "LLLNLNN": 26**4 * 10**3}
+_FEISTEL_ROUNDS = 4
+
+
+def _sample_unique(n: int, format: str, size: int, seed) -> Iterator[str]:
+    """
+    Yields the plates of the first `n` indexes of a keyed permutation of
+    the `size` plates of the format.
+
+    The permutation is a balanced Feistel network over the smallest even
+    number of bits that can hold `size` values. Outputs that fall outside
+    the plate space are fed back into the network (cycle walking), which
+    keeps the mapping a bijection over [0, size).
+    """
+
+    half_bits = ((size - 1).bit_length() + 1) // 2
+    half_mask = (1 << half_bits) - 1
+    random = Random(seed)
+    keys = [random.getrandbits(32) for _ in range(_FEISTEL_ROUNDS)]
+    decode = _decode_old_format if format == "LLLNNNN" else _decode_mercosul
+
+    for counter in range(n):
+        index = counter
+        while True:
+            left, right = index >> half_bits, index & half_mask
+            for key in keys:
+                mixed = (right * 0x9E3779B1 + key) & 0xFFFFFFFF
+                mixed ^= mixed >> 15
+                mixed = (mixed * 0x85EBCA6B) & 0xFFFFFFFF
+                mixed ^= mixed >> 13
+                left, right = right, left ^ (mixed & half_mask)
+            index = (left << half_bits) | right
+            if index < size:
+                break
+
+        yield decode(index)
+
+
+def _decode_letters(index: int) -> str:
+    """
+    Decodes a base-26 integer in [0, 17576) into 3 uppercase letters.
+    """
+
+    first, rest = divmod(index, 676)
+    second, third = divmod(rest, 26)
+    return (
+        ascii_uppercase[first]
+        + ascii_uppercase[second]
+        + ascii_uppercase[third]
+    )
+
+
+def _decode_old_format(index: int) -> str:
+    """
+    Decodes an integer in [0, 26³·10⁴) into an old pattern plate (LLLNNNN).
+    """
+
+    letters, digits = divmod(index, 10**4)
+    return f"{_decode_letters(letters)}{digits:04d}"
+
+
+def _decode_mercosul(index: int) -> str:
+    """
+    Decodes an integer in [0, 26⁴·10³) into a Mercosul plate (LLLNLNN).
+    """
+
+    index, last_digits = divmod(index, 100)
+    index, letter = divmod(index, 26)
+    letters, digit = divmod(index, 10)
+    return (
+        f"{_decode_letters(letters)}{digit}{ascii_uppercase[letter]}"
+        f"{last_digits:02d}"
+    )
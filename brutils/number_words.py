@@ -0,0 +1,276 @@
+from functools import lru_cache
+
+# Words for the cardinal numbers in Brazilian Portuguese
+_UNITS = (
+    "zero",
+    "um",
+    "dois",
+    "três",
+    "quatro",
+    "cinco",
+    "seis",
+    "sete",
+    "oito",
+    "nove",
+    "dez",
+    "onze",
+    "doze",
+    "treze",
+    "catorze",
+    "quinze",
+    "dezesseis",
+    "dezessete",
+    "dezoito",
+    "dezenove",
+)
+_TENS = (
+    None,
+    None,
+    "vinte",
+    "trinta",
+    "quarenta",
+    "cinquenta",
+    "sessenta",
+    "setenta",
+    "oitenta",
+    "noventa",
+)
+_HUNDREDS = (
+    None,
+    "cento",
+    "duzentos",
+    "trezentos",
+    "quatrocentos",
+    "quinhentos",
+    "seiscentos",
+    "setecentos",
+    "oitocentos",
+    "novecentos",
+)
+
+# Singular and plural names of each power of 1000, starting at 1000¹
+_SCALES = (
+    ("mil", "mil"),
+    ("milhão", "milhões"),
+    ("bilhão", "bilhões"),
+    ("trilhão", "trilhões"),
+)
+_MAX_NUMBER = 1000 ** (len(_SCALES) + 1) - 1
+
+# Lowercase accented letters and their unaccented forms, for matching words
+# regardless of accents
+_ACCENTS = str.maketrans("áàâãéêíóôõúüç", "aaaaeeiooouuc")
+
+# Uppercase and accented letters and their lowercase unaccented forms. Unlike
+# `_normalize`, translating a text with this table keeps its length, so
+# positions found in the result are also valid in the original text
+_FOLD = str.maketrans(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZÁÀÂÃÉÊÍÓÔÕÚÜÇáàâãéêíóôõúüç",
+    "abcdefghijklmnopqrstuvwxyzaaaaeeiooouucaaaaeeiooouuc",
+)
+
+
+def _triplet_to_words(number):  # type: (int) -> str
+    """
+    Converts a number from 1 to 999 to words.
+
+    Args:
+        number (int): A number from 1 to 999.
+
+    Returns:
+        str: The number written out in Brazilian Portuguese.
+    """
+
+    if number == 100:
+        return "cem"
+
+    hundreds, rest = divmod(number, 100)
+    words = [_HUNDREDS[hundreds]] if hundreds else []
+
+    if rest >= 20:
+        tens, units = divmod(rest, 10)
+        words.append(_TENS[tens])
+        if units:
+            words.append(_UNITS[units])
+    elif rest:
+        words.append(_UNITS[rest])
+
+    return " e ".join(words)
+
+
+# Precomputed words for every number from 0 to 999
+_TRIPLETS = ("zero",) + tuple(
+    _triplet_to_words(number) for number in range(1, 1000)
+)
+
+
+@lru_cache(maxsize=4096)
+def _to_words(number, comma=True):  # type: (int, bool) -> str
+    """
+    Converts a non-negative integer to words in Brazilian Portuguese.
+
+    The number is split in groups of 3 digits, each written out with a
+    precomputed table and followed by its scale (mil, milhão, bilhão, ...),
+    and the groups are joined with "e". Before a compound hundred, the "e"
+    after a scale is replaced by a comma, as in "mil, quinhentos e vinte e
+    três", or dropped when `comma` is False, as in "mil quinhentos e vinte e
+    três" (the style used for years). The output is the same as the one of
+    `num2words(number, lang="pt_BR")`, which is still used as a fallback for
+    numbers from one quatrilhão on.
+
+    Args:
+        number (int): A non-negative integer.
+        comma (bool): Whether to write a comma before compound hundreds
+                      (default is True).
+
+    Returns:
+        str: The number written out in Brazilian Portuguese.
+
+    Example:
+        >>> _to_words(1523)
+        'mil, quinhentos e vinte e três'
+        >>> _to_words(1523, comma=False)
+        'mil quinhentos e vinte e três'
+        >>> _to_words(2000000)
+        'dois milhões'
+    """
+
+    if number < 1000:
+        return _TRIPLETS[number]
+
+    if number > _MAX_NUMBER:
+        from num2words import num2words
+
+        return num2words(number, lang="pt_BR" if comma else "pt")
+
+    groups = []
+    while number:
+        number, group = divmod(number, 1000)
+        groups.append(group)
+
+    parts = []
+    for scale in range(len(groups) - 1, -1, -1):
+        group = groups[scale]
+        if not group:
+            continue
+
+        if scale == 0:
+            parts.append(_TRIPLETS[group])
+        elif scale == 1:
+            parts.append("mil" if group == 1 else f"{_TRIPLETS[group]} mil")
+        else:
+            singular, plural = _SCALES[scale - 1]
+            parts.append(
+                f"um {singular}"
+                if group == 1
+                else f"{_TRIPLETS[group]} {plural}"
+            )
+
+    words = parts[0]
+    for index, part in enumerate(parts[1:], start=1):
+        connector = " e "
+        # A compound hundred ("cento e", "quinhentos e", ...) followed by
+        # more words is not preceded by "e"
+        first_word, _, rest = part.partition(" ")
+        if first_word.endswith(("ento", "entos")) and (
+            "e" in rest or index + 1 < len(parts)
+        ):
+            connector = ", " if comma else " "
+        words += connector + part
+
+    return words
+
+
+def _normalize(text):  # type: (str) -> str
+    """
+    Lowercases a text and removes the accents of its letters.
+    """
+
+    return text.lower().translate(_ACCENTS)
+
+
+# Value of each number word, without accents, and the largest value the
+# next word of the same group may have ("cento" may be followed by "e
+# vinte", "vinte" only by "e um" to "e nove", "dezenove" by nothing)
+_NUMBER_WORDS = {"cem": (100, 0)}
+_NUMBER_WORDS.update(
+    (word.translate(_ACCENTS), (number, 0))
+    for number, word in enumerate(_UNITS)
+)
+_NUMBER_WORDS.update(
+    (word.translate(_ACCENTS), (number * 10, 9))
+    for number, word in enumerate(_TENS)
+    if word is not None
+)
+_NUMBER_WORDS.update(
+    (word.translate(_ACCENTS), (number * 100, 99))
+    for number, word in enumerate(_HUNDREDS)
+    if word is not None
+)
+
+# Value of each scale word, without accents
+_SCALE_WORDS = {
+    word.translate(_ACCENTS): 1000**power
+    for power, names in enumerate(
+        _SCALES + (("quatrilhão", "quatrilhões"),), start=1
+    )
+    for word in names
+}
+
+
+def _from_words(words):  # type: (list[str]) -> int | None
+    """
+    Converts a sequence of normalized words to a non-negative integer.
+
+    It is the inverse of `_to_words`: the value of each word is looked up in
+    a table, in a single pass, and the words must be in the order they are
+    written in, from the largest scale to the smallest and, within each
+    group, from the hundreds to the units. The "e" connectors are optional.
+
+    Args:
+        words (list[str]): The words, lowercased and without accents and
+                           commas.
+
+    Returns:
+        int or None: The number, or None if the words are not a number
+                     written out in Portuguese.
+
+    Example:
+        >>> _from_words(["mil", "quinhentos", "e", "vinte", "e", "tres"])
+        1523
+        >>> _from_words(["vinte", "e", "cem"])
+        None
+    """
+
+    if words == ["zero"]:
+        return 0
+
+    total = group = 0
+    # The largest value the next word may have in the current group
+    limit = 999
+    scale = None
+
+    for word in words:
+        if word == "e":
+            continue
+
+        if word in _NUMBER_WORDS:
+            number, next_limit = _NUMBER_WORDS[word]
+            if not 0 < number <= limit:
+                return None
+            group += number
+            limit = next_limit
+            continue
+
+        scale_value = _SCALE_WORDS.get(word)
+        if scale_value is None or (scale is not None and scale_value >= scale):
+            return None
+        if not group and scale_value > 1000:
+            return None
+        total += (group or 1) * scale_value
+        group, limit, scale = 0, 999, scale_value
+
+    if limit == 999 and scale is None:
+        return None
+
+    return total + group
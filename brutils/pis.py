@@ -1,4 +1,8 @@
 from random import randint
+from typing import TYPE_CHECKING, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    import numpy
 
 WEIGHTS = [3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
 
@@ -112,6 +116,117 @@ def generate() -> str:
     return base + str(_checksum(base))
 
 
+# ENCODING
+############
+
+
+def to_int(pis: str) -> Optional[int]:
+    """
+    Encodes a PIS as an integer.
+
+    The integer keeps the value of the PIS in 8 bytes, instead of the
+    about 60 bytes of a string, and `from_int` restores its leading zeros.
+
+    Args:
+        pis (str): A PIS digit string.
+
+    Returns:
+        int: The PIS as an integer, or None if the PIS is not valid.
+
+    Example:
+        >>> to_int("12038619494")
+        12038619494
+        >>> to_int("12038619490")
+        None
+    """
+
+    return int(pis) if is_valid(pis) else None
+
+
+def from_int(number: int) -> Optional[str]:
+    """
+    Decodes a PIS encoded as an integer by `to_int`.
+
+    Args:
+        number (int): The PIS as an integer.
+
+    Returns:
+        str: The PIS digit string, with its leading zeros, or None if the
+             integer is not a valid PIS.
+
+    Example:
+        >>> from_int(12038619494)
+        '12038619494'
+        >>> from_int(0)
+        None
+    """
+
+    if (
+        not isinstance(number, int)
+        or isinstance(number, bool)
+        or not 0 <= number < 10**11
+    ):
+        return None
+
+    pis = str(number).zfill(11)
+    return pis if is_valid(pis) else None
+
+
+def encode_many(pis_numbers: Iterable[str]) -> "numpy.ndarray":
+    """
+    Encodes many PIS numbers as a NumPy array of unsigned 64-bit integers.
+
+    The PIS numbers are validated with integer arithmetic over the digits
+    of all of them at once, which is much faster than calling `to_int` for
+    each one. Arrays of fixed-width strings (e.g. `numpy.dtype("S11")`)
+    are read without creating a Python object for each PIS. Requires
+    NumPy.
+
+    Args:
+        pis_numbers (Iterable[str] or numpy.ndarray): The PIS digit
+                                                      strings.
+
+    Returns:
+        numpy.ndarray: The PIS numbers as integers (`numpy.uint64`), in the
+                       same order as the input, with
+                       `brutils.encoded.INVALID` for the ones that are not
+                       valid.
+
+    Example:
+        >>> encode_many(["12038619494", "12038619490"])
+        array([         12038619494, 18446744073709551615], dtype=uint64)
+    """
+
+    from brutils import encoded
+
+    return encoded._encode(pis_numbers, 11, encoded._is_valid_pis, to_int)
+
+
+def decode_many(numbers: Iterable[int]) -> List[Optional[str]]:
+    """
+    Decodes many PIS numbers encoded as integers by `encode_many`.
+
+    Requires NumPy.
+
+    Args:
+        numbers (numpy.ndarray or Iterable[int]): The PIS numbers as
+                                                  integers.
+
+    Returns:
+        list[str | None]: The PIS digit strings, with their leading
+                          zeros, in the same order as the input, with None
+                          for the integers that are not valid PIS numbers.
+
+    Example:
+        >>> decode_many(encode_many(["12038619494", "12038619490"]))
+        ['12038619494', None]
+    """
+
+    from brutils import encoded
+
+    return encoded._decode(numbers, 11, encoded._is_valid_pis)
+
+
 def _checksum(base_pis: str) -> int:
     """
     Calculate the checksum digit of the given `base_pis` string.
@@ -1 +1,40 @@
-from .address import Address
+from importlib import import_module as _import_module
+
+# Public names, mapped to the module they are defined in and their name in
+# it. As in `brutils`, the modules are only imported when one of their names
+# is first used (PEP 562), so that, for instance, using `Address` does not
+# load the CPF, phone and license plate modules behind the value classes
+_IMPORTS = {
+    "Address": ("brutils.types.address", "Address"),
+    "CEP": ("brutils.types.cep", "CEP"),
+    "CNPJ": ("brutils.types.cnpj", "CNPJ"),
+    "CPF": ("brutils.types.cpf", "CPF"),
+    "LegalProcess": ("brutils.types.legal_process", "LegalProcess"),
+    "LegalProcessDescription": (
+        "brutils.types.legal_process",
+        "LegalProcessDescription",
+    ),
+    "LicensePlate": ("brutils.types.license_plate", "LicensePlate"),
+    "Phone": ("brutils.types.phone", "Phone"),
+    "PIS": ("brutils.types.pis", "PIS"),
+}
+
+__all__ = list(_IMPORTS)
+
+
+def __getattr__(name):
+    try:
+        module_name, attribute = _IMPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+    value = getattr(_import_module(module_name), attribute)
+    # Later lookups of the name no longer go through this function
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
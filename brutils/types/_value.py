@@ -0,0 +1,141 @@
+class _Value:
+    """
+    Base of the value classes (`CPF`, `CNPJ`, `PIS`, `CEP`, `Phone` and
+    `LicensePlate`).
+
+    A value is validated once, when it is created, and stored as an integer;
+    its formatted and masked forms are computed on first use and cached.
+    Values are immutable, and are equal (and hash the same) when they are of
+    the same class and have the same integer.
+
+    Subclasses define `_parse`, which returns the integer of a valid value
+    or None, `_canonical`, which converts the integer back to the value
+    without symbols, `_format` and `_mask`.
+    """
+
+    __slots__ = ("_int", "_formatted", "_masked")
+
+    def __new__(cls, value):  # type: (str | int) -> _Value
+        number = cls._parse(value)
+        if number is None:
+            raise ValueError(f"Invalid {cls.__name__}: {value!r}")
+        return _from_int(cls, number)
+
+    @classmethod
+    def parse(cls, value):  # type: (str | int) -> _Value | None
+        """
+        Parses a value, as the constructor, but returns None if it is not
+        valid instead of raising ValueError.
+        """
+
+        number = cls._parse(value)
+        if number is None:
+            return None
+        return _from_int(cls, number)
+
+    @property
+    def formatted(self):  # type: () -> str
+        """
+        The value with its symbols, as returned by the format function of
+        its kind.
+        """
+
+        formatted = self._formatted
+        if formatted is None:
+            formatted = self._format(self._canonical(self._int))
+            object.__setattr__(self, "_formatted", formatted)
+        return formatted
+
+    @property
+    def masked(self):  # type: () -> str
+        """
+        The formatted value with part of its characters replaced by "*", to
+        be shown without disclosing the whole value.
+        """
+
+        masked = self._masked
+        if masked is None:
+            masked = self._mask(self.formatted)
+            object.__setattr__(self, "_masked", masked)
+        return masked
+
+    def __str__(self):
+        return self._canonical(self._int)
+
+    def __int__(self):
+        return self._int
+
+    def __repr__(self):
+        return f"{type(self).__name__}({str(self)!r})"
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return self._int == other._int
+
+    def __hash__(self):
+        return hash(self._int)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return _from_int, (type(self), self._int)
+
+
+class _Digits(_Value):
+    """
+    Base of the value classes made of digits only.
+
+    Subclasses set `_LENGTH`, the number of digits of the value (None if it
+    varies, in which case the value cannot start with 0), and `_clean` and
+    `_is_valid`, the functions that remove the symbols of a value and
+    validate it.
+    """
+
+    __slots__ = ()
+
+    _LENGTH = None
+
+    @classmethod
+    def _parse(cls, value):  # type: (str | int) -> int | None
+        if isinstance(value, str):
+            digits = cls._clean(value)
+        elif isinstance(value, int) and not isinstance(value, bool):
+            if value < 0:
+                return None
+            digits = cls._canonical(value)
+        else:
+            return None
+
+        if not cls._is_valid(digits):
+            return None
+
+        try:
+            return int(digits)
+        except ValueError:
+            # Characters for which `str.isdigit` is true, such as "²", but
+            # that are not decimal digits
+            return None
+
+    @classmethod
+    def _canonical(cls, number):  # type: (int) -> str
+        if cls._LENGTH is None:
+            return str(number)
+        return str(number).zfill(cls._LENGTH)
+
+
+def _from_int(cls, number):  # type: (type, int) -> _Value
+    """
+    Creates a value of a class from its integer, without validating it.
+    """
+
+    value = object.__new__(cls)
+    object.__setattr__(value, "_int", number)
+    object.__setattr__(value, "_formatted", None)
+    object.__setattr__(value, "_masked", None)
+    return value
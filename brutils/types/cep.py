@@ -0,0 +1,47 @@
+from brutils.types._value import _Digits
+
+
+class CEP(_Digits):
+    """
+    A valid CEP, parsed once and stored as an integer.
+
+    The value may be given with or without symbols, or as an integer. Its
+    formatted and masked forms are computed on first use and cached. As
+    `is_valid_cep`, only the format of the CEP is checked, not whether it
+    exists.
+
+    Attributes:
+        formatted (str): The formatted CEP, as returned by `format_cep`.
+        masked (str): The formatted CEP with its last 3 digits hidden.
+
+    Raises:
+        ValueError: If the CEP is not valid. `CEP.parse` returns None
+                    instead.
+
+    Example:
+        >>> value = CEP("01310-200")
+        >>> str(value), value.formatted, value.masked
+        ('01310200', '01310-200', '01310-***')
+    """
+
+    __slots__ = ()
+
+    _LENGTH = 8
+
+    # The same as `remove_symbols` and `is_valid` of `brutils.cep`, which
+    # is not imported here, as it imports `urllib.request`
+    @staticmethod
+    def _clean(value):  # type: (str) -> str
+        return value.replace(".", "").replace("-", "")
+
+    @staticmethod
+    def _is_valid(digits):  # type: (str) -> bool
+        return len(digits) == 8 and digits.isdigit()
+
+    @staticmethod
+    def _format(digits):  # type: (str) -> str
+        return f"{digits[:5]}-{digits[5:]}"
+
+    @staticmethod
+    def _mask(formatted):  # type: (str) -> str
+        return f"{formatted[:6]}***"
@@ -0,0 +1,42 @@
+from brutils import cnpj
+from brutils.types._value import _Digits
+
+
+class CNPJ(_Digits):
+    """
+    A valid CNPJ, parsed once and stored as an integer.
+
+    The value may be given with or without symbols, or as an integer. Its
+    formatted and masked forms are computed on first use and cached.
+
+    Attributes:
+        formatted (str): The formatted CNPJ, as returned by `format_cnpj`.
+        masked (str): The formatted CNPJ with its first 2 and last 2 digits
+                      hidden.
+
+    Raises:
+        ValueError: If the CNPJ is not valid. `CNPJ.parse` returns None
+                    instead.
+
+    Example:
+        >>> value = CNPJ("03560714000142")
+        >>> value.formatted, value.masked
+        ('03.560.714/0001-42', '**.560.714/0001-**')
+    """
+
+    __slots__ = ()
+
+    _LENGTH = 14
+    _clean = staticmethod(cnpj.remove_symbols)
+    _is_valid = staticmethod(cnpj.is_valid)
+
+    @staticmethod
+    def _format(digits):  # type: (str) -> str
+        return (
+            f"{digits[:2]}.{digits[2:5]}.{digits[5:8]}/{digits[8:12]}-"
+            f"{digits[12:]}"
+        )
+
+    @staticmethod
+    def _mask(formatted):  # type: (str) -> str
+        return f"**{formatted[2:16]}**"
@@ -0,0 +1,44 @@
+from brutils import cpf
+from brutils.types._value import _Digits
+
+
+class CPF(_Digits):
+    """
+    A valid CPF, parsed once and stored as an integer.
+
+    The value may be given with or without symbols, or as an integer. Its
+    formatted and masked forms are computed on first use and cached, so
+    that a CPF used many times is validated and formatted only once.
+
+    Attributes:
+        formatted (str): The formatted CPF, as returned by `format_cpf`.
+        masked (str): The formatted CPF with its first 3 and last 2 digits
+                      hidden.
+
+    Raises:
+        ValueError: If the CPF is not valid. `CPF.parse` returns None
+                    instead.
+
+    Example:
+        >>> value = CPF("821.785.374-64")
+        >>> str(value), value.formatted, value.masked
+        ('82178537464', '821.785.374-64', '***.785.374-**')
+        >>> value == CPF(82178537464)
+        True
+        >>> CPF.parse("00000000000")
+        None
+    """
+
+    __slots__ = ()
+
+    _LENGTH = 11
+    _clean = staticmethod(cpf.remove_symbols)
+    _is_valid = staticmethod(cpf.is_valid)
+
+    @staticmethod
+    def _format(digits):  # type: (str) -> str
+        return f"{digits[:3]}.{digits[3:6]}.{digits[6:9]}-{digits[9:]}"
+
+    @staticmethod
+    def _mask(formatted):  # type: (str) -> str
+        return f"***{formatted[3:12]}**"
@@ -0,0 +1,67 @@
+from typing import TypedDict
+
+
+class LegalProcessDescription(TypedDict):
+    segment: str
+    tribunal: str
+    origin: str
+
+
+class LegalProcess:
+    """
+    Parsed fields of a CNJ legal process ID (NNNNNNN-DD.AAAA.J.TR.OOOO).
+
+    Instances are lightweight records (they use `__slots__`) holding every
+    field as an integer, so large datasets can be filtered by segment,
+    tribunal or year without keeping intermediate strings around.
+
+    Attributes:
+        sequence (int): The sequential number of the process (NNNNNNN).
+        check_digits (int): The verification digits (DD).
+        year (int): The year the process was filed (AAAA).
+        segment (int): The justice segment (J).
+        tribunal (int): The tribunal code (TR).
+        origin (int): The originating court unit (OOOO).
+        valid (bool): Whether the legal process ID is valid.
+    """
+
+    __slots__ = (
+        "sequence",
+        "check_digits",
+        "year",
+        "segment",
+        "tribunal",
+        "origin",
+        "valid",
+    )
+
+    def __init__(
+        self, sequence, check_digits, year, segment, tribunal, origin, valid
+    ):  # type: (int, int, int, int, int, int, bool) -> None
+        self.sequence = sequence
+        self.check_digits = check_digits
+        self.year = year
+        self.segment = segment
+        self.tribunal = tribunal
+        self.origin = origin
+        self.valid = valid
+
+    def __repr__(self):
+        return (
+            f"LegalProcess(sequence={self.sequence}, "
+            f"check_digits={self.check_digits}, year={self.year}, "
+            f"segment={self.segment}, tribunal={self.tribunal}, "
+            f"origin={self.origin}, valid={self.valid})"
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, LegalProcess):
+            return NotImplemented
+
+        return all(
+            getattr(self, field) == getattr(other, field)
+            for field in self.__slots__
+        )
+
+    def __hash__(self):
+        return hash(tuple(getattr(self, field) for field in self.__slots__))
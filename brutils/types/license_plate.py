@@ -0,0 +1,63 @@
+from brutils import license_plate
+from brutils.types._value import _Value
+
+_BASE36 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+class LicensePlate(_Value):
+    """
+    A valid license plate, in the old (LLLNNNN) or Mercosul (LLLNLNN)
+    format, parsed once and stored as an integer (its characters read as a
+    base 36 number).
+
+    The value may be given with or without the dash, in upper or lower
+    case. Its formatted and masked forms are computed on first use and
+    cached.
+
+    Attributes:
+        formatted (str): The formatted plate, as returned by
+                         `format_license_plate`.
+        masked (str): The formatted plate with its last 4 characters hidden.
+
+    Raises:
+        ValueError: If the plate is not valid. `LicensePlate.parse` returns
+                    None instead.
+
+    Example:
+        >>> value = LicensePlate("abc-1234")
+        >>> str(value), value.formatted, value.masked
+        ('ABC1234', 'ABC-1234', 'ABC-****')
+        >>> LicensePlate("ABC1D23").formatted
+        'ABC1D23'
+    """
+
+    __slots__ = ()
+
+    @staticmethod
+    def _parse(value):  # type: (str) -> int | None
+        if not isinstance(value, str):
+            return None
+
+        plate = license_plate.remove_symbols(value)
+        if not license_plate.is_valid(plate):
+            return None
+        return int(plate, 36)
+
+    @staticmethod
+    def _canonical(number):  # type: (int) -> str
+        characters = []
+        for _ in range(7):
+            number, remainder = divmod(number, 36)
+            characters.append(_BASE36[remainder])
+        return "".join(reversed(characters))
+
+    @staticmethod
+    def _format(plate):  # type: (str) -> str
+        # Old plates have a digit as their fifth character
+        if plate[4].isdigit():
+            return f"{plate[:3]}-{plate[3:]}"
+        return plate
+
+    @staticmethod
+    def _mask(formatted):  # type: (str) -> str
+        return f"{formatted[:-4]}****"
@@ -0,0 +1,47 @@
+from brutils import phone
+from brutils.types._value import _Digits
+
+
+class Phone(_Digits):
+    """
+    A valid Brazilian phone number, with its DDD, parsed once and stored as
+    an integer.
+
+    The value may be given with or without symbols and the international
+    dialing code (+55), or as an integer. Its formatted and masked forms are
+    computed on first use and cached.
+
+    Attributes:
+        formatted (str): The formatted number, as returned by
+                         `format_phone`.
+        masked (str): The formatted number with only its DDD and last 4
+                      digits shown.
+
+    Raises:
+        ValueError: If the number is not valid. `Phone.parse` returns None
+                    instead.
+
+    Example:
+        >>> value = Phone("+55 (11) 99402-9275")
+        >>> str(value), value.formatted, value.masked
+        ('11994029275', '(11)99402-9275', '(11)*****-9275')
+    """
+
+    __slots__ = ()
+
+    _is_valid = staticmethod(phone.is_valid)
+
+    @staticmethod
+    def _clean(value):  # type: (str) -> str
+        digits = phone.remove_symbols_phone(value)
+        if len(digits) > 11:
+            digits = phone.remove_international_dialing_code(digits)
+        return digits
+
+    @staticmethod
+    def _format(digits):  # type: (str) -> str
+        return f"({digits[:2]}){digits[2:-4]}-{digits[-4:]}"
+
+    @staticmethod
+    def _mask(formatted):  # type: (str) -> str
+        return f"{formatted[:4]}{'*' * (len(formatted) - 9)}-{formatted[-4:]}"
@@ -0,0 +1,38 @@
+from brutils import pis
+from brutils.types._value import _Digits
+
+
+class PIS(_Digits):
+    """
+    A valid PIS, parsed once and stored as an integer.
+
+    The value may be given with or without symbols, or as an integer. Its
+    formatted and masked forms are computed on first use and cached.
+
+    Attributes:
+        formatted (str): The formatted PIS, as returned by `format_pis`.
+        masked (str): The formatted PIS with only its digits 4 to 8 shown.
+
+    Raises:
+        ValueError: If the PIS is not valid. `PIS.parse` returns None
+                    instead.
+
+    Example:
+        >>> value = PIS("12038619494")
+        >>> value.formatted, value.masked
+        ('120.38619.49-4', '***.38619.**-*')
+    """
+
+    __slots__ = ()
+
+    _LENGTH = 11
+    _clean = staticmethod(pis.remove_symbols)
+    _is_valid = staticmethod(pis.is_valid)
+
+    @staticmethod
+    def _format(digits):  # type: (str) -> str
+        return f"{digits[:3]}.{digits[3:8]}.{digits[8:10]}-{digits[10:]}"
+
+    @staticmethod
+    def _mask(formatted):  # type: (str) -> str
+        return f"***{formatted[3:10]}**-*"
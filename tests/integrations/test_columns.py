@@ -0,0 +1,84 @@
+import random
+from unittest import TestCase, main
+
+from brutils import cep, cnpj, cpf, pis
+from brutils.integrations import _columns
+
+
+def corpus(generate, size, seed=0):
+    """
+    Valid values of a kind, with changed check digits, reversed digits and
+    values that are not strings of digits mixed in.
+    """
+
+    rng = random.Random(seed)
+    values = []
+    for _ in range(size):
+        value = generate()
+        draw = rng.random()
+        if draw < 0.2:
+            value = value[:-1] + str((int(value[-1]) + 1) % 10)
+        elif draw < 0.3:
+            value = value[::-1]
+        elif draw < 0.4:
+            value = rng.choice(
+                (
+                    None,
+                    1.5,
+                    int(value),
+                    "",
+                    "a" * len(value),
+                    value[0] * len(value),
+                    # Arabic-Indic and fullwidth digits, which are digits
+                    # for `str.isdigit`
+                    "٨" * len(value),
+                    "１" * len(value),
+                    value[:3] + "." + value[4:],
+                )
+            )
+        values.append(value)
+    return values
+
+
+class TestColumns(TestCase):
+    def test_same_as_scalar_functions(self):
+        for module, is_valid, format, format_column in (
+            (cpf, cpf.is_valid, cpf.format_cpf, _columns._format_cpf),
+            (cnpj, cnpj.is_valid, cnpj.format_cnpj, _columns._format_cnpj),
+            (pis, pis.is_valid, pis.format_pis, _columns._format_pis),
+            (cep, cep.is_valid, cep.format_cep, _columns._format_cep),
+        ):
+            name = module.__name__.split(".")[-1]
+            is_valid_column = getattr(_columns, f"_is_valid_{name}")
+            values = corpus(module.generate, 2_000)
+
+            with self.subTest(name):
+                self.assertEqual(
+                    is_valid_column(values).tolist(),
+                    [is_valid(value) for value in values],
+                )
+                self.assertEqual(
+                    format_column(values).tolist(),
+                    [format(value) for value in values],
+                )
+
+    def test_empty(self):
+        self.assertEqual(_columns._is_valid_cpf([]).tolist(), [])
+        self.assertEqual(_columns._format_cnpj([]).tolist(), [])
+
+    def test_map_calls_function_once_per_value(self):
+        calls = []
+
+        def function(value):
+            calls.append(value)
+            return value * 2
+
+        self.assertEqual(
+            _columns._map(function, ["a", "b", "a", "a"]).tolist(),
+            ["aa", "bb", "aa", "aa"],
+        )
+        self.assertEqual(calls, ["a", "b"])
+
+
+if __name__ == "__main__":
+    main()
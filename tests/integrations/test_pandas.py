@@ -0,0 +1,103 @@
+from unittest import TestCase, main, skipIf
+
+import brutils.integrations.pandas  # noqa: F401
+from brutils.integrations.pandas import pandas
+
+
+@skipIf(pandas is None, "pandas is not installed")
+class TestSeriesAccessor(TestCase):
+    def test_documents(self):
+        series = pandas.Series(
+            ["82178537464", "00000000000", None, "821.785.374-64"],
+            index=["a", "b", "c", "d"],
+            name="cpf",
+        )
+
+        result = series.br.is_valid_cpf()
+        self.assertEqual(result.tolist(), [True, False, False, False])
+        self.assertEqual(result.index.tolist(), ["a", "b", "c", "d"])
+        self.assertEqual(result.name, "cpf")
+        self.assertEqual(result.dtype, bool)
+
+        formatted = series.br.format_cpf()
+        self.assertEqual(formatted["a"], "821.785.374-64")
+        self.assertTrue(formatted[["b", "c", "d"]].isna().all())
+
+        cleaned = series.br.remove_symbols_cpf()
+        self.assertEqual(cleaned["d"], "82178537464")
+        self.assertTrue(pandas.isna(cleaned["c"]))
+
+        self.assertEqual(
+            pandas.Series(["03560714000142", "03.560.714/0001-42"])
+            .br.remove_symbols_cnpj()
+            .br.format_cnpj()
+            .tolist(),
+            ["03.560.714/0001-42", "03.560.714/0001-42"],
+        )
+        self.assertEqual(
+            pandas.Series(["12038619494", "12038619490"])
+            .br.is_valid_pis()
+            .tolist(),
+            [True, False],
+        )
+        self.assertEqual(
+            pandas.Series(["01310-200"]).br.remove_symbols_cep().tolist(),
+            ["01310200"],
+        )
+        self.assertEqual(
+            pandas.Series(["01310200", "0131020"]).br.is_valid_cep().tolist(),
+            [True, False],
+        )
+
+    def test_integers_are_not_documents(self):
+        self.assertEqual(
+            pandas.Series([82178537464]).br.is_valid_cpf().tolist(), [False]
+        )
+
+    def test_phone_and_email(self):
+        phones = pandas.Series(["(11)99402-9275", "11994029275", "123"])
+
+        self.assertEqual(
+            phones.br.remove_symbols_phone().tolist(),
+            ["11994029275", "11994029275", "123"],
+        )
+        self.assertEqual(
+            phones.br.is_valid_phone().tolist(), [False, True, False]
+        )
+        self.assertEqual(phones.br.format_phone()[1], "(11)99402-9275")
+        self.assertEqual(
+            pandas.Series(["nome@gmail.com", "nome@"])
+            .br.is_valid_email()
+            .tolist(),
+            [True, False],
+        )
+
+    def test_get_code_by_municipality_name(self):
+        codes = pandas.Series(
+            ["São Paulo", "campinas", "Inexistente", None]
+        ).br.get_code_by_municipality_name("SP")
+
+        self.assertEqual(codes[:2].tolist(), ["3550308", "3509502"])
+        self.assertTrue(codes[2:].isna().all())
+
+    def test_dates(self):
+        dates = pandas.Series(
+            pandas.to_datetime(["2024-12-25", "2024-07-09", "2024-07-10", None])
+        )
+
+        self.assertEqual(
+            dates.br.is_holiday().tolist(), [True, False, False, False]
+        )
+        self.assertEqual(
+            dates.br.is_holiday("SP").tolist(), [True, True, False, False]
+        )
+        self.assertEqual(
+            dates.br.is_business_day("SP").tolist(),
+            [False, False, True, False],
+        )
+        with self.assertRaises(ValueError):
+            dates.br.is_holiday("XX")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+from datetime import date
+from unittest import TestCase, main, skipIf
+
+import brutils.integrations.polars  # noqa: F401
+from brutils.integrations.polars import polars
+
+
+@skipIf(polars is None, "polars is not installed")
+class TestExprNamespace(TestCase):
+    def select(self, values, expression):
+        frame = polars.DataFrame({"value": values})
+        return frame.select(expression(polars.col("value")))["value"].to_list()
+
+    def test_documents(self):
+        cpfs = ["82178537464", "00000000000", None, "821.785.374-64"]
+
+        self.assertEqual(
+            self.select(cpfs, lambda column: column.br.is_valid_cpf()),
+            [True, False, False, False],
+        )
+        self.assertEqual(
+            self.select(cpfs, lambda column: column.br.format_cpf()),
+            ["821.785.374-64", None, None, None],
+        )
+        self.assertEqual(
+            self.select(
+                cpfs,
+                lambda column: column.br.remove_symbols_cpf().br.is_valid_cpf(),
+            ),
+            [True, False, False, True],
+        )
+        self.assertEqual(
+            self.select(
+                ["03.560.714/0001-42"],
+                lambda column: column.br.remove_symbols_cnpj().br.format_cnpj(),
+            ),
+            ["03.560.714/0001-42"],
+        )
+        self.assertEqual(
+            self.select(
+                ["12038619494", "12038619490"],
+                lambda column: column.br.is_valid_pis(),
+            ),
+            [True, False],
+        )
+        self.assertEqual(
+            self.select(
+                ["01310-200"],
+                lambda column: column.br.remove_symbols_cep().br.format_cep(),
+            ),
+            ["01310-200"],
+        )
+
+    def test_phone_and_email(self):
+        phones = ["(11)99402-9275", "11994029275", None]
+
+        self.assertEqual(
+            self.select(phones, lambda column: column.br.is_valid_phone()),
+            [False, True, False],
+        )
+        self.assertEqual(
+            self.select(
+                phones,
+                lambda column: column.br.remove_symbols_phone().br.format_phone(),
+            ),
+            ["(11)99402-9275", "(11)99402-9275", None],
+        )
+        self.assertEqual(
+            self.select(
+                ["nome@gmail.com", "nome@"],
+                lambda column: column.br.is_valid_email(),
+            ),
+            [True, False],
+        )
+
+    def test_get_code_by_municipality_name(self):
+        self.assertEqual(
+            self.select(
+                ["São Paulo", "Inexistente", None],
+                lambda column: column.br.get_code_by_municipality_name("SP"),
+            ),
+            ["3550308", None, None],
+        )
+
+    def test_dates(self):
+        dates = [date(2024, 12, 25), date(2024, 7, 9), date(2024, 7, 10), None]
+
+        self.assertEqual(
+            self.select(dates, lambda column: column.br.is_holiday("SP")),
+            [True, True, False, False],
+        )
+        self.assertEqual(
+            self.select(dates, lambda column: column.br.is_business_day()),
+            [False, True, True, False],
+        )
+        with self.assertRaises(ValueError):
+            self.select(dates, lambda column: column.br.is_holiday("XX"))
+
+
+if __name__ == "__main__":
+    main()
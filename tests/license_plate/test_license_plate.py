@@ -1,14 +1,24 @@
 from unittest import TestCase, main
 from unittest.mock import patch
 
+from brutils.data.license_plate_ranges import LICENSE_PLATE_RANGES
 from brutils.license_plate import (
+    _convert_to_old_format,
+    _decode_mercosul,
+    _decode_old_format,
+    _encode_prefix,
     _is_valid_mercosul,
     _is_valid_old_format,
+    _sample_unique,
     convert_to_mercosul,
     format_license_plate,
     generate,
     get_format,
+    get_uf,
+    get_uf_many,
     remove_symbols,
+    resolve,
+    sample_unique,
 )
 
 
@@ -103,6 +113,152 @@ class TestLicensePlate(TestCase):
         # When invalid format is provided, returns None
         self.assertIsNone(generate("LNLNLNL"))
 
+    def test_get_uf(self):
+        self.assertEqual(get_uf("AAA0001"), "PR")
+        self.assertEqual(get_uf("BEZ9999"), "PR")
+        self.assertEqual(get_uf("BFA0001"), "SP")
+        self.assertEqual(get_uf("abc-1234"), "PR")
+        self.assertEqual(get_uf("KMF1234"), "RJ")
+        self.assertEqual(get_uf("LVE1234"), "RJ")
+        self.assertEqual(get_uf("NYH1234"), "BA")
+        self.assertEqual(get_uf(" JDP1234 "), "DF")
+
+        # Mercosul plates converted from the old format
+        self.assertEqual(get_uf(convert_to_mercosul("KMF1234")), "RJ")
+        self.assertEqual(get_uf("GKJ1J99"), "MG")
+
+        # Mercosul plates that were not converted from the old format
+        self.assertIsNone(get_uf("ABC1K23"))
+
+        # letters outside the known ranges
+        self.assertIsNone(get_uf("OAA1234"))
+        self.assertIsNone(get_uf("ZZZ1234"))
+
+        # invalid plates
+        self.assertIsNone(get_uf("ABC123"))
+        self.assertIsNone(get_uf("ABCD123"))
+        self.assertIsNone(get_uf(""))
+        self.assertIsNone(get_uf(1234567))
+        self.assertIsNone(get_uf(None))
+
+    def test_get_uf_many(self):
+        license_plates = ["ABC1234", "KMF-1234", "ABC1K23", None, "ABC1234"]
+        self.assertEqual(
+            get_uf_many(license_plates), ["PR", "RJ", None, None, "PR"]
+        )
+        self.assertEqual(
+            get_uf_many(license_plates),
+            [get_uf(license_plate) for license_plate in license_plates],
+        )
+        self.assertEqual(get_uf_many([]), [])
+
+    def test_license_plate_ranges(self):
+        previous_end = -1
+        for start, end, uf in LICENSE_PLATE_RANGES:
+            self.assertEqual(_encode_prefix(start), previous_end + 1)
+            self.assertLessEqual(_encode_prefix(start), _encode_prefix(end))
+            self.assertEqual(get_uf(f"{start}0000"), uf)
+            self.assertEqual(get_uf(f"{end}9999"), uf)
+            previous_end = _encode_prefix(end)
+
+    def test_convert_to_old_format(self):
+        self.assertEqual(_convert_to_old_format("ABC4F67"), "ABC4567")
+        self.assertEqual(_convert_to_old_format("ABC1A23"), "ABC1023")
+        self.assertEqual(_convert_to_old_format("ABC1J23"), "ABC1923")
+        self.assertIsNone(_convert_to_old_format("ABC1K23"))
+
+        for license_plate in ["ABC1234", "XYZ0000", "QWE9999"]:
+            self.assertEqual(
+                _convert_to_old_format(convert_to_mercosul(license_plate)),
+                license_plate,
+            )
+
+    def test_resolve(self):
+        # valid plates come first
+        self.assertEqual(resolve("ABC1234")[0], "ABC1234")
+        self.assertEqual(resolve("abc-1e34")[0], "ABC1E34")
+        self.assertEqual(resolve("ABC1B34"), ["ABC1B34", "ABC1834", "ABC1334"])
+
+        # letters read as digits and vice versa
+        self.assertEqual(resolve("A8C-I234"), ["ABC1234"])
+        self.assertEqual(resolve("ABCI234")[0], "ABC1234")
+        self.assertEqual(resolve("5OS1234")[0], "SOS1234")
+        self.assertEqual(
+            resolve("0BC1234")[:3], ["OBC1234", "OBC1Z34", "DBC1234"]
+        )
+
+        # every candidate is a valid plate
+        for license_plate in ["0BC1234", "A8C1I34", "S0S1OO1", "ABC1B34"]:
+            for candidate in resolve(license_plate):
+                self.assertTrue(
+                    _is_valid_old_format(candidate)
+                    or _is_valid_mercosul(candidate)
+                )
+
+    def test_resolve_max_edits(self):
+        self.assertEqual(resolve("0BC1234", max_edits=0), [])
+        self.assertEqual(resolve("ABC1234", max_edits=0), ["ABC1234"])
+
+    def test_resolve_invalid_max_edits(self):
+        for max_edits in (None, -1, 1.5, "2", True):
+            with self.subTest(max_edits=max_edits):
+                self.assertEqual(resolve("ABC1234", max_edits=max_edits), [])
+        self.assertEqual(resolve("08C1234", max_edits=1), [])
+        self.assertIn("OBC1234", resolve("08C1234", max_edits=2))
+        self.assertEqual(resolve("085I234"), [])
+
+    def test_resolve_invalid(self):
+        self.assertEqual(resolve("ABC123"), [])
+        self.assertEqual(resolve("ABC12345"), [])
+        self.assertEqual(resolve("ABC*234"), [])
+        self.assertEqual(resolve(""), [])
+        self.assertEqual(resolve(None), [])
+
+    def test_sample_unique(self):
+        plates = list(sample_unique(10_000, seed=1))
+        self.assertEqual(len(plates), 10_000)
+        self.assertEqual(len(set(plates)), 10_000)
+        for plate in plates:
+            self.assertTrue(_is_valid_mercosul(plate))
+
+        plates = list(sample_unique(10_000, format="lllnnnn", seed=1))
+        self.assertEqual(len(set(plates)), 10_000)
+        for plate in plates:
+            self.assertTrue(_is_valid_old_format(plate))
+
+        self.assertEqual(list(sample_unique(0)), [])
+
+    def test_sample_unique_seed(self):
+        self.assertEqual(
+            list(sample_unique(100, seed=42)), list(sample_unique(100, seed=42))
+        )
+        self.assertNotEqual(
+            list(sample_unique(100, seed=42)), list(sample_unique(100, seed=43))
+        )
+
+    def test_sample_unique_is_a_permutation(self):
+        # restricted to a small space, every index must be produced once
+        for size in (1, 7, 1000, 4096, 5000):
+            plates = list(_sample_unique(size, "LLLNNNN", size, seed=3))
+            self.assertEqual(
+                sorted(plates),
+                sorted(_decode_old_format(index) for index in range(size)),
+            )
+
+    def test_sample_unique_invalid_arguments(self):
+        self.assertIsNone(sample_unique(10, format="invalid"))
+        self.assertIsNone(sample_unique(10, format=None))
+        self.assertIsNone(sample_unique(-1))
+        self.assertIsNone(sample_unique("10"))
+        self.assertIsNone(sample_unique(26**4 * 10**3 + 1))
+        self.assertIsNone(sample_unique(26**3 * 10**4 + 1, format="LLLNNNN"))
+
+    def test_decode(self):
+        self.assertEqual(_decode_old_format(0), "AAA0000")
+        self.assertEqual(_decode_old_format(26**3 * 10**4 - 1), "ZZZ9999")
+        self.assertEqual(_decode_mercosul(0), "AAA0A00")
+        self.assertEqual(_decode_mercosul(26**4 * 10**3 - 1), "ZZZ9Z99")
+
 
 if __name__ == "__main__":
     main()
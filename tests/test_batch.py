@@ -0,0 +1,116 @@
+import os
+import tempfile
+from unittest import TestCase, main
+
+import numpy
+
+from brutils import batch
+from brutils.cnpj import format_cnpj
+from brutils.cpf import format_cpf
+from brutils.cpf import generate as generate_cpf
+from brutils.cpf import is_valid as is_valid_cpf
+from brutils.email import is_valid as is_valid_email
+
+
+class TestValidate(TestCase):
+    def setUp(self):
+        self.cpfs = [generate_cpf() for _ in range(500)]
+        self.cpfs[::7] = ["00000000000"] * len(self.cpfs[::7])
+        self.cpfs[::11] = ["123"] * len(self.cpfs[::11])
+
+    def test_validate_in_process(self):
+        self.assertEqual(
+            list(batch.validate("cpf", self.cpfs, workers=1, chunk_size=64)),
+            [is_valid_cpf(cpf) for cpf in self.cpfs],
+        )
+
+    def test_validate_in_pool_preserves_order(self):
+        self.assertEqual(
+            list(
+                batch.validate("cpf", iter(self.cpfs), workers=2, chunk_size=37)
+            ),
+            [is_valid_cpf(cpf) for cpf in self.cpfs],
+        )
+
+    def test_validate_uses_batch_variant(self):
+        emails = ["nome@gmail.com", "nome@@gmail.com", "", None]
+        self.assertEqual(
+            list(batch.validate("email", emails, workers=1)),
+            [is_valid_email(email) for email in emails],
+        )
+
+    def test_validate_empty(self):
+        self.assertEqual(list(batch.validate("cpf", [], workers=2)), [])
+
+    def test_validate_integer_array(self):
+        values = numpy.array(
+            [int(cpf) for cpf in self.cpfs if cpf != "123"], dtype=numpy.uint64
+        )
+        expected = [
+            is_valid_cpf(str(value).zfill(11)) for value in values.tolist()
+        ]
+
+        self.assertEqual(
+            list(batch.validate("cpf", values, workers=2, chunk_size=50)),
+            expected,
+        )
+        # A CPF with leading zeros
+        self.assertEqual(
+            list(batch.validate("cpf", numpy.array([1234567890]), workers=1)),
+            [is_valid_cpf("01234567890")],
+        )
+
+    def test_validate_memory_mapped_array(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cpfs.bin")
+            values = numpy.memmap(
+                path, dtype="S11", mode="w+", shape=(len(self.cpfs),)
+            )
+            values[:] = [cpf.encode() for cpf in self.cpfs]
+            values.flush()
+            del values
+
+            values = numpy.memmap(path, dtype="S11", mode="r")
+            result = list(
+                batch.validate("cpf", values, workers=2, chunk_size=64)
+            )
+            del values
+
+        self.assertEqual(result, [is_valid_cpf(cpf) for cpf in self.cpfs])
+
+    def test_validate_stops_early(self):
+        results = batch.validate("cpf", self.cpfs, workers=2, chunk_size=10)
+        self.assertEqual(next(results), is_valid_cpf(self.cpfs[0]))
+        results.close()
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            batch.validate("rg", self.cpfs)
+        with self.assertRaises(ValueError):
+            batch.validate("cpf", self.cpfs, workers=0)
+        with self.assertRaises(ValueError):
+            batch.validate("cpf", self.cpfs, chunk_size=0)
+
+
+class TestFormat(TestCase):
+    def test_format(self):
+        cpfs = [generate_cpf() for _ in range(100)] + ["123", "00000000000"]
+        self.assertEqual(
+            list(batch.format("cpf", cpfs, workers=2, chunk_size=16)),
+            [format_cpf(cpf) for cpf in cpfs],
+        )
+
+    def test_format_unicode_array(self):
+        cnpjs = numpy.array(["03560714000142", "00000000000000", "abc"])
+        self.assertEqual(
+            list(batch.format("cnpj", cnpjs, workers=1)),
+            [format_cnpj(cnpj) for cnpj in cnpjs.tolist()],
+        )
+
+    def test_format_unsupported_kind(self):
+        with self.assertRaises(ValueError):
+            batch.format("email", ["nome@gmail.com"])
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,21 @@
 from decimal import Decimal
-from unittest import TestCase
+from unittest import TestCase, skipIf
 
-from brutils.currency import convert_real_to_text, format_currency
+from brutils.currency import (
+    CurrencyFormatter,
+    convert_real_to_text,
+    format_currency,
+    format_currency_many,
+    parse_currency,
+    parse_currency_many,
+    parse_real_text,
+    parse_real_text_many,
+)
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
 
 
 class TestFormatCurrency(TestCase):
@@ -26,6 +40,199 @@ class TestFormatCurrency(TestCase):
         assert format_currency("09809,87") is None
         assert format_currency("897L") is None
 
+    def test_when_value_is_an_integer(self):
+        assert format_currency(1234567) == "R$ 1.234.567,00"
+        assert format_currency(-1000) == "R$ -1.000,00"
+        assert format_currency(10**20) == "R$ 100.000.000.000.000.000.000,00"
+
+    def test_when_value_is_a_decimal_string(self):
+        assert format_currency("1234.5") == "R$ 1.234,50"
+
+
+class TestFormatCurrencyMany(TestCase):
+    values = [
+        Decimal("123236.70"),
+        123236.70,
+        -123236.70,
+        0,
+        -123236.7676,
+        2.675,
+        -0.0,
+        10**15,
+        "1234.5",
+        "not a number",
+        "09809,87",
+    ]
+
+    def test_format_currency_many(self):
+        self.assertEqual(
+            format_currency_many(self.values),
+            [format_currency(value) for value in self.values],
+        )
+        self.assertEqual(format_currency_many([]), [])
+
+    def test_format_currency_many_with_formatter(self):
+        formatter = CurrencyFormatter(integer_cents=True)
+        self.assertEqual(
+            format_currency_many([123456, -50, 0], formatter=formatter),
+            ["R$ 1.234,56", "R$ -0,50", "R$ 0,00"],
+        )
+
+    @skipIf(numpy is None, "numpy is not installed")
+    def test_format_currency_many_with_numpy_arrays(self):
+        self.assertEqual(
+            format_currency_many(numpy.array([1234.56, -0.5, 1e6])),
+            ["R$ 1.234,56", "R$ -0,50", "R$ 1.000.000,00"],
+        )
+        self.assertEqual(
+            format_currency_many(
+                numpy.array([123456, -50], dtype=numpy.int64),
+                formatter=CurrencyFormatter(integer_cents=True),
+            ),
+            ["R$ 1.234,56", "R$ -0,50"],
+        )
+
+
+class TestCurrencyFormatter(TestCase):
+    def test_default_options(self):
+        formatter = CurrencyFormatter()
+        for value in TestFormatCurrencyMany.values:
+            self.assertEqual(formatter.format(value), format_currency(value))
+
+    def test_symbol(self):
+        self.assertEqual(CurrencyFormatter(symbol="").format(1.5), "1,50")
+        self.assertEqual(
+            CurrencyFormatter(symbol="BRL").format(-1234.5), "BRL -1.234,50"
+        )
+
+    def test_negative_style(self):
+        before_symbol = CurrencyFormatter(negative_style="before_symbol")
+        self.assertEqual(before_symbol.format(-1234.5), "-R$ 1.234,50")
+        self.assertEqual(before_symbol.format(1234.5), "R$ 1.234,50")
+        self.assertEqual(
+            before_symbol.format_many([-1, 1]), ["-R$ 1,00", "R$ 1,00"]
+        )
+
+        parentheses = CurrencyFormatter(negative_style="parentheses")
+        self.assertEqual(parentheses.format(-1234.5), "(R$ 1.234,50)")
+        self.assertEqual(parentheses.format(1234.5), "R$ 1.234,50")
+        self.assertEqual(
+            CurrencyFormatter(symbol="", negative_style="parentheses").format(
+                -1
+            ),
+            "(1,00)",
+        )
+
+        with self.assertRaises(ValueError):
+            CurrencyFormatter(negative_style="invalid")
+
+    def test_integer_cents(self):
+        formatter = CurrencyFormatter(integer_cents=True)
+        self.assertEqual(formatter.format(123456), "R$ 1.234,56")
+        self.assertEqual(formatter.format(5), "R$ 0,05")
+        self.assertEqual(formatter.format(-123456789), "R$ -1.234.567,89")
+        self.assertEqual(formatter.format(0), "R$ 0,00")
+        self.assertIsNone(formatter.format(1.5))
+        self.assertIsNone(formatter.format("100"))
+        self.assertIsNone(formatter.format(True))
+
+    def test_invalid_values(self):
+        formatter = CurrencyFormatter()
+        self.assertIsNone(formatter.format("not a number"))
+        self.assertEqual(formatter.format_many(["897L", 1]), [None, "R$ 1,00"])
+
+
+class TestParseCurrency(TestCase):
+    def test_parse_currency(self):
+        self.assertEqual(parse_currency("R$ 1.234,56"), 123456)
+        self.assertEqual(parse_currency("R$ 0,00"), 0)
+        self.assertEqual(parse_currency("R$\xa01.234,56"), 123456)
+        self.assertEqual(parse_currency("R$1,5"), 150)
+        self.assertEqual(parse_currency("1.234.567,8"), 123456780)
+        self.assertEqual(parse_currency("1234"), 123400)
+        self.assertEqual(parse_currency("1.234"), 123400)
+
+    def test_parse_currency_negative_values(self):
+        self.assertEqual(parse_currency("R$ -1.234,56"), -123456)
+        self.assertEqual(parse_currency("-R$ 0,50"), -50)
+        self.assertEqual(parse_currency("(R$ 0,50)"), -50)
+        self.assertEqual(parse_currency("-0,50"), -50)
+
+    def test_parse_currency_as_decimal(self):
+        self.assertEqual(
+            parse_currency("R$ 1.234,56", as_decimal=True), Decimal("1234.56")
+        )
+        self.assertEqual(
+            str(parse_currency("-R$ 0,5", as_decimal=True)), "-0.50"
+        )
+
+    def test_parse_currency_round_trip(self):
+        for formatter in (
+            CurrencyFormatter(integer_cents=True),
+            CurrencyFormatter(
+                integer_cents=True, negative_style="before_symbol"
+            ),
+            CurrencyFormatter(integer_cents=True, negative_style="parentheses"),
+        ):
+            for cents in (0, 1, -1, 99, 100, 123456, -987654321, 10**15):
+                self.assertEqual(parse_currency(formatter.format(cents)), cents)
+
+    def test_parse_currency_strict(self):
+        for value in (
+            "",
+            "R$ ",
+            "-",
+            "1,",
+            ",50",
+            "12.34",
+            "1234.567",
+            ".123",
+            "1,234",
+            " R$ 1,00",
+            "r$ 1,00",
+            "R$  1,00",
+            "+1,00",
+            "--1,00",
+            "-R$ -1,00",
+            "(-1,00)",
+            "R$ 1.00",
+            "R$ 1,0a",
+            "US$ 1,00",
+            "١,٠٠",
+        ):
+            with self.subTest(value=value):
+                self.assertIsNone(parse_currency(value))
+
+    def test_parse_currency_lenient(self):
+        self.assertEqual(parse_currency(" r$1234,567 ", strict=False), 123457)
+        self.assertEqual(parse_currency("R$ 1,005", strict=False), 100)
+        self.assertEqual(parse_currency("+ R$ 12.34", strict=False), 123400)
+        self.assertEqual(parse_currency("- R$ 1,00", strict=False), -100)
+        self.assertEqual(parse_currency(",5", strict=False), 50)
+        self.assertIsNone(parse_currency("--1,00", strict=False))
+        self.assertIsNone(parse_currency("R$ abc", strict=False))
+
+    def test_parse_currency_invalid_types(self):
+        self.assertIsNone(parse_currency(None))
+        self.assertIsNone(parse_currency(1234.56))
+        self.assertIsNone(parse_currency(b"R$ 1,00"))
+
+    def test_parse_currency_many(self):
+        values = ["R$ 1.234,56", "-R$ 0,50", "abc", None]
+        self.assertEqual(parse_currency_many(values), [123456, -50, None, None])
+        self.assertEqual(
+            parse_currency_many(values, as_decimal=True),
+            [Decimal("1234.56"), Decimal("-0.50"), None, None],
+        )
+        self.assertEqual(parse_currency_many([" 1,5 "], strict=False), [150])
+        self.assertEqual(parse_currency_many([]), [])
+
+    @skipIf(numpy is None, "numpy is not installed")
+    def test_parse_currency_many_with_numpy_arrays(self):
+        self.assertEqual(
+            parse_currency_many(numpy.array(["R$ 1,00", "2,50"])), [100, 250]
+        )
+
 
 class TestConvertRealToText(TestCase):
     def test_convert_real_to_text(self):
@@ -133,3 +340,82 @@ class TestConvertRealToText(TestCase):
         self.assertIsNone(
             convert_real_to_text(float("nan"))
         )  # Not a number (NaN)
+
+
+class TestParseRealText(TestCase):
+    def test_parse_real_text(self):
+        self.assertEqual(parse_real_text("Zero reais"), Decimal("0.00"))
+        self.assertEqual(parse_real_text("Um centavo"), Decimal("0.01"))
+        self.assertEqual(parse_real_text("Um real"), Decimal("1.00"))
+        self.assertEqual(
+            parse_real_text(
+                "Mil, quinhentos e vinte e três reais e quarenta e cinco "
+                "centavos"
+            ),
+            Decimal("1523.45"),
+        )
+        self.assertEqual(
+            parse_real_text("Menos cinquenta reais e vinte e cinco centavos"),
+            Decimal("-50.25"),
+        )
+        self.assertEqual(
+            parse_real_text("Um milhão de reais"), Decimal("1000000.00")
+        )
+        self.assertEqual(
+            parse_real_text("Um quatrilhão de reais"),
+            Decimal("1000000000000000.00"),
+        )
+
+    def test_parse_real_text_is_case_and_accent_insensitive(self):
+        self.assertEqual(
+            parse_real_text("DOIS MILHOES DE REAIS E TRES CENTAVOS"),
+            Decimal("2000000.03"),
+        )
+        self.assertEqual(
+            parse_real_text("mil quinhentos e vinte e três reais"),
+            Decimal("1523.00"),
+        )
+
+    def test_parse_real_text_round_trip(self):
+        for value in (
+            "0.01",
+            "0.99",
+            "1.01",
+            "100.00",
+            "101.10",
+            "1000000.45",
+            "-2000000000.99",
+            "1234567890.50",
+            "999999999999999.99",
+        ):
+            amount = Decimal(value)
+            with self.subTest(amount=amount):
+                self.assertEqual(
+                    parse_real_text(convert_real_to_text(amount)), amount
+                )
+
+    def test_parse_real_text_invalid(self):
+        for text in (
+            "",
+            "reais",
+            "um",
+            "um real e",
+            "vinte e cem reais",
+            "mil mil reais",
+            "milhão de reais",
+            "cem centavos",
+            "dez centavos e um real",
+            "um real e um real",
+            "um dólar",
+        ):
+            with self.subTest(text=text):
+                self.assertIsNone(parse_real_text(text))
+
+        self.assertIsNone(parse_real_text(None))
+        self.assertIsNone(parse_real_text(123))
+
+    def test_parse_real_text_many(self):
+        self.assertEqual(
+            parse_real_text_many(["Um real", "Dez centavos", "abc"]),
+            [Decimal("1.00"), Decimal("0.10"), None],
+        )
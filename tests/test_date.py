@@ -1,8 +1,14 @@
+from datetime import date
 from unittest import TestCase
 
 from num2words import num2words
 
-from brutils import convert_date_to_text
+from brutils import (
+    convert_date_to_text,
+    convert_dates_to_text,
+    find_text_dates,
+    parse_text_date,
+)
 from brutils.data.enums.months import MonthsEnum
 
 
@@ -32,6 +38,8 @@ class TestDate(TestCase):
         self.assertEqual(convert_date_to_text("15-08-2025"),"Quinze de agosto de dois mil e vinte e cinco") # First day of the month
         self.assertEqual(convert_date_to_text("15.08.2025"),"Quinze de agosto de dois mil e vinte e cinco") # First day of the month
         self.assertEqual(convert_date_to_text("2025-01-22"),"Vinte e dois de janeiro de dois mil e vinte e cinco") # First day of the month
+        self.assertEqual(convert_date_to_text("16/07/2019"),"Dezesseis de julho de dois mil e dezenove") # Brazilian spelling
+        self.assertEqual(convert_date_to_text("17/11/1817"),"Dezessete de novembro de mil oitocentos e dezessete") # Brazilian spelling
 
     # Nonexistent dates
     def test_nonexistent_dates(self):
@@ -59,6 +67,40 @@ class TestDate(TestCase):
         self.assertRaises(ValueError, convert_date_to_text, "1/3/2024")
         self.assertRaises(ValueError, convert_date_to_text, "1924/08/20")
 
+    def test_edge_dates(self):
+        self.assertEqual(convert_date_to_text("2000-02-29"),"Vinte e nove de fevereiro de dois mil")
+        self.assertIsNone(convert_date_to_text("29/02/1900")) # Not a leap year
+        self.assertEqual(convert_date_to_text("31.12.0001"),"Trinta e um de dezembro de um")
+        self.assertIsNone(convert_date_to_text("01/01/0000"))
+
+    def test_whitespace_and_other_digits(self):
+        self.assertIsNone(convert_date_to_text("15/08/2024\n"))
+        self.assertIsNone(convert_date_to_text("٠١/٠٣/٢٠٢٥"))  # Arabic-Indic
+        self.assertIsNone(convert_date_to_text("０１/03/2025"))  # Fullwidth
+        self.assertRaises(ValueError, convert_date_to_text, "15/08/2024 ")
+        self.assertRaises(ValueError, convert_date_to_text, " 15/08/2024")
+        self.assertRaises(ValueError, convert_date_to_text, "15/08/2024\n\n")
+        self.assertRaises(ValueError, convert_date_to_text, "15/08/20a4\n")
+
+    def test_convert_dates_to_text(self):
+        dates = ["01/03/2025", "2024-08-15", "31/04/2025", "Invalid", None, "01/03/2025"]
+        self.assertEqual(
+            convert_dates_to_text(dates),
+            [
+                "Primeiro de marco de dois mil e vinte e cinco",
+                "Quinze de agosto de dois mil e vinte e quatro",
+                None,
+                None,
+                None,
+                "Primeiro de marco de dois mil e vinte e cinco",
+            ],
+        )
+        self.assertEqual(convert_dates_to_text([]), [])
+        self.assertEqual(
+            convert_dates_to_text(iter(["16/07/2019"])),
+            [convert_date_to_text("16/07/2019")],
+        )
+
     months_year = [
         (1, "janeiro"),
         (2, "fevereiro"),
@@ -78,3 +120,121 @@ class TestDate(TestCase):
         for number_month, name_month in self.months_year:
             month = MonthsEnum(number_month)
             self.assertEqual(month.month_name, name_month)
+
+
+class TestParseTextDate(TestCase):
+    def test_parse_text_date(self):
+        self.assertEqual(
+            parse_text_date("Primeiro de março de dois mil e vinte e quatro"),
+            date(2024, 3, 1),
+        )
+        self.assertEqual(
+            parse_text_date("PRIMEIRO DE MARCO DE DOIS MIL E VINTE E QUATRO"),
+            date(2024, 3, 1),
+        )
+        self.assertEqual(
+            parse_text_date("  um de janeiro de dois mil  "), date(2000, 1, 1)
+        )
+        self.assertEqual(
+            parse_text_date(
+                "Trinta e um de dezembro de mil novecentos e noventa e nove"
+            ),
+            date(1999, 12, 31),
+        )
+        self.assertEqual(
+            parse_text_date("dezesseis de julho de dois mil e dezenove"),
+            date(2019, 7, 16),
+        )
+
+    def test_parse_text_date_is_the_inverse_of_convert_date_to_text(self):
+        for value in (
+            "01/01/0001",
+            "29/02/2000",
+            "16/07/2019",
+            "17/11/1817",
+            "31/12/9999",
+        ):
+            with self.subTest(value=value):
+                day, month, year = map(int, value.split("/"))
+                self.assertEqual(
+                    parse_text_date(convert_date_to_text(value)),
+                    date(year, month, day),
+                )
+
+    def test_parse_text_date_invalid(self):
+        for text in (
+            "",
+            "primeiro de março",
+            "primeiro de março de 2024",
+            "trinta de fevereiro de dois mil",
+            "vinte e nove de fevereiro de mil novecentos",
+            "trinta e dois de janeiro de dois mil",
+            "primeiro de março de dois mil e vinte e quatro.",
+            "primeiro de março de dois mil e vinte e cem",
+            "primeiro de marcho de dois mil",
+        ):
+            with self.subTest(text=text):
+                self.assertIsNone(parse_text_date(text))
+
+        self.assertIsNone(parse_text_date(None))
+
+
+class TestFindTextDates(TestCase):
+    def test_find_text_dates(self):
+        text = (
+            "Lavrada em primeiro de março de dois mil e vinte e quatro. "
+            "Aos QUINZE DE ABRIL DE MIL NOVECENTOS E NOVENTA E NOVE, e no "
+            "dia trinta e um de dezembro de dois mil, e vinte."
+        )
+        dates = find_text_dates(text)
+
+        self.assertEqual(
+            [found for found, _ in dates],
+            [date(2024, 3, 1), date(1999, 4, 15), date(2000, 12, 31)],
+        )
+        self.assertEqual(
+            [text[start:end] for _, (start, end) in dates],
+            [
+                "primeiro de março de dois mil e vinte e quatro",
+                "QUINZE DE ABRIL DE MIL NOVECENTOS E NOVENTA E NOVE",
+                "trinta e um de dezembro de dois mil",
+            ],
+        )
+
+    def test_find_text_dates_skips_nonexistent_dates(self):
+        self.assertEqual(
+            find_text_dates("trinta de fevereiro de dois mil e um"), []
+        )
+
+    def test_find_text_dates_number_words_after_the_year(self):
+        text = "Aos dez de maio de mil novecentos e oitenta três filhos"
+        self.assertEqual(
+            find_text_dates(text), [(date(1980, 5, 10), (4, 43))]
+        )
+        text = "Em vinte de maio de dois mil e dez vinte testemunhas"
+        self.assertEqual(
+            find_text_dates(text), [(date(2010, 5, 20), (3, 34))]
+        )
+
+    def test_find_text_dates_back_to_back(self):
+        text = "vinte e um de março de dois mil " * 4
+        self.assertEqual(
+            [found for found, _ in find_text_dates(text)],
+            [date(2000, 3, 21)] * 4,
+        )
+
+    def test_find_text_dates_year_without_connector(self):
+        self.assertEqual(
+            find_text_dates("um de janeiro de dois mil vinte"),
+            [(date(2000, 1, 1), (0, 25))],
+        )
+        self.assertIsNone(parse_text_date("um de janeiro de dois mil vinte"))
+        self.assertEqual(
+            parse_text_date("um de janeiro de dois mil e vinte"),
+            date(2020, 1, 1),
+        )
+
+    def test_find_text_dates_without_dates(self):
+        self.assertEqual(find_text_dates(""), [])
+        self.assertEqual(find_text_dates("de março de dois mil"), [])
+        self.assertEqual(find_text_dates(None), [])
@@ -1,7 +1,25 @@
-from datetime import datetime
-from unittest import TestCase
+from datetime import date, datetime
+from unittest import TestCase, skipIf
 
-from brutils.date_utils import is_holiday
+from brutils.date_utils import (
+    add_business_days,
+    business_days_between,
+    is_business_day,
+    is_business_day_many,
+    is_holiday,
+    is_holiday_many,
+    next_business_day,
+)
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+try:
+    import pandas
+except ImportError:  # pragma: no cover
+    pandas = None
 
 
 class TestIsHoliday(TestCase):
@@ -73,3 +91,269 @@ class TestIsHoliday(TestCase):
         self.assertFalse(
             is_holiday(datetime(2024, 7, 9))
         )  # Data estadual de SP, sem UF
+
+    def test_feriados_municipais(self):
+        # Aniversário de São Paulo
+        self.assertTrue(
+            is_holiday(datetime(2024, 1, 25), municipality_code="3550308")
+        )
+        self.assertTrue(
+            is_holiday(
+                datetime(2024, 1, 25), uf="SP", municipality_code="3550308"
+            )
+        )
+        # Corpus Christi em São Paulo, 60 dias após a Páscoa
+        self.assertTrue(
+            is_holiday(datetime(2024, 5, 30), municipality_code="3550308")
+        )
+        self.assertTrue(
+            is_holiday(datetime(2025, 6, 19), municipality_code="3550308")
+        )
+        self.assertFalse(is_holiday(datetime(2024, 5, 30)))
+        # São Sebastião, feriado apenas no Rio de Janeiro
+        self.assertTrue(
+            is_holiday(datetime(2024, 1, 20), municipality_code="3304557")
+        )
+        self.assertFalse(
+            is_holiday(datetime(2024, 1, 20), municipality_code="3550308")
+        )
+
+    def test_feriados_nacionais_e_estaduais_com_municipio(self):
+        # Natal e Revolução Constitucionalista (SP), em Campinas
+        self.assertTrue(
+            is_holiday(datetime(2024, 12, 25), municipality_code="3509502")
+        )
+        self.assertTrue(
+            is_holiday(datetime(2024, 7, 9), municipality_code="3509502")
+        )
+        self.assertFalse(
+            is_holiday(datetime(2024, 1, 25), municipality_code="3509502")
+        )
+
+    def test_capital_sem_feriados_municipais(self):
+        # Rio Branco (AC) não está na base de feriados municipais: apenas os
+        # feriados nacionais e estaduais são considerados
+        self.assertTrue(
+            is_holiday(datetime(2024, 12, 25), municipality_code="1200401")
+        )
+        self.assertTrue(
+            is_holiday(datetime(2024, 6, 15), municipality_code="1200401")
+        )
+        self.assertFalse(
+            is_holiday(datetime(2024, 12, 28), municipality_code="1200401")
+        )
+
+    def test_municipio_invalido(self):
+        self.assertIsNone(
+            is_holiday(datetime(2024, 1, 25), municipality_code="1234567")
+        )
+        self.assertIsNone(
+            is_holiday(datetime(2024, 1, 25), municipality_code=3550308)
+        )
+        # Município fora da UF informada
+        self.assertIsNone(
+            is_holiday(
+                datetime(2024, 1, 25), uf="RJ", municipality_code="3550308"
+            )
+        )
+
+
+class TestIsBusinessDay(TestCase):
+    def test_dias_uteis(self):
+        self.assertTrue(is_business_day(date(2024, 7, 9)))
+        self.assertTrue(is_business_day(datetime(2024, 12, 24, 10, 30)))
+
+    def test_fins_de_semana_e_feriados(self):
+        self.assertFalse(is_business_day(date(2024, 12, 28)))  # Sábado
+        self.assertFalse(is_business_day(date(2024, 12, 29)))  # Domingo
+        self.assertFalse(is_business_day(date(2024, 12, 25)))  # Natal
+        self.assertFalse(
+            is_business_day(date(2024, 7, 9), uf="SP")
+        )  # Revolução Constitucionalista (SP)
+
+    def test_argumentos_invalidos(self):
+        self.assertIsNone(is_business_day("2024-01-01"))
+        self.assertIsNone(is_business_day(None))
+        self.assertIsNone(is_business_day(date(2024, 1, 1), uf="XX"))
+
+
+class TestAddBusinessDays(TestCase):
+    def test_dias_positivos(self):
+        self.assertEqual(
+            add_business_days(date(2024, 12, 23), 1), date(2024, 12, 24)
+        )
+        self.assertEqual(
+            add_business_days(date(2024, 12, 23), 2), date(2024, 12, 26)
+        )
+        self.assertEqual(
+            add_business_days(date(2024, 12, 27), 3), date(2025, 1, 2)
+        )
+        self.assertEqual(
+            add_business_days(date(2024, 7, 8), 1, uf="SP"), date(2024, 7, 10)
+        )
+
+    def test_dias_negativos(self):
+        self.assertEqual(
+            add_business_days(date(2024, 12, 26), -2), date(2024, 12, 23)
+        )
+        self.assertEqual(
+            add_business_days(date(2025, 1, 1), -1), date(2024, 12, 31)
+        )
+        self.assertEqual(
+            add_business_days(date(2024, 12, 28), -1), date(2024, 12, 27)
+        )
+
+    def test_zero_dias(self):
+        self.assertEqual(
+            add_business_days(date(2024, 12, 24), 0), date(2024, 12, 24)
+        )
+        self.assertEqual(
+            add_business_days(date(2024, 12, 25), 0), date(2024, 12, 26)
+        )
+
+    def test_muitos_anos(self):
+        start = date(2000, 1, 3)
+        end = add_business_days(start, 2500)
+        self.assertEqual(business_days_between(start, end), 2500)
+        self.assertEqual(add_business_days(end, -2500), start)
+
+    def test_mantem_o_tipo_da_data(self):
+        self.assertEqual(
+            add_business_days(datetime(2024, 12, 24, 15, 30), 1),
+            datetime(2024, 12, 26, 15, 30),
+        )
+
+    def test_argumentos_invalidos(self):
+        self.assertIsNone(add_business_days("2024-01-01", 1))
+        self.assertIsNone(add_business_days(date(2024, 1, 1), 1.5))
+        self.assertIsNone(add_business_days(date(2024, 1, 1), True))
+        self.assertIsNone(add_business_days(date(2024, 1, 1), 1, uf="XX"))
+
+
+class TestNextBusinessDay(TestCase):
+    def test_next_business_day(self):
+        self.assertEqual(
+            next_business_day(date(2024, 12, 24)), date(2024, 12, 26)
+        )
+        self.assertEqual(
+            next_business_day(date(2024, 12, 27)), date(2024, 12, 30)
+        )
+        self.assertEqual(
+            next_business_day(date(2024, 7, 8), uf="SP"), date(2024, 7, 10)
+        )
+        self.assertIsNone(next_business_day(None))
+
+
+class TestBusinessDaysBetween(TestCase):
+    def test_business_days_between(self):
+        self.assertEqual(
+            business_days_between(date(2024, 12, 20), date(2024, 12, 31)), 6
+        )
+        self.assertEqual(
+            business_days_between(date(2024, 12, 31), date(2024, 12, 20)), -6
+        )
+        self.assertEqual(
+            business_days_between(date(2024, 12, 20), date(2024, 12, 20)), 0
+        )
+        self.assertEqual(
+            business_days_between(date(2024, 12, 31), date(2025, 1, 2)), 1
+        )
+        self.assertEqual(
+            business_days_between(date(2024, 7, 5), date(2024, 7, 12), uf="SP"),
+            4,
+        )
+
+    def test_argumentos_invalidos(self):
+        self.assertIsNone(business_days_between(date(2024, 1, 1), None))
+        self.assertIsNone(
+            business_days_between(date(2024, 1, 1), date(2024, 1, 2), uf="XX")
+        )
+
+
+class TestIsHolidayMany(TestCase):
+    dates = [
+        date(2024, 1, 1),  # Ano Novo
+        date(2024, 1, 2),
+        datetime(2024, 7, 9, 12, 0),  # Revolução Constitucionalista (SP)
+        date(2024, 12, 25),  # Natal
+        date(1999, 12, 28),  # Terça-feira
+        date(2031, 11, 15),  # Proclamação da República
+    ]
+
+    def test_is_holiday_many(self):
+        self.assertEqual(
+            list(is_holiday_many(self.dates)),
+            [True, False, False, True, False, True],
+        )
+        self.assertEqual(
+            list(is_holiday_many(self.dates, uf="SP")),
+            [True, False, True, True, False, True],
+        )
+
+    def test_is_business_day_many(self):
+        self.assertEqual(
+            list(is_business_day_many(self.dates)),
+            [False, True, True, False, True, False],
+        )
+        self.assertEqual(
+            list(is_business_day_many(self.dates, uf="SP")),
+            [False, True, False, False, True, False],
+        )
+
+    def test_same_result_as_single_date_functions(self):
+        start = date(2023, 1, 1).toordinal()
+        dates = [date.fromordinal(start + i) for i in range(800)]
+
+        for uf in (None, "RJ"):
+            self.assertEqual(
+                list(is_holiday_many(dates, uf=uf)),
+                [
+                    is_holiday(datetime(d.year, d.month, d.day), uf=uf)
+                    for d in dates
+                ],
+            )
+            self.assertEqual(
+                list(is_business_day_many(dates, uf=uf)),
+                [is_business_day(d, uf=uf) for d in dates],
+            )
+
+    def test_empty_input(self):
+        self.assertEqual(list(is_holiday_many([])), [])
+        self.assertEqual(list(is_business_day_many(iter([]))), [])
+
+    def test_invalid_arguments(self):
+        self.assertIsNone(is_holiday_many(["2024-01-01"]))
+        self.assertIsNone(is_holiday_many([date(2024, 1, 1), None]))
+        self.assertIsNone(is_holiday_many([date(2024, 1, 1)], uf="XX"))
+        self.assertIsNone(is_business_day_many([date(2024, 1, 1)], uf="XX"))
+
+    @skipIf(numpy is None, "numpy is not installed")
+    def test_datetime64_arrays(self):
+        dates = numpy.array(
+            ["2024-07-09", "NaT", "2024-07-10"], dtype="datetime64[D]"
+        )
+        result = is_holiday_many(dates, uf="SP")
+
+        self.assertIsInstance(result, numpy.ndarray)
+        self.assertEqual(result.dtype, bool)
+        self.assertEqual(list(result), [True, False, False])
+        self.assertEqual(
+            list(is_business_day_many(dates, uf="SP")), [False, False, True]
+        )
+        self.assertEqual(
+            list(
+                is_holiday_many(
+                    numpy.array(["2024-12-25T10:30"], dtype="datetime64[s]")
+                )
+            ),
+            [True],
+        )
+
+    @skipIf(pandas is None, "pandas is not installed")
+    def test_pandas_dates(self):
+        dates = pandas.to_datetime(["2024-11-20", "2024-11-21"])
+
+        self.assertEqual(list(is_holiday_many(dates)), [True, False])
+        self.assertEqual(
+            list(is_business_day_many(pandas.Series(dates))), [False, True]
+        )
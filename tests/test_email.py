@@ -1,6 +1,11 @@
 from unittest import TestCase, main
 
-from brutils import is_valid_email
+from brutils import (
+    is_valid_email,
+    is_valid_many_email,
+    suggest_domain_email,
+    suggest_domain_many_email,
+)
 
 
 class TestEmailValidation(TestCase):
@@ -49,6 +54,106 @@ class TestEmailValidation(TestCase):
         # Empty string should return False
         self.assertFalse(is_valid_email(""))
 
+    def test_trailing_newline(self):
+        # A single trailing newline is accepted
+        self.assertTrue(is_valid_email("user@gmail.com\n"))
+        self.assertFalse(is_valid_email("user@gmail.com\n\n"))
+        self.assertFalse(is_valid_email("user@gmail\n.com"))
+
+    def test_domain_edge_cases(self):
+        self.assertTrue(is_valid_email("user@..com"))
+        self.assertTrue(is_valid_email("user@-.com"))
+        self.assertFalse(is_valid_email("user@.com"))
+        self.assertFalse(is_valid_email("user@gmail.c"))
+        self.assertFalse(is_valid_email("user@gmail.c0m"))
+        self.assertFalse(is_valid_email("user@gmail.cóm"))
+        self.assertFalse(is_valid_email("user@@gmail.com"))
+        self.assertFalse(is_valid_email("us@er@gmail.com"))
+
+    def test_long_inputs(self):
+        self.assertTrue(is_valid_email("a@" + "-." * 100_000 + "com"))
+        self.assertFalse(is_valid_email("a@" + "." * 100_000 + "a"))
+        self.assertFalse(is_valid_email("a" + "." * 100_000 + "!@a.com"))
+        self.assertFalse(is_valid_email("a" + "@a" * 100_000))
+
+
+class TestEmailValidationMany(TestCase):
+    def test_is_valid_many(self):
+        emails = [
+            "joao.ninguem@gmail.com",
+            ".joao.ninguem@gmail.com",
+            "user@gmail.com\n",
+            None,
+            "user@incomplete.",
+            "joao.ninguem@gmail.com",
+        ]
+        self.assertEqual(
+            is_valid_many_email(emails),
+            [is_valid_email(email) for email in emails],
+        )
+        self.assertEqual(
+            is_valid_many_email(iter(emails)),
+            [True, False, True, False, False, True],
+        )
+
+    def test_empty(self):
+        self.assertEqual(is_valid_many_email([]), [])
+
+
+class TestSuggestDomain(TestCase):
+    def test_typos(self):
+        cases = {
+            "joao@gmial.com": "gmail.com",  # Transposição
+            "joao@gmai.com": "gmail.com",  # Remoção
+            "joao@hotmal.com": "hotmail.com",
+            "joao@gmaill.com": "gmail.com",  # Inserção
+            "joao@yahoo.com.bt": "yahoo.com.br",  # Substituição
+            "joao@hotmial.con": "hotmail.com",  # Duas edições
+            "joao@outlok.com.br": "outlook.com.br",
+            "joao@HOTMAL.COM": "hotmail.com",
+            "gmial.com": "gmail.com",
+        }
+        for email, domain in cases.items():
+            with self.subTest(email=email):
+                self.assertEqual(suggest_domain_email(email), domain)
+
+    def test_no_suggestion(self):
+        for email in [
+            "joao@gmail.com",
+            "joao@GMAIL.COM",
+            "joao@empresa.com.br",
+            "joao@",
+            "",
+            None,
+            123,
+        ]:
+            with self.subTest(email=email):
+                self.assertIsNone(suggest_domain_email(email))
+
+    def test_ties_prefer_most_common_domain(self):
+        # "gail.com" e "hmail.com" estão a uma edição de "gmail.com" e de
+        # "mail.com", e "gmail.com" é o mais comum
+        self.assertEqual(suggest_domain_email("a@gail.com"), "gmail.com")
+        self.assertEqual(suggest_domain_email("a@hmail.com"), "gmail.com")
+        # Edições mais próximas vencem domínios mais comuns
+        self.assertEqual(suggest_domain_email("a@ymail.co"), "ymail.com")
+
+    def test_missing_br_suffix(self):
+        # Domínios brasileiros sem o ".br" não são trocados por outro
+        # provedor próximo, como "aol.com" ou "me.com"
+        self.assertEqual(suggest_domain_email("a@uol.com"), "uol.com.br")
+        self.assertEqual(suggest_domain_email("a@bol.com"), "bol.com.br")
+        self.assertEqual(suggest_domain_email("a@ig.com"), "ig.com.br")
+        self.assertIsNone(suggest_domain_email("a@hotmail.com"))
+
+    def test_suggest_domain_many(self):
+        emails = ["a@hotmal.com", "b@gmail.com", None, "c@hotmal.com"]
+        self.assertEqual(
+            suggest_domain_many_email(emails),
+            ["hotmail.com", None, None, "hotmail.com"],
+        )
+        self.assertEqual(suggest_domain_many_email(iter([])), [])
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,213 @@
+import random
+from unittest import TestCase, main
+
+import numpy
+
+from brutils import cnpj, cpf, encoded, pis
+
+
+def corpus(module, length, size=500):
+    """
+    Builds valid, invalid and malformed identifiers of a kind.
+    """
+
+    rng = random.Random(0)
+    values = [module.generate() for _ in range(size)]
+    values += [
+        value[:-1] + str((int(value[-1]) + 1) % 10) for value in values[:100]
+    ]
+    values += [
+        "0" * length,
+        "1" * length,
+        "123",
+        "",
+        "a" * length,
+        "１" * length,
+        module.generate()[:-1] + "x",
+        None,
+        int(module.generate()),
+    ]
+    values += [
+        "".join(rng.choice("0123456789") for _ in range(length))
+        for _ in range(200)
+    ]
+    return values
+
+
+class TestEncoding(TestCase):
+    KINDS = ((cpf, 11), (cnpj, 14), (pis, 11))
+
+    def test_to_int_and_from_int(self):
+        for module, length in self.KINDS:
+            for value in corpus(module, length):
+                with self.subTest(module=module.__name__, value=value):
+                    number = module.to_int(value)
+                    if module.is_valid(value):
+                        self.assertEqual(number, int(value))
+                        self.assertEqual(module.from_int(number), value)
+                    else:
+                        self.assertIsNone(number)
+
+    def test_from_int_invalid(self):
+        for module, length in self.KINDS:
+            with self.subTest(module=module.__name__):
+                self.assertIsNone(module.from_int(-1))
+                self.assertIsNone(module.from_int(10**length))
+                self.assertIsNone(module.from_int(encoded.INVALID))
+                self.assertIsNone(module.from_int("1"))
+                self.assertIsNone(module.from_int(True))
+
+    def test_leading_zeros(self):
+        self.assertEqual(cpf.from_int(1234567890), "01234567890")
+        self.assertEqual(cnpj.from_int(3560714000142), "03560714000142")
+        self.assertEqual(
+            cpf.decode_many(cpf.encode_many(["01234567890"])), ["01234567890"]
+        )
+
+    def test_encode_many_same_as_to_int(self):
+        for module, length in self.KINDS:
+            values = corpus(module, length)
+            with self.subTest(module=module.__name__):
+                result = module.encode_many(values)
+                self.assertEqual(result.dtype, numpy.uint64)
+                self.assertEqual(
+                    result.tolist(),
+                    [
+                        encoded.INVALID
+                        if module.to_int(value) is None
+                        else module.to_int(value)
+                        for value in values
+                    ],
+                )
+
+    def test_encode_many_generator_and_empty(self):
+        values = [cpf.generate() for _ in range(10)]
+        self.assertEqual(
+            cpf.encode_many(iter(values)).tolist(),
+            [int(value) for value in values],
+        )
+        self.assertEqual(cpf.encode_many([]).dtype, numpy.uint64)
+        self.assertEqual(len(cpf.encode_many([])), 0)
+
+    def test_encode_many_fixed_width_arrays(self):
+        for module, length in self.KINDS:
+            values = [
+                value
+                for value in corpus(module, length)
+                if isinstance(value, str) and value.isascii()
+            ]
+            expected = module.encode_many(values).tolist()
+            with self.subTest(module=module.__name__):
+                self.assertEqual(
+                    module.encode_many(
+                        numpy.array(values, dtype=f"U{length}")
+                    ).tolist(),
+                    expected,
+                )
+                self.assertEqual(
+                    module.encode_many(
+                        numpy.array(values, dtype=f"S{length}")
+                    ).tolist(),
+                    expected,
+                )
+
+    def test_encode_many_non_ascii_digits(self):
+        arabic_indic = str.maketrans("0123456789", "٠١٢٣٤٥٦٧٨٩")
+        for module, length in self.KINDS:
+            value = module.generate()
+            values = [value.translate(arabic_indic), "１" * length, value]
+            with self.subTest(module=module.__name__):
+                self.assertEqual(
+                    module.encode_many(
+                        numpy.array(values, dtype=f"U{length}")
+                    ).tolist(),
+                    module.encode_many(values).tolist(),
+                )
+                self.assertEqual(
+                    module.encode_many(values).tolist(),
+                    [
+                        encoded.INVALID
+                        if module.to_int(value) is None
+                        else module.to_int(value)
+                        for value in values
+                    ],
+                )
+
+    def test_decode_many(self):
+        for module, length in self.KINDS:
+            values = [module.generate() for _ in range(100)]
+            numbers = [int(value) for value in values]
+            numbers += [0, 1, 10**length, encoded.INVALID]
+            with self.subTest(module=module.__name__):
+                self.assertEqual(
+                    module.decode_many(
+                        numpy.array(numbers, dtype=numpy.uint64)
+                    ),
+                    [module.from_int(number) for number in numbers],
+                )
+                self.assertEqual(
+                    module.decode_many([-1, int(values[0])]),
+                    [None, values[0]],
+                )
+
+    def test_decode_many_empty(self):
+        self.assertEqual(cpf.decode_many(numpy.array([], numpy.uint64)), [])
+
+
+class TestArrays(TestCase):
+    def setUp(self):
+        self.cpfs = [cpf.generate() for _ in range(200)]
+
+    def test_unique(self):
+        values = cpf.encode_many(self.cpfs + self.cpfs[:50] + ["123"])
+        result = encoded.unique(values)
+
+        self.assertEqual(
+            result.tolist(), sorted({int(value) for value in self.cpfs})
+        )
+        self.assertEqual(len(values), 251)
+
+    def test_unique_in_place(self):
+        values = cpf.encode_many(self.cpfs[::-1] + ["123"])
+        encoded.unique(values, in_place=True)
+        self.assertEqual(values.tolist()[:-1], sorted(values.tolist()[:-1]))
+        self.assertEqual(values[-1], encoded.INVALID)
+
+    def test_unique_empty(self):
+        self.assertEqual(
+            len(encoded.unique(cpf.encode_many(["00000000000"]))), 0
+        )
+
+    def test_intersect(self):
+        first = cpf.encode_many(self.cpfs[:120] + ["123"])
+        second = cpf.encode_many(self.cpfs[80:] + self.cpfs[100:110] + ["1"])
+
+        self.assertEqual(
+            encoded.intersect(first, second).tolist(),
+            sorted({int(value) for value in self.cpfs[80:120]}),
+        )
+        self.assertEqual(
+            encoded.intersect(second, first).tolist(),
+            encoded.intersect(first, second).tolist(),
+        )
+        self.assertEqual(len(encoded.intersect(first, first[:0])), 0)
+
+    def test_group_by_root(self):
+        values = [
+            "03560714000142",
+            "11222333000181",
+            "03560714000223",
+            "03560714000142",
+            "123",
+        ]
+        roots, starts, cnpjs = cnpj.group_by_root(cnpj.encode_many(values))
+
+        self.assertEqual(roots.tolist(), [3560714, 11222333])
+        self.assertEqual(starts.tolist(), [0, 2])
+        self.assertEqual(
+            cnpjs.tolist(), [3560714000142, 3560714000223, 11222333000181]
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
+import builtins
 import importlib
 import inspect
 import pkgutil
+import subprocess
+import sys
 import unittest
 
 
@@ -33,7 +36,7 @@ def is_private_function(name):
 
 def is_standard_function(name):
     """Check if a function name is a standard or built-in function."""
-    return name in dir(__builtins__) or (
+    return name in dir(builtins) or (
         name.startswith("__") and name.endswith("__")
     )
 
@@ -117,5 +120,53 @@ class TestImports(unittest.TestCase):
             )
 
 
+class TestLazyImports(unittest.TestCase):
+    def test_names_in_all_are_importable(self):
+        """Test that every name in __all__ can be imported."""
+        import brutils
+
+        for name in brutils.__all__:
+            with self.subTest(name=name):
+                self.assertTrue(callable(getattr(brutils, name)))
+
+    def test_unknown_name(self):
+        import brutils
+
+        with self.assertRaises(AttributeError):
+            brutils.not_a_brutils_function
+
+    def test_submodule_attributes(self):
+        """Test that submodules resolve after a plain `import brutils`."""
+        code = (
+            "import brutils; "
+            "print(brutils.cpf.is_valid('82178537464'), "
+            "brutils.date_utils.__name__, brutils.types.CPF.__name__)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+
+        self.assertEqual(output.strip(), "True brutils.date_utils CPF")
+
+    def test_submodules_are_imported_on_first_use(self):
+        """Test that importing brutils does not import heavy dependencies."""
+        code = (
+            "import sys, brutils; brutils.is_valid_cpf; "
+            "print(sorted(set(sys.modules) & {'holidays', 'num2words', "
+            "'urllib.request', 'brutils.date_utils', 'brutils.cep'}))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+
+        self.assertEqual(output.strip(), "[]")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,209 @@
+from unittest import TestCase, main
+from unittest.mock import MagicMock, patch
+from urllib.error import HTTPError
+
+from brutils.cep import get_address_from_cep, get_cep_information_from_address
+from brutils.ibge.municipality import (
+    get_code_by_municipality_name,
+    get_municipality_by_code,
+)
+from brutils.instrumentation import (
+    Event,
+    Metrics,
+    add_event_listener,
+    get_cache_info,
+    remove_event_listener,
+)
+
+
+class TestEventListeners(TestCase):
+    def setUp(self):
+        self.events = []
+        add_event_listener(self.events.append)
+
+    def tearDown(self):
+        remove_event_listener(self.events.append)
+
+    def test_remove_event_listener(self):
+        self.assertTrue(remove_event_listener(self.events.append))
+        self.assertFalse(remove_event_listener(self.events.append))
+
+        get_address_from_cep("abc")
+        self.assertEqual(self.events, [])
+
+    def test_listeners_called_in_order(self):
+        calls = []
+        first = lambda event: calls.append("first")  # noqa: E731
+        second = lambda event: calls.append("second")  # noqa: E731
+        add_event_listener(first)
+        add_event_listener(second)
+        try:
+            get_address_from_cep("abc")
+        finally:
+            remove_event_listener(first)
+            remove_event_listener(second)
+
+        self.assertEqual(calls, ["first", "second"])
+
+    @patch("brutils.cep.urlopen")
+    def test_get_address_from_cep_events(self, mock_urlopen):
+        response = mock_urlopen.return_value.__enter__.return_value
+        response.read.side_effect = [
+            b'{"cep": "01310-200"}',
+            b'{"erro": "true"}',
+            b"not json",
+        ]
+
+        get_address_from_cep("01310-200")
+        get_address_from_cep("00000000")
+        get_address_from_cep("01310200")
+        get_address_from_cep("0131020")
+
+        self.assertEqual(
+            [event.outcome for event in self.events],
+            ["ok", "not_found", "error", "invalid"],
+        )
+        self.assertEqual(
+            {event.function for event in self.events},
+            {"get_address_from_cep"},
+        )
+        self.assertEqual(self.events[0].data, {"cep": "01310-200"})
+        self.assertIn("error", self.events[2].data)
+        for event in self.events:
+            self.assertGreaterEqual(event.duration, 0)
+
+    @patch("brutils.cep.urlopen")
+    def test_get_cep_information_from_address_events(self, mock_urlopen):
+        response = mock_urlopen.return_value.__enter__.return_value
+        response.read.side_effect = [b'[{"cep": "01310-200"}]', b"[]"]
+
+        get_cep_information_from_address("SP", "São Paulo", "Paulista")
+        get_cep_information_from_address("SP", "São Paulo", "Inexistente")
+        get_cep_information_from_address("XX", "São Paulo", "Paulista")
+
+        self.assertEqual(
+            [event.outcome for event in self.events],
+            ["ok", "not_found", "invalid"],
+        )
+        self.assertEqual(
+            self.events[0].data,
+            {"federal_unit": "SP", "city": "São Paulo", "street": "Paulista"},
+        )
+
+    @patch("brutils.cep.urlopen")
+    def test_raised_exceptions_are_reported(self, mock_urlopen):
+        mock_urlopen.side_effect = OSError("Connection refused")
+
+        with self.assertRaises(Exception):
+            get_address_from_cep("01310200", True)
+
+        self.assertEqual(self.events[0].outcome, "error")
+        self.assertEqual(self.events[0].data["error"], "Connection refused")
+
+    @patch("brutils.ibge.municipality.urlopen")
+    def test_get_municipality_by_code_events(self, mock_urlopen):
+        response = MagicMock()
+        response.read.return_value = (
+            b'{"nome": "S\\u00e3o Paulo", '
+            b'"microrregiao": {"mesorregiao": {"UF": {"sigla": "SP"}}}}'
+        )
+        response.info.return_value = {}
+        mock_urlopen.return_value.__enter__.return_value = response
+
+        get_municipality_by_code("3550308")
+        mock_urlopen.side_effect = HTTPError(
+            "http://fakeurl.com", 404, "Not Found", None, None
+        )
+        get_municipality_by_code("1234567")
+        mock_urlopen.side_effect = HTTPError(
+            "http://fakeurl.com", 500, "Server Error", None, None
+        )
+        get_municipality_by_code("3550308")
+
+        self.assertEqual(
+            [event.outcome for event in self.events],
+            ["ok", "not_found", "error"],
+        )
+        self.assertEqual(self.events[1].data, {"code": "1234567"})
+        self.assertEqual(
+            self.events[2].data["error"],
+            "Erro HTTP ao buscar o código 3550308: HTTP Error 500: "
+            "Server Error",
+        )
+
+    @patch("brutils.ibge.municipality.urlopen")
+    def test_get_municipality_by_code_does_not_print(self, mock_urlopen):
+        mock_urlopen.side_effect = Exception("Erro desconhecido")
+
+        with patch("builtins.print") as mock_print:
+            self.assertIsNone(get_municipality_by_code("3550308"))
+
+        mock_print.assert_not_called()
+
+
+class TestMetrics(TestCase):
+    def test_snapshot(self):
+        metrics = Metrics(buckets=(0.1, 0.01, 1))
+        for outcome, duration in (
+            ("ok", 0.005),
+            ("ok", 0.01),
+            ("not_found", 0.5),
+            ("error", 2.0),
+        ):
+            metrics(Event("get_address_from_cep", outcome, duration, {}))
+        metrics(Event("get_municipality_by_code", "ok", 0.05, {}))
+
+        snapshot = metrics.snapshot()
+
+        self.assertEqual(
+            snapshot["get_address_from_cep"],
+            {
+                "calls": 4,
+                "errors": 1,
+                "outcomes": {"ok": 2, "not_found": 1, "error": 1},
+                "latency": {
+                    "buckets": {0.01: 2, 0.1: 2, 1: 3, float("inf"): 4},
+                    "sum": 2.515,
+                    "count": 4,
+                },
+            },
+        )
+        self.assertEqual(snapshot["get_municipality_by_code"]["calls"], 1)
+        self.assertEqual(snapshot["get_municipality_by_code"]["errors"], 0)
+
+    def test_reset(self):
+        metrics = Metrics()
+        metrics(Event("get_address_from_cep", "ok", 0.1, {}))
+        metrics.reset()
+
+        self.assertEqual(metrics.snapshot(), {})
+
+    def test_as_listener(self):
+        metrics = Metrics()
+        add_event_listener(metrics)
+        try:
+            get_address_from_cep("abc")
+            get_address_from_cep("abc")
+        finally:
+            remove_event_listener(metrics)
+
+        self.assertEqual(
+            metrics.snapshot()["get_address_from_cep"]["outcomes"],
+            {"invalid": 2},
+        )
+
+
+class TestGetCacheInfo(TestCase):
+    def test_get_cache_info(self):
+        get_code_by_municipality_name("São Paulo", "SP")
+        info = get_cache_info()
+
+        cache = info["brutils.ibge.municipality._load_cities_code"]
+        self.assertGreaterEqual(cache.misses, 1)
+        self.assertEqual(cache.currsize, 1)
+        for name in info:
+            self.assertTrue(name.startswith("brutils."))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,17 @@ from unittest import TestCase, main
 
 from brutils.legal_process import (
     _checksum,
+    describe,
+    describe_many,
     format_legal_process,
     generate,
+    generate_many,
     is_valid,
+    parse,
+    parse_stream,
     remove_symbols,
 )
+from brutils.types import LegalProcess
 
 
 class TestLegalProcess(TestCase):
@@ -54,6 +60,70 @@ class TestLegalProcess(TestCase):
         self.assertIsNone(generate(year=1000, orgao=4))
         self.assertIsNone(generate(orgao=0))
 
+    def test_generate_defaults_are_evaluated_per_call(self):
+        self.assertEqual(
+            {generate()[13:14] for _ in range(200)},
+            {str(orgao) for orgao in range(1, 10)},
+        )
+
+    def test_generate_many(self):
+        generated = generate_many(500)
+        self.assertEqual(len(generated), 500)
+        for legal_process_id in generated:
+            self.assertIs(is_valid(legal_process_id), True)
+            self.assertEqual(legal_process_id[9:13], str(datetime.now().year))
+
+        self.assertEqual(generate_many(0), [])
+        self.assertEqual(
+            {
+                legal_process_id[9:14]
+                for legal_process_id in generate_many(50, year=3000, orgao=4)
+            },
+            {"30004"},
+        )
+
+    def test_generate_many_seed(self):
+        self.assertEqual(
+            generate_many(100, seed=42), generate_many(100, seed=42)
+        )
+        self.assertNotEqual(
+            generate_many(100, seed=42), generate_many(100, seed=43)
+        )
+
+    def test_generate_many_weights(self):
+        generated = generate_many(1000, weights={5: 3, 8: 1}, seed=1)
+        segments = [legal_process_id[13] for legal_process_id in generated]
+        self.assertEqual(set(segments), {"5", "8"})
+        self.assertGreater(segments.count("5"), segments.count("8"))
+
+        generated = generate_many(10, weights={9: 1})
+        self.assertEqual(
+            {legal_process_id[13] for legal_process_id in generated}, {"9"}
+        )
+
+    def test_generate_many_invalid_arguments(self):
+        self.assertIsNone(generate_many(-1))
+        self.assertIsNone(generate_many("10"))
+        self.assertIsNone(generate_many(10, year=1000))
+        self.assertIsNone(generate_many(10, orgao=0))
+        self.assertIsNone(generate_many(10, weights={10: 1}))
+        self.assertIsNone(generate_many(10, weights={}))
+        self.assertIsNone(generate_many(True))
+        self.assertIsNone(generate_many(10, weights={1: 0}))
+        self.assertIsNone(generate_many(10, weights={1: 0, 2: 0.0}))
+        self.assertIsNone(generate_many(10, weights={1: "a"}))
+        self.assertIsNone(generate_many(10, weights={1: None}))
+        self.assertIsNone(generate_many(10, weights={1: True}))
+        self.assertIsNone(generate_many(10, weights={1: -1, 2: 2}))
+        self.assertIsNone(generate_many(10, weights={1: float("nan")}))
+        self.assertIsNone(generate_many(10, weights={1: float("inf")}))
+
+    def test_generate_many_zero_weight(self):
+        generated = generate_many(100, weights={1: 0, 5: 1}, seed=1)
+        self.assertEqual(
+            {legal_process_id[13] for legal_process_id in generated}, {"5"}
+        )
+
     def test_check_sum(self):
         self.assertEqual(_checksum(546611720238150014), "77")
         self.assertEqual(_checksum(403818720238230498), "50")
@@ -66,6 +136,122 @@ class TestLegalProcess(TestCase):
         self.assertIs(is_valid("455323469202340251"), False)
         self.assertIs(is_valid("455323469202340257123123123"), False)
         self.assertIs(is_valid("455323423QQWEQWSsasd&*(()"), False)
+        self.assertIs(is_valid("1018874/220234018200"), False)
+        self.assertIs(is_valid(" 1018874-82.2023.4.01.8200"), False)
+
+    def test_parse(self):
+        self.assertEqual(
+            parse("1018874-82.2023.4.01.8200"),
+            LegalProcess(1018874, 82, 2023, 4, 1, 8200, True),
+        )
+        self.assertEqual(
+            parse("45532346920234025107"),
+            LegalProcess(4553234, 69, 2023, 4, 2, 5107, True),
+        )
+        self.assertEqual(
+            parse("10188748220239918200"),
+            LegalProcess(1018874, 82, 2023, 9, 91, 8200, False),
+        )
+        self.assertIs(parse("10188748320234018200").valid, False)
+        self.assertIs(parse("00000000000000000000").valid, False)
+        self.assertIsNone(parse("455323469202340251"))
+        self.assertIsNone(parse("455323423QQWEQWSsasd&*(()"))
+        self.assertIsNone(parse(None))
+
+    def test_parse_matches_is_valid(self):
+        for orgao in range(1, 10):
+            legal_process_id = generate(orgao=orgao)
+            self.assertIs(parse(legal_process_id).valid, True)
+            self.assertIs(
+                parse(legal_process_id).valid, is_valid(legal_process_id)
+            )
+
+    def test_non_ascii_digits(self):
+        legal_process_id = "10188748220234018200".translate(
+            str.maketrans("0123456789", "٠١٢٣٤٥٦٧٨٩")
+        )
+        self.assertIs(is_valid(legal_process_id), False)
+        self.assertIsNone(parse(legal_process_id))
+        self.assertIsNone(describe(legal_process_id))
+
+    def test_parse_stream(self):
+        records = parse_stream(
+            [
+                "10188748220234018200",
+                "123",
+                "4553234-69.2023.4.02.5107",
+                "10188748220239918200",
+            ],
+            chunk_size=3,
+        )
+        self.assertEqual(
+            [record and (record.segment, record.valid) for record in records],
+            [(4, True), None, (4, True), (9, False)],
+        )
+        self.assertEqual(list(parse_stream([])), [])
+
+        records = parse_stream(iter(["10188748220234018200"] * 5))
+        self.assertEqual(
+            [record.tribunal for record in records], [1, 1, 1, 1, 1]
+        )
+
+    def test_describe(self):
+        self.assertEqual(
+            describe("1018874-82.2023.4.01.8200"),
+            {
+                "segment": "Justiça Federal",
+                "tribunal": "TRF1",
+                "origin": "8200",
+            },
+        )
+        self.assertEqual(
+            describe("00000000020238260100"),
+            {
+                "segment": (
+                    "Justiça dos Estados e do Distrito Federal e Territórios"
+                ),
+                "tribunal": "TJSP",
+                "origin": "0100",
+            },
+        )
+        self.assertEqual(
+            describe("0000000-00.2023.8.07.0001")["tribunal"], "TJDFT"
+        )
+        self.assertEqual(describe("00000000020236030000")["tribunal"], "TRE-AP")
+        self.assertEqual(
+            describe("00000000020237120000")["tribunal"], "12ª CJM"
+        )
+        self.assertEqual(describe("00000000020239130000")["tribunal"], "TJMMG")
+        self.assertIsNone(describe("00000000000000000000"))
+        self.assertIsNone(describe("00000000020239010000"))
+        self.assertIsNone(describe("00000000020235990000"))
+        self.assertIsNone(describe("455323469202340251"))
+        self.assertIsNone(describe("455323423QQWEQWSsasd&*(()"))
+        self.assertIsNone(describe(None))
+
+    def test_describe_many(self):
+        legal_process_ids = [
+            "10188748220234018200",
+            "123",
+            "4553234-69.2023.4.02.5107",
+            "00000000020239010000",
+            "10188748220234018201",
+        ]
+        self.assertEqual(
+            describe_many(legal_process_ids),
+            [
+                describe(legal_process_id)
+                for legal_process_id in legal_process_ids
+            ],
+        )
+        self.assertEqual(
+            [
+                description and description["tribunal"]
+                for description in describe_many(legal_process_ids)
+            ],
+            ["TRF1", None, "TRF2", None, "TRF1"],
+        )
+        self.assertEqual(describe_many([]), [])
 
 
 if __name__ == "__main__":
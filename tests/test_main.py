@@ -0,0 +1,135 @@
+import os
+import tempfile
+from contextlib import redirect_stderr
+from io import StringIO
+from unittest import TestCase, main
+
+from brutils.__main__ import _main
+
+
+class TestMain(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.input = os.path.join(directory.name, "input")
+        self.output = os.path.join(directory.name, "output")
+
+    def run_main(self, content, *args):
+        with open(self.input, "w", encoding="utf-8") as file:
+            file.write(content)
+
+        stderr = StringIO()
+        with redirect_stderr(stderr):
+            status = _main(list(args) + [self.input, "-o", self.output])
+
+        with open(self.output, encoding="utf-8") as file:
+            return status, file.read(), stderr.getvalue()
+
+    def test_validate(self):
+        status, output, report = self.run_main(
+            "82178537464\n00000000000\n123\n", "validate", "cpf", "-w", "1"
+        )
+        self.assertEqual(status, 0)
+        self.assertEqual(output, "82178537464\n")
+        self.assertIn("3 values", report)
+        self.assertIn("2 invalid", report)
+
+    def test_validate_invalid(self):
+        _, output, _ = self.run_main(
+            "82178537464\n00000000000\r\n",
+            "validate",
+            "cpf",
+            "--invalid",
+            "-w",
+            "2",
+            "--chunk-size",
+            "1",
+        )
+        self.assertEqual(output, "00000000000\n")
+
+    def test_format(self):
+        _, output, report = self.run_main(
+            "03560714000142\n123\n", "format", "cnpj", "-w", "1"
+        )
+        self.assertEqual(output, "03.560.714/0001-42\n\n")
+        self.assertIn("1 invalid", report)
+
+    def test_clean(self):
+        _, output, report = self.run_main(
+            "821.785.374-64\n01310-200\n", "clean", "cpf", "-w", "1"
+        )
+        self.assertEqual(output, "82178537464\n01310200\n")
+        self.assertIn("0 invalid", report)
+
+    def test_detect(self):
+        _, output, _ = self.run_main(
+            "821.785.374-64\n03560714000142\n01310-200\nABC-1234\n"
+            "nome@gmail.com\nxyz\n",
+            "detect",
+            "-w",
+            "1",
+        )
+        self.assertEqual(
+            output,
+            "821.785.374-64\tcpf\n03560714000142\tcnpj\n01310-200\tcep\n"
+            "ABC-1234\tlicense_plate\nnome@gmail.com\temail\nxyz\t\n",
+        )
+
+    def test_enrich(self):
+        _, output, _ = self.run_main(
+            "10188748220234018200\n123\n", "enrich", "legal_process", "-w", "1"
+        )
+        self.assertEqual(
+            output,
+            "10188748220234018200\tJustiça Federal\tTRF1\t8200\n123\t\t\t\n",
+        )
+
+    def test_csv_column(self):
+        content = "name,cpf\nAna,82178537464\nBeto,123\nCaio\n"
+
+        _, output, _ = self.run_main(
+            content, "format", "cpf", "--column", "cpf", "-w", "2"
+        )
+        self.assertEqual(output, "name,cpf\nAna,821.785.374-64\nBeto,\nCaio\n")
+
+        _, output, _ = self.run_main(
+            content, "validate", "cpf", "--column", "cpf", "-w", "1"
+        )
+        self.assertEqual(output, "name,cpf\nAna,82178537464\n")
+
+        _, output, _ = self.run_main(
+            content.replace(",", ";"),
+            "detect",
+            "-c",
+            "cpf",
+            "-d",
+            ";",
+            "-w",
+            "1",
+        )
+        self.assertEqual(
+            output,
+            "name;cpf;cpf_kind\nAna;82178537464;cpf\nBeto;123;\nCaio;\n",
+        )
+
+    def test_csv_empty(self):
+        _, output, report = self.run_main(
+            "", "validate", "cpf", "-c", "cpf", "-w", "1"
+        )
+        self.assertEqual(output, "")
+        self.assertIn("0 values", report)
+
+    def test_invalid_arguments(self):
+        with redirect_stderr(StringIO()):
+            with self.assertRaises(SystemExit):
+                self.run_main("name\n", "validate", "cpf", "-c", "cpf")
+            with self.assertRaises(SystemExit):
+                self.run_main("", "validate", "rg")
+            with self.assertRaises(SystemExit):
+                self.run_main("", "clean", "email")
+            with self.assertRaises(SystemExit):
+                self.run_main("", "validate", "cpf", "-w", "0")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+from random import Random
+from unittest import TestCase
+
+from num2words import num2words
+
+from brutils.number_words import _from_words, _normalize, _to_words
+
+
+class TestToWords(TestCase):
+    def test_to_words(self):
+        self.assertEqual(_to_words(0), "zero")
+        self.assertEqual(_to_words(16), "dezesseis")
+        self.assertEqual(_to_words(100), "cem")
+        self.assertEqual(_to_words(101), "cento e um")
+        self.assertEqual(_to_words(1000), "mil")
+        self.assertEqual(_to_words(1100), "mil e cem")
+        self.assertEqual(_to_words(1523), "mil, quinhentos e vinte e três")
+        self.assertEqual(_to_words(2000000), "dois milhões")
+        self.assertEqual(
+            _to_words(1234567890),
+            "um bilhão, duzentos e trinta e quatro milhões, quinhentos e "
+            "sessenta e sete mil, oitocentos e noventa",
+        )
+
+    def test_to_words_without_comma(self):
+        self.assertEqual(
+            _to_words(1523, comma=False), "mil quinhentos e vinte e três"
+        )
+        self.assertEqual(
+            _to_words(1999, comma=False), "mil novecentos e noventa e nove"
+        )
+        self.assertEqual(
+            _to_words(2024, comma=False), "dois mil e vinte e quatro"
+        )
+        self.assertEqual(_to_words(17, comma=False), "dezessete")
+
+    def test_to_words_matches_num2words(self):
+        numbers = list(range(0, 20_000)) + [
+            Random(0).randrange(10**15) for _ in range(5_000)
+        ]
+
+        for number in numbers:
+            self.assertEqual(_to_words(number), num2words(number, lang="pt_BR"))
+
+    def test_to_words_beyond_quatrilhao_falls_back_to_num2words(self):
+        number = 10**15 + 1
+        self.assertEqual(_to_words(number), num2words(number, lang="pt_BR"))
+
+
+class TestFromWords(TestCase):
+    def test_from_words(self):
+        self.assertEqual(_from_words(["zero"]), 0)
+        self.assertEqual(_from_words(["cem", "mil"]), 100_000)
+        self.assertEqual(_from_words(["cento", "e", "um"]), 101)
+        self.assertEqual(_from_words(["um", "mil"]), 1000)
+        self.assertEqual(
+            _from_words(["dois", "milhoes", "e", "quinze"]), 2_000_015
+        )
+
+    def test_from_words_is_the_inverse_of_to_words(self):
+        numbers = list(range(0, 20_000)) + [
+            Random(0).randrange(10**15) for _ in range(5_000)
+        ]
+
+        for number in numbers:
+            for comma in (True, False):
+                words = _normalize(_to_words(number, comma=comma))
+                self.assertEqual(
+                    _from_words(words.replace(",", " ").split()), number
+                )
+
+    def test_from_words_invalid(self):
+        for words in (
+            [],
+            ["e"],
+            ["zero", "mil"],
+            ["vinte", "e", "cem"],
+            ["cem", "e", "um"],
+            ["vinte", "e", "dez"],
+            ["mil", "mil"],
+            ["mil", "milhoes"],
+            ["milhao"],
+            ["um", "real"],
+        ):
+            with self.subTest(words=words):
+                self.assertIsNone(_from_words(words))
@@ -0,0 +1,149 @@
+import copy
+import pickle
+import subprocess
+import sys
+from unittest import TestCase, main
+
+from brutils import cep, cnpj, cpf, license_plate, phone, pis
+from brutils.types import CEP, CNPJ, CPF, PIS, LicensePlate, Phone
+
+
+class TestValues(TestCase):
+    # Each class, and the generate, remove symbols and format functions of
+    # its kind
+    KINDS = (
+        (CPF, cpf.generate, cpf.remove_symbols, cpf.format_cpf),
+        (CNPJ, cnpj.generate, cnpj.remove_symbols, cnpj.format_cnpj),
+        (PIS, pis.generate, pis.remove_symbols, pis.format_pis),
+        (CEP, cep.generate, cep.remove_symbols, cep.format_cep),
+        (Phone, phone.generate, phone.remove_symbols_phone, phone.format_phone),
+        (
+            LicensePlate,
+            license_plate.generate,
+            license_plate.remove_symbols,
+            license_plate.format_license_plate,
+        ),
+    )
+
+    def test_same_as_functions(self):
+        for cls, generate, remove_symbols, format in self.KINDS:
+            for _ in range(200):
+                value = generate()
+                with self.subTest(cls=cls.__name__, value=value):
+                    parsed = cls(format(value))
+                    self.assertEqual(str(parsed), remove_symbols(value))
+                    self.assertEqual(parsed.formatted, format(value))
+                    self.assertEqual(parsed, cls(value))
+
+    def test_masked(self):
+        self.assertEqual(CPF("82178537464").masked, "***.785.374-**")
+        self.assertEqual(CNPJ("03560714000142").masked, "**.560.714/0001-**")
+        self.assertEqual(PIS("12038619494").masked, "***.38619.**-*")
+        self.assertEqual(CEP("01310200").masked, "01310-***")
+        self.assertEqual(Phone("11994029275").masked, "(11)*****-9275")
+        self.assertEqual(Phone("1635014415").masked, "(16)****-4415")
+        self.assertEqual(LicensePlate("ABC1234").masked, "ABC-****")
+        self.assertEqual(LicensePlate("ABC1D23").masked, "ABC****")
+
+    def test_forms_are_cached(self):
+        value = CPF("82178537464")
+        self.assertIs(value.formatted, value.formatted)
+        self.assertIs(value.masked, value.masked)
+
+    def test_integers(self):
+        self.assertEqual(int(CPF("821.785.374-64")), 82178537464)
+        self.assertEqual(CNPJ(3560714000142), CNPJ("03560714000142"))
+        self.assertEqual(str(CEP(1310200)), "01310200")
+        self.assertEqual(Phone(11994029275), Phone("(11)99402-9275"))
+        self.assertEqual(
+            str(LicensePlate(str(LicensePlate("abc1d23")))), "ABC1D23"
+        )
+
+    def test_phone_international_dialing_code(self):
+        self.assertEqual(str(Phone("+55 (11) 99402-9275")), "11994029275")
+
+    def test_invalid(self):
+        for cls, value in (
+            (CPF, "00000000000"),
+            (CPF, "123"),
+            (CPF, None),
+            (CPF, True),
+            (CPF, -82178537464),
+            (CNPJ, "03560714000141"),
+            (PIS, "12038619490"),
+            (CEP, "0131020"),
+            (CEP, "²²²²²²²²"),
+            (Phone, "333333"),
+            (LicensePlate, "ABCD123"),
+            (LicensePlate, 1234),
+        ):
+            with self.subTest(cls=cls.__name__, value=value):
+                self.assertIsNone(cls.parse(value))
+                with self.assertRaises(ValueError):
+                    cls(value)
+
+    def test_equality_and_hash(self):
+        value = CPF("82178537464")
+        self.assertEqual(value, CPF("821.785.374-64"))
+        self.assertEqual(hash(value), hash(CPF("821.785.374-64")))
+        self.assertEqual(len({value, CPF(82178537464)}), 1)
+        self.assertNotEqual(value, CPF("11144477735"))
+        self.assertNotEqual(value, "82178537464")
+        self.assertNotEqual(value, 82178537464)
+
+    def test_immutable(self):
+        value = CPF("82178537464")
+        with self.assertRaises(AttributeError):
+            value._int = 0
+        with self.assertRaises(AttributeError):
+            value.formatted = "000.000.000-00"
+        with self.assertRaises(AttributeError):
+            del value._int
+        with self.assertRaises(AttributeError):
+            value.other = 0
+
+    def test_copy_and_pickle(self):
+        for value in (CPF("82178537464"), LicensePlate("ABC1D23")):
+            with self.subTest(value=value):
+                self.assertEqual(pickle.loads(pickle.dumps(value)), value)
+                self.assertEqual(copy.deepcopy(value), value)
+
+    def test_repr(self):
+        self.assertEqual(repr(CEP("01310-200")), "CEP('01310200')")
+
+
+class TestLazyImports(TestCase):
+    def test_classes_are_imported_on_first_use(self):
+        code = (
+            "import sys; from brutils.types import CPF; "
+            "print(sorted(name for name in sys.modules "
+            "if name.startswith('brutils.')))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+
+        self.assertEqual(
+            output.strip(),
+            str(
+                [
+                    "brutils.cpf",
+                    "brutils.types",
+                    "brutils.types._value",
+                    "brutils.types.cpf",
+                ]
+            ),
+        )
+
+    def test_unknown_name(self):
+        import brutils.types
+
+        with self.assertRaises(AttributeError):
+            brutils.types.NotAType
+
+
+if __name__ == "__main__":
+    main()